@@ -0,0 +1,3 @@
+from .service_client import CircuitBreaker, CircuitOpenError, ServiceHttpClient
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "ServiceHttpClient"]
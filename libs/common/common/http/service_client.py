@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = frozenset({502, 503, 504})
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+class CircuitOpenError(Exception):
+    """Disparada quando o circuito do serviço de destino está aberto."""
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+        super().__init__(f"Circuito aberto para o serviço {service_name}")
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker simples: abre após `failure_threshold` falhas consecutivas
+    e, depois de `reset_timeout` segundos, libera uma única requisição de
+    teste (meio-aberto). O sucesso dela fecha o circuito e a falha o reabre;
+    as demais requisições falham rápido enquanto o teste está em andamento.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        if self._opened_at is None:
+            return False
+        return time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow_request(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self.is_open:
+            return False
+
+        # Meio-aberto: só uma requisição de teste por vez. Um teste que nunca
+        # registrou o resultado (ex.: cancelado) libera outro após o timeout.
+        now = time.monotonic()
+        if self._probe_started_at is not None and now - self._probe_started_at < self.reset_timeout:
+            return False
+        self._probe_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold or self._probe_started_at is not None:
+            self._opened_at = time.monotonic()
+        self._probe_started_at = None
+
+
+class ServiceHttpClient:
+    """
+    Cliente HTTP keep-alive compartilhado pelo processo para um serviço de destino.
+
+    Deve ser iniciado/fechado no lifespan da aplicação. Falhas de conexão e
+    respostas 502/503/504 são repetidas com backoff exponencial apenas em
+    métodos idempotentes; um POST/PATCH só é repetido com `retry=True` ou com
+    o cabeçalho `Idempotency-Key`. Falhas consecutivas abrem o circuito e as
+    chamadas falham rápido até o reset.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        timeout: float = 5.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_retries: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+            logger.info(f"Cliente HTTP do serviço {self.name} iniciado ({self.base_url})")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            await self.start()
+        return self._client
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    @staticmethod
+    def _is_retryable(method: str, headers: Any) -> bool:
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return headers is not None and IDEMPOTENCY_KEY_HEADER in httpx.Headers(headers)
+
+    async def request(
+        self, method: str, path: str, retry: Optional[bool] = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Executa a requisição pelo pool compartilhado.
+
+        Args:
+            retry: Força (True) ou impede (False) novas tentativas; por padrão
+                apenas métodos idempotentes ou com `Idempotency-Key` são repetidos.
+        """
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(self.name)
+
+        if retry is None:
+            retry = self._is_retryable(method, kwargs.get("headers"))
+        max_retries = self.max_retries if retry else 0
+
+        client = await self._get_client()
+        attempt = 0
+
+        while True:
+            try:
+                response = await client.request(method, path, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt >= max_retries:
+                    self.circuit_breaker.record_failure()
+                    raise
+                logger.warning(f"Falha de conexão com {self.name} ({e}), tentativa {attempt + 1}")
+            except httpx.HTTPError:
+                self.circuit_breaker.record_failure()
+                raise
+            else:
+                if response.status_code < 500:
+                    self.circuit_breaker.record_success()
+                    return response
+                # Todo 5xx conta como falha do destino, mesmo os que não são repetidos
+                if response.status_code not in RETRYABLE_STATUS or attempt >= max_retries:
+                    self.circuit_breaker.record_failure()
+                    return response
+                logger.warning(f"{self.name} respondeu {response.status_code}, tentativa {attempt + 1}")
+
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
@@ -3,6 +3,7 @@ from jose import jwt, JWTError
 import logging
 
 from ..exceptions import InvalidCredentialsError, TokenExpiredError
+from .token_cache import verified_token_cache
 
 logger = logging.getLogger(__name__)
 
@@ -10,12 +11,20 @@ class JwtHandler:
     @staticmethod
     def decode_token(
         token: str,
-        public_key: str,
+        public_key: Any,
         audience: str,
         issuer: str,
         algorithms: List[str] = ["RS256"],
-        verify_aud: bool = True
+        verify_aud: bool = True,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
+        cache_key = None
+        if use_cache:
+            cache_key = verified_token_cache.make_key(token, audience, issuer, verify_aud)
+            cached = verified_token_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             options = {
                 "verify_signature": True,
@@ -38,6 +47,9 @@ class JwtHandler:
             if missing:
                 raise InvalidCredentialsError(f"Claims faltando: {missing}")
 
+            if cache_key is not None:
+                verified_token_cache.set(cache_key, payload)
+
             return payload
 
         except JWTError as e:
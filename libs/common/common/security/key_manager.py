@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Optional
+
+import httpx
+from jose import jwk, jwt, JWTError
+from jose.backends.base import Key
+
+from ..exceptions import InvalidCredentialsError
+
+logger = logging.getLogger(__name__)
+
+
+class JwksKeyManager:
+    """
+    Mantém as chaves públicas do realm (JWKS) indexadas por `kid`, já
+    convertidas em objetos de chave para não reprocessar PEM a cada decode.
+
+    As chaves são renovadas periodicamente por uma task asyncio em background.
+    Um `kid` desconhecido dispara uma única rebusca compartilhada entre as
+    requisições concorrentes (single-flight).
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        refresh_interval: float = 300.0,
+        min_refetch_interval: float = 10.0,
+        timeout: float = 5.0,
+    ):
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self.timeout = timeout
+
+        self._keys: Dict[str, Key] = {}
+        self._last_fetch: float = 0.0
+        self._fetch_lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def for_keycloak_realm(cls, keycloak_url: str, realm: str, **kwargs: Any) -> "JwksKeyManager":
+        base_url = keycloak_url.rstrip("/")
+        return cls(f"{base_url}/realms/{realm}/protocol/openid-connect/certs", **kwargs)
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self._keys)
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._fetch_lock is None:
+            self._fetch_lock = asyncio.Lock()
+        return self._fetch_lock
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def start(self) -> None:
+        """Carrega o JWKS e inicia a renovação periódica em background."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Falha ao carregar JWKS no startup, tentando novamente em background: {e}")
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Falha ao renovar JWKS: {e}")
+
+    async def refresh(self) -> None:
+        """Busca o JWKS e substitui o índice de chaves de forma atômica."""
+        response = await self._get_client().get(self.jwks_url)
+        response.raise_for_status()
+
+        keys: Dict[str, Key] = {}
+        for key_data in response.json().get("keys", []):
+            kid = key_data.get("kid")
+            if not kid or key_data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[kid] = jwk.construct(key_data, key_data.get("alg", "RS256"))
+            except Exception as e:
+                logger.warning(f"Chave JWKS ignorada (kid={kid}): {e}")
+
+        if not keys:
+            raise InvalidCredentialsError("JWKS sem chaves de assinatura válidas")
+
+        self._keys = keys
+        self._last_fetch = time.monotonic()
+        logger.info(f"JWKS carregado com {len(keys)} chave(s)")
+
+    async def _refetch_for(self, kid: str) -> None:
+        """Rebusca o JWKS uma única vez para requisições concorrentes."""
+        async with self._get_lock():
+            if kid in self._keys:
+                return
+            if time.monotonic() - self._last_fetch < self.min_refetch_interval:
+                return
+            await self.refresh()
+
+    async def get_key(self, kid: Optional[str]) -> Key:
+        if kid is None:
+            if len(self._keys) == 1:
+                return next(iter(self._keys.values()))
+            raise InvalidCredentialsError("Token sem identificador de chave (kid)")
+
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        try:
+            await self._refetch_for(kid)
+        except InvalidCredentialsError:
+            raise
+        except Exception as e:
+            logger.error(f"Erro ao buscar JWKS para kid {kid}: {e}")
+            raise InvalidCredentialsError("Não foi possível validar a chave do token")
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise InvalidCredentialsError("Chave de assinatura do token desconhecida")
+        return key
+
+    async def get_signing_key(self, token: str) -> Key:
+        """Resolve a chave de verificação a partir do header do token."""
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            raise InvalidCredentialsError("Token inválido ou malformado")
+        return await self.get_key(header.get("kid"))
@@ -1,16 +1,28 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import List, Union, Callable, Awaitable
+from typing import Any, Dict, List, Optional, Union, Callable, Awaitable
 from .jwt_handler import JwtHandler
+from .key_manager import JwksKeyManager
 import inspect
 
 security = HTTPBearer()
 
+def set_verified_payload(request: Request, payload: Dict[str, Any], audience: str, issuer: str) -> None:
+    """Guarda no request o payload verificado junto com a audiência e o emissor usados."""
+    request.state.user_payload = payload
+    request.state.user_payload_verified_for = (audience, issuer)
+
+def get_verified_payload(request: Request, audience: str, issuer: str) -> Optional[Dict[str, Any]]:
+    """Retorna o payload já verificado, apenas se foi verificado com a mesma audiência e emissor."""
+    if getattr(request.state, "user_payload_verified_for", None) != (audience, issuer):
+        return None
+    return getattr(request.state, "user_payload", None)
+
 class RoleChecker:
     def __init__(
         self,
         allowed_roles: List[str],
-        public_key: Union[str, Callable[[], Awaitable[str]]],
+        public_key: Union[str, JwksKeyManager, Callable[[], Awaitable[str]]],
         audience: str,
         issuer: str
     ):
@@ -19,7 +31,9 @@ class RoleChecker:
         self.audience = audience
         self.issuer = issuer
 
-    async def _get_key(self) -> str:
+    async def _get_key(self, token: str) -> Any:
+        if isinstance(self.public_key, JwksKeyManager):
+            return await self.public_key.get_signing_key(token)
         if callable(self.public_key):
             result = self.public_key()
             if inspect.isawaitable(result):
@@ -27,15 +41,23 @@ class RoleChecker:
             return result
         return self.public_key
 
-    async def __call__(self, token: HTTPAuthorizationCredentials = Depends(security)):
-        resolved_key = await self._get_key()
+    async def __call__(
+        self,
+        request: Request,
+        token: HTTPAuthorizationCredentials = Depends(security)
+    ):
+        # Reaproveita o payload já verificado pelo middleware para a mesma audiência e emissor
+        payload = get_verified_payload(request, self.audience, self.issuer)
+
+        if payload is None:
+            resolved_key = await self._get_key(token.credentials)
 
-        payload = JwtHandler.decode_token(
-            token=token.credentials,
-            public_key=resolved_key,
-            audience=self.audience,
-            issuer=self.issuer
-        )
+            payload = JwtHandler.decode_token(
+                token=token.credentials,
+                public_key=resolved_key,
+                audience=self.audience,
+                issuer=self.issuer
+            )
 
         realm_access = payload.get("realm_access", {})
         user_roles = realm_access.get("roles", [])
@@ -0,0 +1,67 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """
+    Cache LRU limitado de claims já verificadas, indexado pelo digest do token
+    e do contexto da verificação (audiência e emissor).
+    Cada entrada expira no `exp` do token, limitado a `max_ttl` segundos.
+    """
+
+    def __init__(self, maxsize: int = 10_000, max_ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(token: str, audience: str, issuer: str, verify_aud: bool = True) -> str:
+        material = f"{token}|{audience}|{issuer}|{int(verify_aud)}".encode("utf-8")
+        return hashlib.sha256(material).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, payload = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return dict(payload)
+
+    def set(self, key: str, payload: Dict[str, Any]) -> None:
+        now = time.time()
+        try:
+            token_exp = float(payload["exp"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        expires_at = min(token_exp, now + self.max_ttl)
+        if expires_at <= now:
+            return
+
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_token_cache = VerifiedTokenCache()
@@ -0,0 +1,65 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from common.security.roles import RoleChecker, set_verified_payload
+
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PRIVATE_PEM = PRIVATE_KEY.private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+).decode()
+PUBLIC_PEM = PRIVATE_KEY.public_key().public_bytes(
+    serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+).decode()
+ISSUER = "http://keycloak/realms/athlos"
+
+
+def _token(audience: str, roles) -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "sub": "user", "aud": audience, "iss": ISSUER, "iat": now, "exp": now + 60,
+            "realm_access": {"roles": roles},
+        },
+        PRIVATE_PEM,
+        algorithm="RS256",
+        headers={"kid": "k1"},
+    )
+
+
+def _request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+def _checker(audience: str) -> RoleChecker:
+    return RoleChecker(["admin"], public_key=PUBLIC_PEM, audience=audience, issuer=ISSUER)
+
+
+async def test_reuses_payload_verified_for_same_audience_and_issuer():
+    request = _request()
+    payload = {"sub": "user", "realm_access": {"roles": ["admin"]}}
+    set_verified_payload(request, payload, "api", ISSUER)
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="nao-usado")
+    assert await _checker("api")(request, credentials) is payload
+
+
+async def test_ignores_payload_verified_for_another_audience():
+    request = _request()
+    # O middleware verificou o token de outro cliente, onde o usuário é admin
+    set_verified_payload(
+        request, {"sub": "user", "realm_access": {"roles": ["admin"]}}, "outro-cliente", ISSUER
+    )
+    token = _token("api", roles=["user"])
+
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    with pytest.raises(HTTPException) as exc_info:
+        await _checker("api")(request, credentials)
+    assert exc_info.value.status_code == 403
+
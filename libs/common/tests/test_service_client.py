@@ -0,0 +1,129 @@
+import asyncio
+
+import httpx
+import pytest
+
+from common.http import CircuitBreaker, CircuitOpenError, ServiceHttpClient
+
+
+def _client(handler, **options) -> ServiceHttpClient:
+    client = ServiceHttpClient(name="destino", base_url="http://destino", backoff_base=0, **options)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _flaky(statuses):
+    """Responde com os status em sequência, contando as chamadas."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1])
+
+    return handler, calls
+
+
+async def test_get_is_retried_on_unavailable():
+    handler, calls = _flaky([503, 503, 200])
+
+    response = await _client(handler).get("/recurso")
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+
+
+async def test_post_is_not_retried_by_default():
+    handler, calls = _flaky([503, 200])
+
+    response = await _client(handler).post("/recurso", json={})
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+async def test_post_connect_error_is_not_retried_by_default():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("recusada", request=request)
+
+    with pytest.raises(httpx.ConnectError):
+        await _client(handler).post("/recurso", json={})
+    assert len(calls) == 1
+
+
+async def test_post_is_retried_with_idempotency_key_or_opt_in():
+    handler, calls = _flaky([503, 200])
+    response = await _client(handler).post(
+        "/recurso", json={}, headers={"Idempotency-Key": "abc"}
+    )
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+    handler, calls = _flaky([503, 200])
+    response = await _client(handler).post("/recurso", json={}, retry=True)
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_circuit_breaker_half_open_allows_a_single_probe(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("common.http.service_client.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    now[0] = 11
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    # A falha do teste reabre o circuito imediatamente
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    now[0] = 22
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.allow_request() and breaker.allow_request()
+
+
+async def test_concurrent_requests_in_half_open_state():
+    release = asyncio.Event()
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await release.wait()
+        return httpx.Response(200)
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    breaker._opened_at -= 10  # reset_timeout já transcorrido: meio-aberto
+    client = _client(handler, circuit_breaker=breaker)
+
+    probe = asyncio.create_task(client.get("/recurso"))
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):
+        await client.get("/recurso")
+
+    release.set()
+    assert (await probe).status_code == 200
+    assert len(calls) == 1
+    assert breaker.allow_request()
+
+
+async def test_repeated_server_errors_open_the_circuit():
+    handler, calls = _flaky([500])
+    client = _client(handler, circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=10))
+
+    for _ in range(3):
+        assert (await client.get("/recurso")).status_code == 500
+    with pytest.raises(CircuitOpenError):
+        await client.get("/recurso")
+    assert len(calls) == 3
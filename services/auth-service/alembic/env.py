@@ -19,6 +19,7 @@ from auth_service.infrastructure.database.models.organization_model import (
     Organization,
     OrganizationOrganizer,
 )
+from auth_service.infrastructure.database.models.outbox_model import NotificationOutbox
 from auth_service.infrastructure.database.models.user_model import User
 
 config = context.config
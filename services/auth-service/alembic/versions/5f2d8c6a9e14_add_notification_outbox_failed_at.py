@@ -0,0 +1,32 @@
+"""add notification outbox failed_at
+
+Revision ID: 5f2d8c6a9e14
+Revises: c41e7d9a2b3f
+Create Date: 2026-10-18 16:40:12.508231
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2d8c6a9e14"
+down_revision: Union[str, Sequence[str], None] = "c41e7d9a2b3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "notification_outbox",
+        sa.Column("failed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("notification_outbox", "failed_at")
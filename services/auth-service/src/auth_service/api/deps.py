@@ -1,8 +1,9 @@
 """Dependências da API para injeção de dependência"""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from common.security.jwt_handler import JwtHandler
+from common.security.roles import get_verified_payload
 from database.dependencies import get_session
 from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -14,6 +15,7 @@ from auth_service.domain.interfaces.repositories import (
     IOrganizationMemberRepository,
     IOrganizationOrganizerRepository,
     IOrganizationRepository,
+    IOutboxRepository,
     IUserRepository,
 )
 from auth_service.domain.services.authentication_service import AuthenticationService
@@ -30,6 +32,7 @@ from auth_service.infrastructure.repositories.organization_organizer_repository
 from auth_service.infrastructure.repositories.organization_repository import (
     OrganizationRepository,
 )
+from auth_service.infrastructure.repositories.outbox_repository import OutboxRepository
 from auth_service.infrastructure.repositories.user_repository import UserRepository
 
 bearer_scheme = HTTPBearer()
@@ -76,6 +79,14 @@ def get_organization_organizer_repository(
     return OrganizationOrganizerRepository(session)
 
 
+def get_outbox_repository(
+    session: AsyncSession = Depends(get_session),
+) -> IOutboxRepository:
+    """Factory para OutboxRepository."""
+
+    return OutboxRepository(session)
+
+
 def get_keycloak_service() -> IKeycloakService:
     """Factory para KeycloakAdminService."""
 
@@ -100,10 +111,13 @@ def get_organization_service(
         get_organization_organizer_repository
     ),
     user_repo: IUserRepository = Depends(get_user_repository),
+    outbox_repo: IOutboxRepository = Depends(get_outbox_repository),
 ) -> OrganizationService:
     """Factory para OrganizationService."""
 
-    return OrganizationService(org_repo, member_repo, organizer_repo, user_repo)
+    return OrganizationService(
+        org_repo, member_repo, organizer_repo, user_repo, outbox_repo
+    )
 
 
 def get_authentication_service(
@@ -114,20 +128,34 @@ def get_authentication_service(
     return AuthenticationService(user_repo)
 
 
+async def _get_token_payload(request: Request, token: str) -> dict[str, Any]:
+    """Retorna o payload verificado pelo middleware ou decodifica o token."""
+
+    audience = settings.KEYCLOAK_CLIENT_ID
+    issuer = f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}"
+
+    payload = get_verified_payload(request, audience, issuer)
+    if payload is not None:
+        return payload
+
+    public_key = await AuthenticationService.get_public_key(token)
+
+    return JwtHandler.decode_token(
+        token=token,
+        public_key=public_key,
+        audience=audience,
+        issuer=issuer,
+    )
+
+
 async def get_current_db_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     auth_service: AuthenticationService = Depends(get_authentication_service),
 ) -> User:
     """Obtém usuário autenticado atual do token JWT."""
 
-    public_key = await AuthenticationService.get_public_key()
-
-    payload = JwtHandler.decode_token(
-        token=credentials.credentials,
-        public_key=public_key,
-        audience=settings.KEYCLOAK_CLIENT_ID,
-        issuer=f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}",
-    )
+    payload = await _get_token_payload(request, credentials.credentials)
 
     db_user = await auth_service.get_or_create_user_from_keycloak_token(payload)
     return db_user
@@ -146,14 +174,7 @@ async def get_current_user_optional(
 
     try:
         token = auth_header.split(" ")[1]
-        public_key = await AuthenticationService.get_public_key()
-
-        payload = JwtHandler.decode_token(
-            token=token,
-            public_key=public_key,
-            audience=settings.KEYCLOAK_CLIENT_ID,
-            issuer=f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}",
-        )
+        payload = await _get_token_payload(request, token)
 
         user = await auth_service.get_or_create_user_from_keycloak_token(payload)
         return user
@@ -23,10 +23,14 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
     dependencies=[Depends(require_role(["admin"]))],
     response_model=List[UserAdmin],
 )
-async def get_users_admin(user_service: UserServiceDep):
-    """Obtém todos os usuários (apenas admin)."""
+async def get_users_admin(
+    user_service: UserServiceDep,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+):
+    """Obtém usuários paginados com suas roles (apenas admin)."""
 
-    return await user_service.get_all_users_with_roles()
+    return await user_service.get_all_users_with_roles(limit, offset)
 
 
 @router.delete(
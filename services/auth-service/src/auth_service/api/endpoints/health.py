@@ -7,7 +7,7 @@ from database.client import db
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
-from auth_service.domain.services.authentication_service import AuthenticationService
+from auth_service.core.security import jwks_manager
 
 router = APIRouter(tags=["Health"])
 logger = logging.getLogger(__name__)
@@ -32,7 +32,8 @@ async def health_check():
         health_status["status"] = "unhealthy"
 
     try:
-        await asyncio.wait_for(AuthenticationService.get_public_key(), timeout=5.0)
+        if not jwks_manager.is_ready:
+            await asyncio.wait_for(jwks_manager.refresh(), timeout=5.0)
         health_status["checks"]["keycloak"] = "ok"
     except asyncio.TimeoutError:
         health_status["checks"]["keycloak"] = "error: request timeout"
@@ -5,6 +5,7 @@ from typing import Callable
 
 from common.exceptions import InvalidCredentialsError, TokenExpiredError
 from common.security.jwt_handler import JwtHandler
+from common.security.roles import set_verified_payload
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
@@ -51,16 +52,18 @@ class KeycloakAuthMiddleware(BaseHTTPMiddleware):
             token = auth_header.split(" ", 1)[1]
 
             try:
-                public_key = await AuthenticationService.get_public_key()
+                public_key = await AuthenticationService.get_public_key(token)
 
+                audience = settings.KEYCLOAK_CLIENT_ID
+                issuer = f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}"
                 payload = JwtHandler.decode_token(
                     token=token,
                     public_key=public_key,
-                    audience=settings.KEYCLOAK_CLIENT_ID,
-                    issuer=f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}",
+                    audience=audience,
+                    issuer=issuer,
                 )
 
-                request.state.user_payload = payload
+                set_verified_payload(request, payload, audience, issuer)
                 request.state.user_id = payload.get("sub")
 
             except TokenExpiredError:
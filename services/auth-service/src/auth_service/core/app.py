@@ -10,6 +10,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from auth_service.api.middleware import KeycloakAuthMiddleware
 from auth_service.api.router import api_router
 from auth_service.core.config import settings
+from auth_service.core.security import jwks_manager
+from auth_service.infrastructure.external.keycloak_admin_client import (
+    keycloak_admin_client,
+)
+from auth_service.infrastructure.external.notifications_client import (
+    notifications_http_client,
+)
+from auth_service.infrastructure.outbox import notification_outbox_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +48,10 @@ async def lifespan(app: FastAPI):
 
         startup_logger.info("Banco de dados conectado com sucesso")
 
+        await jwks_manager.start()
+        await notifications_http_client.start()
+        await notification_outbox_dispatcher.start()
+
     except Exception as e:
         startup_logger.critical(f"Falha crítica no startup: {e}")
         raise e
@@ -48,6 +60,10 @@ async def lifespan(app: FastAPI):
 
     startup_logger.info("Encerrando aplicação...")
     try:
+        await notification_outbox_dispatcher.stop()
+        await jwks_manager.stop()
+        await keycloak_admin_client.close()
+        await notifications_http_client.close()
         await db.close()
         startup_logger.info("Conexões fechadas.")
     except Exception as e:
@@ -71,6 +71,15 @@ class Settings(BaseSettings):
 
     FRONTEND_URL: str
 
+    # Serviço de notificações
+    NOTIFICATIONS_SERVICE_URL: str = "http://localhost:8003/api/v1"
+    NOTIFICATIONS_SERVICE_TIMEOUT: float = 5.0
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 100
+    NOTIFICATION_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 10
+    NOTIFICATION_OUTBOX_LEASE_SECONDS: float = 60.0
+    NOTIFICATION_BATCH_MAX_RECIPIENTS: int = 5000
+
     # Email Resend
     EMAIL_TOKEN_SECRET: str
     RESEND_API_KEY: str
@@ -79,6 +88,13 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool
     RATE_LIMIT_PER_MINUTE: int
 
+    # Cache de identidade dos usuários autenticados
+    USER_IDENTITY_CACHE_MAX_SIZE: int = 10_000
+    USER_IDENTITY_CACHE_TTL_SECONDS: int = 60
+
+    # Cache do mapeamento de roles de realm usado na listagem admin
+    REALM_ROLE_CACHE_TTL_SECONDS: int = 300
+
     # Logging
     LOG_LEVEL: str
     LOG_FORMAT: str
@@ -1,7 +1,12 @@
+from common.security.key_manager import JwksKeyManager
 from common.security.roles import RoleChecker
 
 from auth_service.core.config import settings
-from auth_service.domain.services.authentication_service import AuthenticationService
+
+jwks_manager = JwksKeyManager.for_keycloak_realm(
+    keycloak_url=settings.KEYCLOAK_URL,
+    realm=settings.KEYCLOAK_REALM,
+)
 
 
 def require_role(roles: list[str]) -> RoleChecker:
@@ -9,7 +14,7 @@ def require_role(roles: list[str]) -> RoleChecker:
 
     return RoleChecker(
         allowed_roles=roles,
-        public_key=AuthenticationService.get_public_key,
+        public_key=jwks_manager,
         audience=settings.KEYCLOAK_CLIENT_ID,
         issuer=f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}",
     )
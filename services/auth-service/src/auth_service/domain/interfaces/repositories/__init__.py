@@ -10,6 +10,7 @@ from auth_service.domain.interfaces.repositories.organization_member import (
 from auth_service.domain.interfaces.repositories.organization_organizer import (
     IOrganizationOrganizerRepository,
 )
+from auth_service.domain.interfaces.repositories.outbox import IOutboxRepository
 from auth_service.domain.interfaces.repositories.user import IUserRepository
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "IOrganizationRepository",
     "IOrganizationMemberRepository",
     "IOrganizationOrganizerRepository",
+    "IOutboxRepository",
 ]
@@ -0,0 +1,42 @@
+"""Interface de repositório do outbox de notificações"""
+
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+from auth_service.domain.interfaces.repositories.base import IBaseRepository
+from auth_service.infrastructure.database.models.outbox_model import NotificationOutbox
+
+
+class IOutboxRepository(IBaseRepository):
+    """Interface abstrata para o outbox transacional de notificações."""
+
+    @abstractmethod
+    async def add(self, event_type: str, payload: dict[str, Any]) -> NotificationOutbox:
+        """Registra um evento na transação atual, sem confirmá-la."""
+        ...
+
+    @abstractmethod
+    async def claim_pending(
+        self, limit: int, max_attempts: int, lease_seconds: float
+    ) -> Sequence[NotificationOutbox]:
+        """Reserva um lote de eventos prontos para envio."""
+        ...
+
+    @abstractmethod
+    async def delete_many(self, event_ids: Sequence[UUID]) -> int:
+        """Remove eventos já entregues."""
+        ...
+
+    @abstractmethod
+    async def mark_failed(
+        self, event_id: UUID, error: str, retry_at: datetime
+    ) -> None:
+        """Registra uma falha de envio e reagenda o evento."""
+        ...
+
+    @abstractmethod
+    async def mark_dead(self, event_id: UUID, error: str) -> None:
+        """Registra uma falha definitiva; o evento fica retido para inspeção."""
+        ...
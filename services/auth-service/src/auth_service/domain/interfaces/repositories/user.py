@@ -32,8 +32,10 @@ class IUserRepository(IBaseRepository):
         ...
 
     @abstractmethod
-    async def get_all(self) -> Sequence[User]:
-        """Obtém todos os usuários (admin)."""
+    async def get_all(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> Sequence[User]:
+        """Obtém todos os usuários, com paginação opcional (admin)."""
         ...
 
     @abstractmethod
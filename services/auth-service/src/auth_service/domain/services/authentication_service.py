@@ -1,5 +1,6 @@
 """Serviço de autenticação"""
 
+import asyncio
 import datetime
 import logging
 import uuid
@@ -14,7 +15,7 @@ from common.security.jwt_handler import JwtHandler
 from fastapi import UploadFile
 from fastapi.concurrency import run_in_threadpool
 from jose import jwt
-from keycloak import KeycloakAdmin, KeycloakOpenID
+from keycloak import KeycloakOpenID
 from keycloak.exceptions import KeycloakAuthenticationError, KeycloakPostError
 from sqlalchemy.exc import IntegrityError
 
@@ -37,8 +38,13 @@ from auth_service.core.exceptions import (
     UserNotActivatedError,
     UserNotFoundError,
 )
+from auth_service.core.security import jwks_manager
 from auth_service.domain.interfaces.repositories import IUserRepository
+from auth_service.infrastructure.cache import realm_role_cache, user_identity_cache
 from auth_service.infrastructure.database.models.user_model import User
+from auth_service.infrastructure.external.keycloak_admin_client import (
+    keycloak_admin_client,
+)
 from auth_service.schemas.auth import KeycloakTokenResponse, TokenResponse
 from auth_service.utils.upload_image import upload_image
 
@@ -53,19 +59,6 @@ keycloak_openid = KeycloakOpenID(
 )
 
 
-def _get_keycloak_admin() -> KeycloakAdmin:
-    """Cria uma nova instância de KeycloakAdmin."""
-
-    return KeycloakAdmin(
-        server_url=settings.KEYCLOAK_URL,
-        client_id=settings.KEYCLOAK_CLIENT_ID,
-        client_secret_key=settings.KEYCLOAK_CLIENT_SECRET,
-        realm_name=settings.KEYCLOAK_REALM,
-        user_realm_name=settings.KEYCLOAK_REALM,
-        verify=True,
-    )
-
-
 class AuthenticationService:
 
     @staticmethod
@@ -110,10 +103,8 @@ class AuthenticationService:
     async def reset_user_password(self, user_id: str, new_password: str) -> None:
         """Atualiza a senha do usuário no Keycloak."""
         try:
-            keycloak_admin = _get_keycloak_admin()
-            await run_in_threadpool(
-                keycloak_admin.set_user_password, user_id, new_password, False
-            )
+            keycloak_admin = await keycloak_admin_client.get()
+            await keycloak_admin.a_set_user_password(user_id, new_password, False)
             logger.info(f"Senha redefinida para usuário {user_id}")
         except Exception as e:
             logger.error(f"Erro ao redefinir senha para usuário {user_id}: {e}")
@@ -121,24 +112,17 @@ class AuthenticationService:
 
     """Serviço para operações de autenticação com injeção de dependência."""
 
-    _public_key_cache: Optional[str] = None
-
     def __init__(self, user_repository: IUserRepository):
         self._user_repo = user_repository
 
     @staticmethod
-    async def get_public_key() -> str:
-        """Obtém chave pública do Keycloak para verificação de JWT."""
-
-        if AuthenticationService._public_key_cache:
-            return AuthenticationService._public_key_cache
+    async def get_public_key(token: str) -> Any:
+        """Obtém a chave pública do Keycloak (JWKS) que assinou o token."""
 
         try:
-            key_pem = await run_in_threadpool(keycloak_openid.public_key)
-            AuthenticationService._public_key_cache = (
-                "-----BEGIN PUBLIC KEY-----\n" f"{key_pem}\n" "-----END PUBLIC KEY-----"
-            )
-            return AuthenticationService._public_key_cache
+            return await jwks_manager.get_signing_key(token)
+        except CommonInvalidCredentialsError:
+            raise
         except Exception as e:
             logger.error(f"Erro ao obter chave pública: {e}")
             raise KeycloakCommunicationError("Erro ao obter chave pública do Keycloak")
@@ -199,7 +183,7 @@ class AuthenticationService:
                     "Falha ao trocar code por token no Keycloak"
                 )
 
-            public_key = await self.get_public_key()
+            public_key = await self.get_public_key(access_token)
             token_payload = JwtHandler.decode_token(
                 token=access_token,
                 public_key=public_key,
@@ -207,12 +191,11 @@ class AuthenticationService:
                 issuer=f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}",
             )
 
+            user_identity_cache.invalidate(token_payload.get("sub"))
             db_user = await self.get_or_create_user_from_keycloak_token(token_payload)
 
             try:
-                await run_in_threadpool(
-                    self.add_role_to_user, db_user.keycloak_id, "player"
-                )
+                await self.add_role_to_user(db_user.keycloak_id, "player")
             except Exception as role_error:
                 logger.warning(
                     f"Usuário {db_user.username} criado, mas falha ao atribuir role 'player': {role_error}"
@@ -270,7 +253,7 @@ class AuthenticationService:
                     "Resposta inválida do servidor de autenticação"
                 )
 
-            public_key = await self.get_public_key()
+            public_key = await self.get_public_key(token_response.access_token)
             token_payload = JwtHandler.decode_token(
                 token=token_response.access_token,
                 public_key=public_key,
@@ -278,6 +261,7 @@ class AuthenticationService:
                 issuer=f"{settings.KEYCLOAK_URL}/realms/{settings.KEYCLOAK_REALM}",
             )
 
+            user_identity_cache.invalidate(token_payload.get("sub"))
             await self.get_or_create_user_from_keycloak_token(token_payload)
 
             logger.info(f"Login bem-sucedido para usuário: {email}")
@@ -401,10 +385,13 @@ class AuthenticationService:
         """Registra um novo usuário no Keycloak e banco de dados local."""
 
         try:
-            keycloak_admin = _get_keycloak_admin()
+            keycloak_admin = await keycloak_admin_client.get()
 
-            users_email = await run_in_threadpool(
-                keycloak_admin.get_users, query={"email": email, "exact": True}
+            users_email, users_username = await asyncio.gather(
+                keycloak_admin.a_get_users(query={"email": email, "exact": True}),
+                keycloak_admin.a_get_users(
+                    query={"username": username, "exact": True}
+                ),
             )
             if users_email:
                 logger.warning(
@@ -412,17 +399,13 @@ class AuthenticationService:
                 )
                 raise EmailAlreadyInUseError(email)
 
-            users_username = await run_in_threadpool(
-                keycloak_admin.get_users, query={"username": username, "exact": True}
-            )
             if users_username:
                 logger.warning(
                     f"Tentativa de registro com username já em uso: {username}"
                 )
                 raise UsernameAlreadyInUseError(username)
 
-            new_user_id = await run_in_threadpool(
-                keycloak_admin.create_user,
+            new_user_id = await keycloak_admin.a_create_user(
                 {
                     "email": email,
                     "username": username,
@@ -449,22 +432,29 @@ class AuthenticationService:
                         prefix="avatars",
                     )
                     avatar_url = result["url"]
-
-                    await run_in_threadpool(
-                        keycloak_admin.update_user,
-                        new_user_id,
-                        {"attributes": {"avatar_url": avatar_url}},
-                    )
                 except AvatarUploadError as e:
                     logger.warning(
                         f"Erro no upload do avatar para usuário {new_user_id}: {e}"
                     )
 
-            try:
-                await run_in_threadpool(self.add_role_to_user, new_user_id, "player")
-            except Exception as role_error:
+            keycloak_updates = [self.add_role_to_user(new_user_id, "player")]
+            if avatar_url:
+                keycloak_updates.append(
+                    keycloak_admin.a_update_user(
+                        new_user_id, {"attributes": {"avatar_url": avatar_url}}
+                    )
+                )
+
+            role_result, *avatar_result = await asyncio.gather(
+                *keycloak_updates, return_exceptions=True
+            )
+            if isinstance(role_result, Exception):
+                logger.warning(
+                    f"Usuário {username} criado, mas falha ao atribuir role 'player': {role_result}"
+                )
+            if avatar_result and isinstance(avatar_result[0], Exception):
                 logger.warning(
-                    f"Usuário {username} criado, mas falha ao atribuir role 'player': {role_error}"
+                    f"Erro ao salvar avatar no Keycloak para usuário {new_user_id}: {avatar_result[0]}"
                 )
 
             try:
@@ -516,8 +506,8 @@ class AuthenticationService:
                 logger.info(f"Usuário {user_id} já estava ativado")
                 return {"success": True, "already_active": True, "email": user.email}
 
-            keycloak_admin = _get_keycloak_admin()
-            keycloak_admin.update_user(
+            keycloak_admin = await keycloak_admin_client.get()
+            await keycloak_admin.a_update_user(
                 user_id=user_id,
                 payload={"enabled": True, "emailVerified": True},
             )
@@ -525,6 +515,7 @@ class AuthenticationService:
             user.enabled = True
             user.email_verified = True
             await self._user_repo.commit()
+            user_identity_cache.invalidate(user_id)
 
             logger.info(f"Usuário {user_id} ativado com sucesso")
             return {"success": True, "user_id": user_id, "email": user.email}
@@ -558,12 +549,33 @@ class AuthenticationService:
         self,
         token_payload: dict[str, Any],
     ) -> User:
-        """Obtém ou cria usuário a partir do payload do token Keycloak."""
+        """Obtém ou cria usuário a partir do payload do token Keycloak.
+
+        Enquanto as claims relevantes não mudarem, o usuário é servido pelo
+        cache de identidade sem acessar o banco (e sem atualizar `last_login_at`,
+        que é renovado no login e a cada expiração do cache).
+        """
 
         keycloak_id = token_payload.get("sub")
         if not keycloak_id:
             raise AppException("Token inválido: campo 'sub' não encontrado")
 
+        claims_fingerprint = user_identity_cache.fingerprint(token_payload)
+        cached_user = user_identity_cache.get(keycloak_id, claims_fingerprint)
+        if cached_user is not None:
+            return cached_user
+
+        user = await self._sync_user_from_keycloak_token(keycloak_id, token_payload)
+        user_identity_cache.set(keycloak_id, claims_fingerprint, user)
+        return user
+
+    async def _sync_user_from_keycloak_token(
+        self,
+        keycloak_id: str,
+        token_payload: dict[str, Any],
+    ) -> User:
+        """Sincroniza o usuário local com as claims do token Keycloak."""
+
         email = token_payload.get("email")
         username = token_payload.get("preferred_username")
         first_name = token_payload.get("given_name") or ""
@@ -738,15 +750,16 @@ class AuthenticationService:
             raise AppException("Erro ao criar usuário: IntegrityError persistente")
 
     @staticmethod
-    def add_role_to_user(user_id_keycloak: str, role_name: str) -> bool:
+    async def add_role_to_user(user_id_keycloak: str, role_name: str) -> bool:
         """Adiciona função de realm ao usuário no Keycloak."""
 
         try:
-            keycloak_admin = _get_keycloak_admin()
-            role_object = keycloak_admin.get_realm_role(role_name)
-            keycloak_admin.assign_realm_roles(
+            role_object = await keycloak_admin_client.get_realm_role(role_name)
+            keycloak_admin = await keycloak_admin_client.get()
+            await keycloak_admin.a_assign_realm_roles(
                 user_id=user_id_keycloak, roles=[role_object]
             )
+            realm_role_cache.invalidate()
 
             logger.info(f"Role '{role_name}' adicionada ao usuário {user_id_keycloak}")
             return True
@@ -756,12 +769,12 @@ class AuthenticationService:
             raise AppException(f"Não foi possível atribuir o perfil {role_name}")
 
     @staticmethod
-    def get_role_from_user(user_id_keycloak: str) -> list[str]:
+    async def get_role_from_user(user_id_keycloak: str) -> list[str]:
         """Obtém funções de realm do usuário no Keycloak."""
 
         try:
-            keycloak_admin = _get_keycloak_admin()
-            roles = keycloak_admin.get_realm_roles_of_user(user_id_keycloak)
+            keycloak_admin = await keycloak_admin_client.get()
+            roles = await keycloak_admin.a_get_realm_roles_of_user(user_id_keycloak)
             role_names = [role["name"] for role in roles]
 
             logger.info(
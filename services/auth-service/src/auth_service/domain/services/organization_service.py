@@ -4,7 +4,6 @@ import logging
 from typing import Optional, Sequence
 from uuid import UUID
 
-import httpx
 from fastapi import UploadFile
 from slugify import slugify
 
@@ -39,6 +38,7 @@ from auth_service.domain.interfaces.repositories import (
     IOrganizationMemberRepository,
     IOrganizationOrganizerRepository,
     IOrganizationRepository,
+    IOutboxRepository,
     IUserRepository,
 )
 from auth_service.infrastructure.database.models.enums import (
@@ -53,6 +53,7 @@ from auth_service.infrastructure.database.models.organization_model import (
     OrganizationOrganizer,
 )
 from auth_service.infrastructure.database.models.user_model import User
+from auth_service.infrastructure.outbox import notification_outbox_dispatcher
 from auth_service.infrastructure.repositories.organization_member_repository import (
     OrgRole,
 )
@@ -70,13 +71,15 @@ class OrganizationService:
         member_repository: IOrganizationMemberRepository,
         organizer_repository: IOrganizationOrganizerRepository,
         user_repository: IUserRepository,
+        outbox_repository: IOutboxRepository,
     ):
         self._org_repo = org_repository
         self._member_repo = member_repository
         self._organizer_repo = organizer_repository
         self._user_repo = user_repository
+        self._outbox_repo = outbox_repository
     
-    async def _send_notification(
+    async def _enqueue_notification(
         self,
         user_id: UUID,
         notification_type: str,
@@ -86,33 +89,71 @@ class OrganizationService:
         extra_data: dict = None,
         action_url: str = None
     ):
-        """Helper para enviar notificações de forma consistente."""
-        try:
-            base_extra_data = {
-                "organization_id": str(organization.id),
-                "organization_name": organization.name,
-                "organization_slug": organization.slug,
-            }
-            
-            if extra_data:
-                base_extra_data.update(extra_data)
-            
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    "http://localhost:8003/api/v1/notifications/send",
-                    json={
-                        "user_id": str(user_id),
-                        "type": notification_type,
-                        "title": title,
-                        "message": message,
-                        "extra_data": base_extra_data,
-                        "action_url": action_url or f"/organizations/{organization.slug}"
-                    },
-                    timeout=5.0
-                )
-                logger.info(f"Notificação {notification_type} enviada para {user_id}")
-        except Exception as e:
-            logger.error(f"Erro ao enviar notificação {notification_type}: {e}")
+        """Helper para registrar notificações de forma consistente."""
+        await self._enqueue_notification_batch(
+            user_ids=[user_id],
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            organization=organization,
+            extra_data=extra_data,
+            action_url=action_url,
+        )
+
+    async def _enqueue_notification_batch(
+        self,
+        user_ids: Sequence[UUID],
+        notification_type: str,
+        title: str,
+        message: str,
+        organization: Organization,
+        extra_data: dict = None,
+        action_url: str = None
+    ):
+        """
+        Registra a notificação no outbox, na mesma transação da alteração.
+
+        Os destinatários são divididos em eventos de até
+        `NOTIFICATION_BATCH_MAX_RECIPIENTS`, o máximo aceito pelo envio em lote
+        do serviço de notificações. A entrega é feita em background pelo
+        despachante do outbox após o commit.
+        """
+        recipients = [str(user_id) for user_id in dict.fromkeys(user_ids)]
+        if not recipients:
+            return
+
+        base_extra_data = {
+            "organization_id": str(organization.id),
+            "organization_name": organization.name,
+            "organization_slug": organization.slug,
+        }
+        
+        if extra_data:
+            base_extra_data.update(extra_data)
+
+        chunk_size = settings.NOTIFICATION_BATCH_MAX_RECIPIENTS
+        for start in range(0, len(recipients), chunk_size):
+            await self._outbox_repo.add(
+                event_type=notification_type,
+                payload={
+                    "user_ids": recipients[start:start + chunk_size],
+                    "type": notification_type,
+                    "title": title,
+                    "message": message,
+                    "extra_data": base_extra_data,
+                    "action_url": action_url or f"/organizations/{organization.slug}"
+                },
+            )
+
+    async def _commit(self) -> None:
+        """Confirma a alteração junto com as notificações registradas no outbox."""
+        await self._outbox_repo.commit()
+        notification_outbox_dispatcher.notify()
+
+    async def _get_owner_and_organizer_ids(self, org: Organization) -> list[UUID]:
+        """Retorna o proprietário seguido dos organizadores da organização."""
+        organizers = await self._organizer_repo.get_organizers_by_org(org.id)
+        return [org.owner_id, *(organizer.user_id for organizer in organizers)]
 
     async def create_organization(
         self,
@@ -350,7 +391,6 @@ class OrganizationService:
             status=MemberStatus.PENDING,
         )
         created = await self._member_repo.create(new_membership)
-        await self._member_repo.commit()
 
         logger.info(f"Usuário {user.id} solicitou adesão à organização {slug}")
         
@@ -361,8 +401,8 @@ class OrganizationService:
             else:
                 user_name = user.first_name
         
-        await self._send_notification(
-            user_id=org.owner_id,
+        await self._enqueue_notification_batch(
+            user_ids=await self._get_owner_and_organizer_ids(org),
             notification_type="organization_join_request",
             title="Nova Solicitação de Entrada",
             message=f"{user_name} solicitou entrar em {org.name}",
@@ -374,22 +414,7 @@ class OrganizationService:
             },
             action_url=f"/organizations/{org.slug}/requests"
         )
-        
-        organizers = await self._organizer_repo.get_organizers_by_org(org.id)
-        for organizer in organizers:
-            await self._send_notification(
-                user_id=organizer.user_id,
-                notification_type="organization_join_request",
-                title="Nova Solicitação de Entrada",
-                message=f"{user_name} solicitou entrar em {org.name}",
-                organization=org,
-                extra_data={
-                    "requester_name": user_name,
-                    "requester_id": str(user.id),
-                    "membership_id": str(created.id),
-                },
-                action_url=f"/organizations/{org.slug}/requests"
-            )
+        await self._commit()
         
         return created
 
@@ -454,42 +479,31 @@ class OrganizationService:
             raise InviteNotFoundError()
 
         await self._member_repo.update_status(membership, MemberStatus.ACTIVE)
-        await self._member_repo.commit()
 
         logger.info(f"Usuário {user.id} aceitou convite para {slug}")
 
         org = await self._org_repo.get_by_slug(slug)
         if org:
-            try:
-                member_name = user.username
-                if user.first_name:
-                    if user.last_name:
-                        member_name = f"{user.first_name} {user.last_name}"
-                    else:
-                        member_name = user.first_name
-                
-                async with httpx.AsyncClient() as client:
-                    await client.post(
-                        "http://localhost:8003/api/v1/notifications/send",
-                        json={
-                            "user_id": str(org.owner_id),
-                            "type": "organization_accepted",
-                            "title": "Convite Aceito",
-                            "message": f"{member_name} aceitou o convite para sua organização",
-                            "extra_data": {
-                                "organization_id": str(org.id),
-                                "organization_name": org.name,
-                                "organization_slug": org.slug,
-                                "member_name": member_name,
-                                "member_id": str(user.id)
-                            },
-                            "action_url": f"/organizations/{org.slug}/members"
-                        },
-                        timeout=5.0
-                    )
-                    logger.info(f"Notificação de aceite enviada para owner {org.owner_id}")
-            except Exception as e:
-                logger.error(f"Erro ao enviar notificação de aceite: {e}")
+            member_name = user.username
+            if user.first_name:
+                if user.last_name:
+                    member_name = f"{user.first_name} {user.last_name}"
+                else:
+                    member_name = user.first_name
+
+            await self._enqueue_notification(
+                user_id=org.owner_id,
+                notification_type="organization_accepted",
+                title="Convite Aceito",
+                message=f"{member_name} aceitou o convite para sua organização",
+                organization=org,
+                extra_data={
+                    "member_name": member_name,
+                    "member_id": str(user.id),
+                },
+                action_url=f"/organizations/{org.slug}/members",
+            )
+        await self._commit()
 
     async def decline_invite(self, slug: str, user: User) -> None:
         """
@@ -508,7 +522,6 @@ class OrganizationService:
         org = await self._org_repo.get_by_id(membership.organization_id)
         
         await self._member_repo.delete(membership)
-        await self._member_repo.commit()
 
         logger.info(f"Usuário {user.id} recusou convite para {slug}")
         
@@ -520,8 +533,8 @@ class OrganizationService:
                 else:
                     user_name = user.first_name
             
-            await self._send_notification(
-                user_id=org.owner_id,
+            await self._enqueue_notification_batch(
+                user_ids=await self._get_owner_and_organizer_ids(org),
                 notification_type="organization_invite_declined",
                 title="Convite recusado",
                 message=f"{user_name} recusou o convite para {org.name}",
@@ -532,21 +545,7 @@ class OrganizationService:
                 },
                 action_url=f"/organizations/{org.slug}"
             )
-            
-            organizers = await self._organizer_repo.get_organizers_by_org(org.id)
-            for organizer in organizers:
-                await self._send_notification(
-                    user_id=organizer.user_id,
-                    notification_type="organization_invite_declined",
-                    title="Convite recusado",
-                    message=f"{user_name} recusou o convite para {org.name}",
-                    organization=org,
-                    extra_data={
-                        "declined_by_id": str(user.id),
-                        "declined_by_name": user_name,
-                    },
-                    action_url=f"/organizations/{org.slug}"
-                )
+        await self._commit()
 
     async def leave_organization(self, slug: str, user: User) -> None:
         """
@@ -577,7 +576,6 @@ class OrganizationService:
             raise NotActiveMemberError()
 
         await self._member_repo.delete(membership)
-        await self._member_repo.commit()
 
         logger.info(f"Usuário {user.id} saiu da organização {slug}")
         
@@ -588,8 +586,8 @@ class OrganizationService:
             else:
                 user_name = user.first_name
         
-        await self._send_notification(
-            user_id=org.owner_id,
+        await self._enqueue_notification_batch(
+            user_ids=await self._get_owner_and_organizer_ids(org),
             notification_type="organization_member_left",
             title="Um membro saiu da organização",
             message=f"{user_name} saiu de {org.name}",
@@ -600,21 +598,7 @@ class OrganizationService:
             },
             action_url=f"/organizations/{org.slug}"
         )
-        
-        organizers = await self._organizer_repo.get_organizers_by_org(org.id)
-        for organizer in organizers:
-            await self._send_notification(
-                user_id=organizer.user_id,
-                notification_type="organization_member_left",
-                title="Um membro saiu da organização",
-                message=f"{user_name} saiu de {org.name}",
-                organization=org,
-                extra_data={
-                    "member_id": str(user.id),
-                    "member_name": user_name,
-                },
-                action_url=f"/organizations/{org.slug}"
-            )
+        await self._commit()
 
     async def invite_user(self, slug: str, inviter: User, user_id: UUID) -> None:
         """
@@ -651,41 +635,30 @@ class OrganizationService:
             status=MemberStatus.INVITED,
         )
         await self._member_repo.create(new_membership)
-        await self._member_repo.commit()
 
         logger.info(f"Usuário {inviter.id} convidou {user_id} para {slug}")
 
-        try:
-            inviter_name = inviter.username
-            if inviter.first_name:
-                if inviter.last_name:
-                    inviter_name = f"{inviter.first_name} {inviter.last_name}"
-                else:
-                    inviter_name = inviter.first_name
-            
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    "http://localhost:8003/api/v1/notifications/send",
-                    json={
-                        "user_id": str(user_id),
-                        "type": "organization_invite",
-                        "title": "Convite para Organização",
-                        "message": f"Você foi convidado para participar de {org.name}",
-                        "extra_data": {
-                            "organization_id": str(org.id),
-                            "organization_name": org.name,
-                            "organization_slug": org.slug,
-                            "inviter_name": inviter_name,
-                            "inviter_id": str(inviter.id),
-                            "role": "member"
-                        },
-                        "action_url": f"/organizations/{org.slug}/invites"
-                    },
-                    timeout=5.0
-                )
-                logger.info(f"Notificação de convite enviada para {user_id}")
-        except Exception as e:
-            logger.error(f"Erro ao enviar notificação de convite: {e}")
+        inviter_name = inviter.username
+        if inviter.first_name:
+            if inviter.last_name:
+                inviter_name = f"{inviter.first_name} {inviter.last_name}"
+            else:
+                inviter_name = inviter.first_name
+
+        await self._enqueue_notification(
+            user_id=user_id,
+            notification_type="organization_invite",
+            title="Convite para Organização",
+            message=f"Você foi convidado para participar de {org.name}",
+            organization=org,
+            extra_data={
+                "inviter_name": inviter_name,
+                "inviter_id": str(inviter.id),
+                "role": "member",
+            },
+            action_url=f"/organizations/{org.slug}/invites",
+        )
+        await self._commit()
 
     async def cancel_invite(self, slug: str, admin: User, user_id: UUID) -> None:
         """
@@ -712,13 +685,12 @@ class OrganizationService:
             raise InviteNotFoundError()
 
         await self._member_repo.delete(membership)
-        await self._member_repo.commit()
 
         logger.info(f"Admin {admin.id} cancelou convite de {user_id} para {slug}")
         
         invited_user = await self._user_repo.get_by_id(user_id)
         if invited_user:
-            await self._send_notification(
+            await self._enqueue_notification(
                 user_id=invited_user.id,
                 notification_type="organization_invite_cancelled",
                 title="Convite cancelado",
@@ -729,6 +701,7 @@ class OrganizationService:
                 },
                 action_url="/organizations"
             )
+        await self._commit()
 
     async def approve_join_request(
         self, slug: str, admin: User, membership_id: UUID
@@ -754,13 +727,12 @@ class OrganizationService:
             raise OrganizationInactiveError()
 
         await self._member_repo.update_status(membership, MemberStatus.ACTIVE)
-        await self._member_repo.commit()
 
         logger.info(f"Admin {admin.id} aprovou solicitação {membership_id}")
         
         requester = await self._user_repo.get_by_id(membership.user_id)
         if requester and org:
-            await self._send_notification(
+            await self._enqueue_notification(
                 user_id=requester.id,
                 notification_type="organization_request_approved",
                 title="Solicitação Aprovada",
@@ -771,6 +743,7 @@ class OrganizationService:
                 },
                 action_url=f"/organizations/{org.slug}"
             )
+        await self._commit()
         
         return membership
 
@@ -798,13 +771,12 @@ class OrganizationService:
             raise OrganizationInactiveError()
 
         await self._member_repo.delete(membership)
-        await self._member_repo.commit()
 
         logger.info(f"Admin {admin.id} rejeitou solicitação {membership_id}")
         
         requester = await self._user_repo.get_by_id(membership.user_id)
         if requester and org:
-            await self._send_notification(
+            await self._enqueue_notification(
                 user_id=requester.id,
                 notification_type="organization_request_rejected",
                 title="Solicitação Rejeitada",
@@ -815,6 +787,7 @@ class OrganizationService:
                 },
                 action_url=f"/organizations"
             )
+        await self._commit()
 
     async def remove_member(self, slug: str, admin: User, member_user_id: UUID) -> None:
         """
@@ -860,13 +833,12 @@ class OrganizationService:
             await self._organizer_repo.delete(organizer)
 
         await self._member_repo.delete(membership)
-        await self._member_repo.commit()
 
         logger.info(f"Admin {admin.id} removeu membro {member_user_id} da organização {slug}")
         
         removed_user = await self._user_repo.get_by_id(member_user_id)
         if removed_user:
-            await self._send_notification(
+            await self._enqueue_notification(
                 user_id=removed_user.id,
                 notification_type="organization_member_removed",
                 title="Você foi removido de uma organização",
@@ -877,6 +849,7 @@ class OrganizationService:
                 },
                 action_url="/organizations"
             )
+        await self._commit()
 
         logger.info(f"Admin {admin.id} removeu membro {member_user_id} de {slug}")
 
@@ -1015,13 +988,12 @@ class OrganizationService:
 
         new_organizer = OrganizationOrganizer(organization_id=org.id, user_id=user_id)
         created = await self._organizer_repo.create(new_organizer)
-        await self._organizer_repo.commit()
 
         logger.info(f"Usuário {owner.id} promoveu {user_id} a organizador em {slug}")
         
         promoted_user = await self._user_repo.get_by_id(user_id)
         if promoted_user:
-            await self._send_notification(
+            await self._enqueue_notification(
                 user_id=promoted_user.id,
                 notification_type="organization_organizer_added",
                 title="Você foi promovido a organizador",
@@ -1032,6 +1004,7 @@ class OrganizationService:
                 },
                 action_url=f"/organizations/{org.slug}"
             )
+        await self._commit()
         
         return created
 
@@ -1065,13 +1038,12 @@ class OrganizationService:
             raise OrganizerNotFoundError()
 
         await self._organizer_repo.delete(organizer)
-        await self._organizer_repo.commit()
 
         logger.info(f"Usuário {owner.id} removeu organizador {user_id} de {slug}")
         
         demoted_user = await self._user_repo.get_by_id(user_id)
         if demoted_user:
-            await self._send_notification(
+            await self._enqueue_notification(
                 user_id=demoted_user.id,
                 notification_type="organization_organizer_removed",
                 title="Você não é mais organizador",
@@ -1082,6 +1054,7 @@ class OrganizationService:
                 },
                 action_url=f"/organizations/{org.slug}"
             )
+        await self._commit()
 
     async def transfer_ownership(
         self, slug: str, owner: User, new_owner_id: UUID
@@ -1124,7 +1097,6 @@ class OrganizationService:
 
         old_owner_id = org.owner_id
         org.owner_id = new_owner_id
-        await self._org_repo.commit()
 
         logger.info(
             f"Propriedade de {slug} transferida de {old_owner_id} para {new_owner_id}"
@@ -1137,7 +1109,7 @@ class OrganizationService:
             else:
                 new_owner_name = new_owner_user.first_name
         
-        await self._send_notification(
+        await self._enqueue_notification(
             user_id=new_owner_id,
             notification_type="organization_ownership_received",
             title="Você é o novo proprietário",
@@ -1149,7 +1121,7 @@ class OrganizationService:
             action_url=f"/organizations/{org.slug}"
         )
         
-        await self._send_notification(
+        await self._enqueue_notification(
             user_id=old_owner_id,
             notification_type="organization_ownership_transferred",
             title="Propriedade transferida",
@@ -1161,6 +1133,7 @@ class OrganizationService:
             },
             action_url=f"/organizations/{org.slug}"
         )
+        await self._commit()
         
         return org
 
@@ -1225,10 +1198,11 @@ class OrganizationService:
             logger.info(f"Organização {slug} excluída por admin")
             action_text = "excluída"
 
-        await self._org_repo.commit()
-        
-        await self._send_notification(
-            user_id=org.owner_id,
+        active_members = await self._member_repo.get_members_by_org(
+            org.id, MemberStatus.ACTIVE
+        )
+        await self._enqueue_notification_batch(
+            user_ids=[org.owner_id, *(member.user_id for member in active_members)],
             notification_type="organization_deleted",
             title=f"Organização {action_text}",
             message=f"A organização {org.name} foi {action_text} pela plataforma",
@@ -1238,21 +1212,7 @@ class OrganizationService:
             },
             action_url="/organizations"
         )
-        
-        active_members = await self._member_repo.get_members(org.id)
-        for member in active_members:
-            if member.status == MemberStatus.ACTIVE and member.user_id != org.owner_id:
-                await self._send_notification(
-                    user_id=member.user_id,
-                    notification_type="organization_deleted",
-                    title=f"Organização {action_text}",
-                    message=f"A organização {org.name} foi {action_text} pela plataforma",
-                    organization=org,
-                    extra_data={
-                        "action": action_text,
-                    },
-                    action_url="/organizations"
-                )
+        await self._commit()
 
     async def admin_accept_organization(self, slug: str) -> Organization:
         """
@@ -1273,11 +1233,10 @@ class OrganizationService:
             )
 
         org.status = OrganizationStatus.ACTIVE
-        await self._org_repo.commit()
 
         logger.info(f"Organização {slug} aceita por admin")
         
-        await self._send_notification(
+        await self._enqueue_notification(
             user_id=org.owner_id,
             notification_type="organization_approved",
             title="Organização aprovada",
@@ -1286,6 +1245,7 @@ class OrganizationService:
             extra_data={},
             action_url=f"/organizations/{org.slug}"
         )
+        await self._commit()
         
         return org
 
@@ -1306,12 +1266,11 @@ class OrganizationService:
             raise OrganizationStatusConflictError("Organização já está suspensa.")
 
         org.status = OrganizationStatus.SUSPENDED
-        await self._org_repo.commit()
 
         logger.info(f"Organização {slug} suspensa por admin")
         
-        await self._send_notification(
-            user_id=org.owner_id,
+        await self._enqueue_notification_batch(
+            user_ids=await self._get_owner_and_organizer_ids(org),
             notification_type="organization_suspended",
             title="Organização suspensa",
             message=f"A organização {org.name} foi suspensa pela plataforma",
@@ -1319,18 +1278,7 @@ class OrganizationService:
             extra_data={},
             action_url=f"/organizations/{org.slug}"
         )
-        
-        organizers = await self._organizer_repo.get_organizers_by_org(org.id)
-        for organizer in organizers:
-            await self._send_notification(
-                user_id=organizer.user_id,
-                notification_type="organization_suspended",
-                title="Organização suspensa",
-                message=f"A organização {org.name} foi suspensa pela plataforma",
-                organization=org,
-                extra_data={},
-                action_url=f"/organizations/{org.slug}"
-            )
+        await self._commit()
 
     async def admin_unsuspend_organization(self, slug: str) -> None:
         """
@@ -1349,12 +1297,11 @@ class OrganizationService:
             raise OrganizationStatusConflictError("Organização não está suspensa.")
 
         org.status = OrganizationStatus.ACTIVE
-        await self._org_repo.commit()
 
         logger.info(f"Organização {slug} reativada por admin")
         
-        await self._send_notification(
-            user_id=org.owner_id,
+        await self._enqueue_notification_batch(
+            user_ids=await self._get_owner_and_organizer_ids(org),
             notification_type="organization_unsuspended",
             title="Organização reativada",
             message=f"A organização {org.name} foi reativada!",
@@ -1362,18 +1309,7 @@ class OrganizationService:
             extra_data={},
             action_url=f"/organizations/{org.slug}"
         )
-        
-        organizers = await self._organizer_repo.get_organizers_by_org(org.id)
-        for organizer in organizers:
-            await self._send_notification(
-                user_id=organizer.user_id,
-                notification_type="organization_unsuspended",
-                title="Organização reativada",
-                message=f"A organização {org.name} foi reativada!",
-                organization=org,
-                extra_data={},
-                action_url=f"/organizations/{org.slug}"
-            )
+        await self._commit()
 
     async def get_all_organizations_admin(
         self, status_filter: Optional[OrganizationStatus] = None
@@ -10,6 +10,7 @@ from auth_service.core.config import settings
 from auth_service.core.exceptions import UsernameAlreadyInUseError, UserNotFoundError
 from auth_service.domain.interfaces.external_services import IKeycloakService
 from auth_service.domain.interfaces.repositories import IUserRepository
+from auth_service.infrastructure.cache import realm_role_cache, user_identity_cache
 from auth_service.infrastructure.database.models.user_model import User
 from auth_service.utils.upload_image import upload_image
 from auth_service.domain.services.authentication_service import AuthenticationService
@@ -64,22 +65,27 @@ class UserService:
 
         return await self._user_repo.get_all()
 
-    async def get_all_users_with_roles(self) -> Sequence[UserAdmin]:
-        """Obtém todos os usuários e enriquece com roles do Keycloak (admin).
+    async def get_all_users_with_roles(
+        self, limit: int = 50, offset: int = 0
+    ) -> Sequence[UserAdmin]:
+        """Obtém uma página de usuários enriquecida com roles do Keycloak (admin).
 
         Retorna uma lista de objetos `UserAdmin` (pydantic) com campos adicionais
-        `roles` e `is_admin` para uso no frontend/admin endpoints.
+        `roles` e `is_admin` para uso no frontend/admin endpoints. As roles vêm
+        do mapa em cache de membros por role, sem uma chamada por usuário.
         """
 
-        users = await self._user_repo.get_all()
+        users = await self._user_repo.get_all(limit=limit, offset=offset)
+
+        try:
+            roles_by_user = await realm_role_cache.get_roles_by_user()
+        except Exception as e:
+            logger.error(f"Erro ao obter roles de realm do Keycloak: {e}")
+            roles_by_user = {}
+
         results: list[UserAdmin] = []
         for u in users:
-            roles = []
-            try:
-                roles = AuthenticationService.get_role_from_user(u.keycloak_id) or []
-            except Exception:
-                roles = []
-
+            roles = roles_by_user.get(u.keycloak_id, [])
             is_admin_flag = any(r.lower() == "admin" for r in roles)
 
             user_dict = {
@@ -114,6 +120,7 @@ class UserService:
             raise UserNotFoundError(str(user_id))
 
         await self._user_repo.commit()
+        user_identity_cache.invalidate_user_id(user_id)
         logger.info(f"Usuário {user_id} atualizado: {list(data.keys())}")
 
         return user
@@ -135,6 +142,7 @@ class UserService:
                 raise UserNotFoundError(str(user_id))
 
             await self._user_repo.commit()
+            user_identity_cache.invalidate_user_id(user_id)
 
         except Exception:
             await self._user_repo.rollback()
@@ -210,6 +218,7 @@ class UserService:
         if updates_db:
             updated_user = await self._user_repo.update(db_user.id, updates_db)
             await self._user_repo.commit()
+            user_identity_cache.invalidate(db_user.keycloak_id)
             if updated_user:
                 logger.info(
                     f"Usuário {updated_user.id} atualizado: {list(updates_db.keys())}"
@@ -228,6 +237,7 @@ class UserService:
 
         await self._user_repo.update(user_id, {"enabled": False})
         await self._user_repo.commit()
+        user_identity_cache.invalidate_user_id(user_id)
         logger.info(f"Usuário {user_id} suspenso")
 
 
@@ -240,4 +250,5 @@ class UserService:
 
         await self._user_repo.update(user_id, {"enabled": True})
         await self._user_repo.commit()
+        user_identity_cache.invalidate_user_id(user_id)
         logger.info(f"Usuário {user_id} reativado")
@@ -0,0 +1,17 @@
+"""Módulo de caches em memória do processo."""
+
+from auth_service.infrastructure.cache.realm_role_cache import (
+    RealmRoleCache,
+    realm_role_cache,
+)
+from auth_service.infrastructure.cache.user_identity_cache import (
+    UserIdentityCache,
+    user_identity_cache,
+)
+
+__all__ = [
+    "RealmRoleCache",
+    "realm_role_cache",
+    "UserIdentityCache",
+    "user_identity_cache",
+]
@@ -0,0 +1,96 @@
+"""Cache TTL do mapeamento usuário → roles de realm do Keycloak."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from auth_service.core.config import settings
+from auth_service.infrastructure.external.keycloak_admin_client import (
+    keycloak_admin_client,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RealmRoleCache:
+    """
+    Monta o mapa `keycloak_id → roles` listando os membros de cada role de realm.
+
+    São uma chamada para listar as roles e uma listagem paginada por role, em
+    vez de uma chamada por usuário. O mapa inteiro é reconstruído quando expira
+    ou é invalidado, com uma única reconstrução para requisições concorrentes.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._roles_by_user: dict[str, list[str]] = {}
+        self._expires_at: float = 0.0
+        self._generation = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() < self._expires_at
+
+    async def get_roles_by_user(self) -> dict[str, list[str]]:
+        """Retorna o mapa `keycloak_id → roles`, reconstruindo-o se necessário."""
+
+        if self._is_fresh():
+            return self._roles_by_user
+
+        async with self._get_lock():
+            if self._is_fresh():
+                return self._roles_by_user
+
+            generation = self._generation
+            roles_by_user = await self._load()
+
+            if generation == self._generation:
+                self._roles_by_user = roles_by_user
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return roles_by_user
+
+    async def get_roles(self, keycloak_id: str) -> list[str]:
+        """Retorna as roles de realm de um usuário a partir do mapa em cache."""
+
+        roles_by_user = await self.get_roles_by_user()
+        return roles_by_user.get(keycloak_id, [])
+
+    def invalidate(self) -> None:
+        """Descarta o mapa; a próxima leitura o reconstrói."""
+
+        self._generation += 1
+        self._expires_at = 0.0
+
+    async def _load(self) -> dict[str, list[str]]:
+        admin = await keycloak_admin_client.get()
+        realm_roles = await admin.a_get_realm_roles(brief_representation=True)
+        role_names = [role["name"] for role in realm_roles]
+
+        members_per_role = await asyncio.gather(
+            *(
+                admin.a_get_realm_role_members(
+                    role_name, query={"briefRepresentation": True}
+                )
+                for role_name in role_names
+            )
+        )
+
+        roles_by_user: dict[str, list[str]] = {}
+        for role_name, members in zip(role_names, members_per_role):
+            for member in members:
+                roles_by_user.setdefault(member["id"], []).append(role_name)
+
+        logger.info(
+            f"Mapa de roles de realm carregado: {len(role_names)} roles, "
+            f"{len(roles_by_user)} usuários"
+        )
+        return roles_by_user
+
+
+realm_role_cache = RealmRoleCache(ttl_seconds=settings.REALM_ROLE_CACHE_TTL_SECONDS)
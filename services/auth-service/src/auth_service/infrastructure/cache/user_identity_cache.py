@@ -0,0 +1,121 @@
+"""Cache LRU+TTL da identidade local dos usuários, indexado pelo `sub` do token."""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from auth_service.core.config import settings
+from auth_service.infrastructure.database.models.user_model import User
+
+logger = logging.getLogger(__name__)
+
+IDENTITY_CLAIMS = (
+    "email",
+    "preferred_username",
+    "given_name",
+    "family_name",
+    "email_verified",
+    "picture",
+    "enabled",
+)
+
+
+@dataclass(slots=True)
+class _CachedIdentity:
+    user_id: UUID
+    claims_fingerprint: tuple
+    values: dict[str, Any]
+    expires_at: float
+
+
+class UserIdentityCache:
+    """Evita consultar o banco quando as claims do token não mudaram desde a última sincronização."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _CachedIdentity]" = OrderedDict()
+        self._sub_by_user_id: dict[UUID, str] = {}
+
+    @staticmethod
+    def fingerprint(token_payload: dict[str, Any]) -> tuple:
+        """Extrai as claims que afetam a sincronização do usuário local."""
+
+        return tuple(token_payload.get(claim) for claim in IDENTITY_CLAIMS)
+
+    def get(self, keycloak_id: str, claims_fingerprint: tuple) -> Optional[User]:
+        """Retorna o usuário em cache se as claims forem as mesmas da última sincronização."""
+
+        entry = self._entries.get(keycloak_id)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic() or entry.claims_fingerprint != claims_fingerprint:
+            self._remove(keycloak_id)
+            return None
+
+        self._entries.move_to_end(keycloak_id)
+
+        user = User(**entry.values)
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, keycloak_id: str, claims_fingerprint: tuple, user: User) -> None:
+        """Armazena um snapshot das colunas carregadas do usuário sincronizado."""
+
+        if self.maxsize <= 0 or user.id is None:
+            return
+
+        loaded = sa_inspect(user).dict
+        values = {
+            attr.key: loaded[attr.key]
+            for attr in sa_inspect(User).column_attrs
+            if attr.key in loaded
+        }
+
+        self._remove(keycloak_id)
+        self._entries[keycloak_id] = _CachedIdentity(
+            user_id=user.id,
+            claims_fingerprint=claims_fingerprint,
+            values=values,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._sub_by_user_id[user.id] = keycloak_id
+
+        while len(self._entries) > self.maxsize:
+            _, evicted = self._entries.popitem(last=False)
+            self._sub_by_user_id.pop(evicted.user_id, None)
+
+    def invalidate(self, keycloak_id: Optional[str]) -> None:
+        """Remove a identidade em cache de um `sub`."""
+
+        if keycloak_id:
+            self._remove(keycloak_id)
+
+    def invalidate_user_id(self, user_id: UUID) -> None:
+        """Remove a identidade em cache a partir do ID local do usuário."""
+
+        keycloak_id = self._sub_by_user_id.get(user_id)
+        if keycloak_id:
+            self._remove(keycloak_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sub_by_user_id.clear()
+
+    def _remove(self, keycloak_id: str) -> None:
+        entry = self._entries.pop(keycloak_id, None)
+        if entry is not None:
+            self._sub_by_user_id.pop(entry.user_id, None)
+
+
+user_identity_cache = UserIdentityCache(
+    maxsize=settings.USER_IDENTITY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_IDENTITY_CACHE_TTL_SECONDS,
+)
@@ -10,6 +10,7 @@ from auth_service.infrastructure.database.models.organization_model import (
     OrganizationMember,
     OrganizationOrganizer,
 )
+from auth_service.infrastructure.database.models.outbox_model import NotificationOutbox
 from auth_service.infrastructure.database.models.user_model import User
 
 __all__ = [
@@ -18,6 +19,7 @@ __all__ = [
     "Organization",
     "OrganizationOrganizer",
     "OrganizationMember",
+    "NotificationOutbox",
     "MemberStatus",
     "OrganizationStatus",
     "OrganizationPrivacy",
@@ -0,0 +1,90 @@
+"""Cliente administrativo do Keycloak compartilhado pelo processo."""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from keycloak import KeycloakAdmin
+
+from auth_service.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class KeycloakAdminClient:
+    """Mantém uma única instância de KeycloakAdmin com token e pool de conexões reaproveitados.
+
+    O token da service account é renovado pela própria biblioteca ao atingir 90%
+    do tempo de vida; aqui garantimos que requisições concorrentes disparem uma
+    única renovação.
+    """
+
+    def __init__(self):
+        self._admin: Optional[KeycloakAdmin] = None
+        self._create_lock = threading.Lock()
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._realm_roles: dict[str, dict[str, Any]] = {}
+
+    def get_admin(self) -> KeycloakAdmin:
+        """Retorna a instância compartilhada, criando-a na primeira chamada."""
+
+        if self._admin is None:
+            with self._create_lock:
+                if self._admin is None:
+                    self._admin = KeycloakAdmin(
+                        server_url=settings.KEYCLOAK_URL,
+                        client_id=settings.KEYCLOAK_CLIENT_ID,
+                        client_secret_key=settings.KEYCLOAK_CLIENT_SECRET,
+                        realm_name=settings.KEYCLOAK_REALM,
+                        user_realm_name=settings.KEYCLOAK_REALM,
+                        verify=True,
+                    )
+        return self._admin
+
+    async def get(self) -> KeycloakAdmin:
+        """Retorna a instância compartilhada com um token de service account válido."""
+
+        admin = self.get_admin()
+        connection = admin.connection
+
+        if self._token_expired(connection):
+            if self._token_lock is None:
+                self._token_lock = asyncio.Lock()
+            async with self._token_lock:
+                if self._token_expired(connection):
+                    await connection.a_refresh_token()
+                    logger.debug("Token da service account do Keycloak renovado")
+
+        return admin
+
+    @staticmethod
+    def _token_expired(connection: Any) -> bool:
+        expires_at = connection.expires_at
+        return (
+            connection.token is None
+            or expires_at is None
+            or datetime.now(tz=timezone.utc) >= expires_at
+        )
+
+    async def get_realm_role(self, role_name: str) -> dict[str, Any]:
+        """Obtém a representação de uma role de realm, mantendo-a em cache."""
+
+        role = self._realm_roles.get(role_name)
+        if role is None:
+            admin = await self.get()
+            role = await admin.a_get_realm_role(role_name)
+            self._realm_roles[role_name] = role
+        return role
+
+    async def close(self) -> None:
+        """Fecha os pools HTTP da instância compartilhada."""
+
+        admin, self._admin = self._admin, None
+        self._realm_roles.clear()
+        if admin is not None:
+            await admin.connection.aclose()
+
+
+keycloak_admin_client = KeycloakAdminClient()
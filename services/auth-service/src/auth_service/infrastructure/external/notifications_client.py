@@ -0,0 +1,11 @@
+"""Cliente HTTP compartilhado para o serviço de notificações."""
+
+from common.http import ServiceHttpClient
+
+from auth_service.core.config import settings
+
+notifications_http_client = ServiceHttpClient(
+    name="notifications-service",
+    base_url=settings.NOTIFICATIONS_SERVICE_URL,
+    timeout=settings.NOTIFICATIONS_SERVICE_TIMEOUT,
+)
@@ -0,0 +1,11 @@
+"""Módulo do outbox transacional de notificações."""
+
+from auth_service.infrastructure.outbox.notification_dispatcher import (
+    NotificationOutboxDispatcher,
+    notification_outbox_dispatcher,
+)
+
+__all__ = [
+    "NotificationOutboxDispatcher",
+    "notification_outbox_dispatcher",
+]
@@ -0,0 +1,153 @@
+"""Despachante em background do outbox de notificações."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import httpx
+from database.client import db
+
+from auth_service.core.config import settings
+from auth_service.infrastructure.database.models.outbox_model import NotificationOutbox
+from auth_service.infrastructure.external.notifications_client import (
+    notifications_http_client,
+)
+from auth_service.infrastructure.repositories.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationOutboxDispatcher:
+    """Drena o outbox em lotes e entrega os eventos ao serviço de notificações.
+
+    Os eventos são reservados e a transação é confirmada antes das chamadas
+    HTTP, para não manter bloqueios nem a conexão do pool durante o envio.
+    Eventos entregues são removidos; falhas transitórias são reagendadas com
+    backoff exponencial até `max_attempts`, e respostas 4xx (exceto 408/429)
+    são definitivas. Em ambos os casos de desistência o evento fica retido
+    para inspeção.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        poll_interval: float = 2.0,
+        max_attempts: int = 10,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        lease_seconds: float = 60.0,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def notify(self) -> None:
+        """Acorda o despachante após a confirmação de novos eventos."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._wakeup = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception as e:
+                logger.error(f"Erro ao drenar outbox de notificações: {e}")
+                dispatched = 0
+
+            if dispatched >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_batch(self) -> int:
+        """Envia um lote de eventos pendentes e retorna quantos foram processados."""
+        async with db.session() as session:
+            events = await OutboxRepository(session).claim_pending(
+                self.batch_size, self.max_attempts, self.lease_seconds
+            )
+        if not events:
+            return 0
+
+        results = await asyncio.gather(
+            *(self._deliver(event) for event in events),
+            return_exceptions=True,
+        )
+
+        delivered = []
+        async with db.session() as session:
+            repo = OutboxRepository(session)
+            now = datetime.now(tz=timezone.utc)
+            for event, result in zip(events, results):
+                if not isinstance(result, BaseException):
+                    delivered.append(event.id)
+                    continue
+
+                attempt = event.attempts + 1
+                if self._is_permanent(result) or attempt >= self.max_attempts:
+                    await repo.mark_dead(event.id, str(result))
+                    logger.error(
+                        f"Desistindo do evento {event.id} do outbox "
+                        f"(tentativa {attempt}): {result}"
+                    )
+                else:
+                    delay = min(self.backoff_max, self.backoff_base * 2 ** event.attempts)
+                    await repo.mark_failed(event.id, str(result), now + timedelta(seconds=delay))
+                    logger.warning(
+                        f"Falha ao entregar evento {event.id} do outbox "
+                        f"(tentativa {attempt}): {result}"
+                    )
+
+            await repo.delete_many(delivered)
+
+        if delivered:
+            logger.info(f"{len(delivered)} evento(s) do outbox entregues")
+        return len(events)
+
+    @staticmethod
+    def _is_permanent(error: BaseException) -> bool:
+        """Respostas 4xx não mudam com novas tentativas, exceto timeout e rate limit."""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return False
+        status = error.response.status_code
+        return 400 <= status < 500 and status not in (408, 429)
+
+    @staticmethod
+    async def _deliver(event: NotificationOutbox) -> None:
+        response = await notifications_http_client.post(
+            "/notifications/send-batch", json=event.payload
+        )
+        response.raise_for_status()
+
+
+notification_outbox_dispatcher = NotificationOutboxDispatcher(
+    batch_size=settings.NOTIFICATION_OUTBOX_BATCH_SIZE,
+    poll_interval=settings.NOTIFICATION_OUTBOX_POLL_INTERVAL_SECONDS,
+    max_attempts=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+    lease_seconds=settings.NOTIFICATION_OUTBOX_LEASE_SECONDS,
+)
@@ -9,6 +9,7 @@ from auth_service.infrastructure.repositories.organization_organizer_repository
 from auth_service.infrastructure.repositories.organization_repository import (
     OrganizationRepository,
 )
+from auth_service.infrastructure.repositories.outbox_repository import OutboxRepository
 from auth_service.infrastructure.repositories.user_repository import UserRepository
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "OrganizationRepository",
     "OrganizationMemberRepository",
     "OrganizationOrganizerRepository",
+    "OutboxRepository",
 ]
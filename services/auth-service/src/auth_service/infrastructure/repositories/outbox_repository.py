@@ -0,0 +1,100 @@
+"""Implementação PostgreSQL do repositório do outbox de notificações."""
+
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth_service.domain.interfaces.repositories import IOutboxRepository
+from auth_service.infrastructure.database.models.outbox_model import NotificationOutbox
+
+
+class OutboxRepository(IOutboxRepository):
+    """Implementação PostgreSQL do outbox transacional de notificações."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, event_type: str, payload: dict[str, Any]) -> NotificationOutbox:
+        """Registra um evento na transação atual, sem confirmá-la."""
+        event = NotificationOutbox(event_type=event_type, payload=payload)
+        self._session.add(event)
+        return event
+
+    async def claim_pending(
+        self, limit: int, max_attempts: int, lease_seconds: float
+    ) -> Sequence[NotificationOutbox]:
+        """
+        Reserva um lote de eventos prontos para envio.
+
+        Os eventos são bloqueados com SKIP LOCKED e têm `available_at`
+        adiado pelo tempo da reserva; após o commit, nenhuma outra instância
+        os obtém até a reserva expirar. Se o despachante cair durante o
+        envio, os eventos voltam a ficar disponíveis sozinhos.
+        """
+        stmt = (
+            select(NotificationOutbox)
+            .where(
+                NotificationOutbox.available_at <= func.now(),
+                NotificationOutbox.attempts < max_attempts,
+                NotificationOutbox.failed_at.is_(None),
+            )
+            .order_by(NotificationOutbox.available_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        events = (await self._session.execute(stmt)).scalars().all()
+        if not events:
+            return events
+
+        await self._session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_([event.id for event in events]))
+            .values(available_at=func.now() + timedelta(seconds=lease_seconds))
+        )
+        return events
+
+    async def delete_many(self, event_ids: Sequence[UUID]) -> int:
+        """Remove eventos já entregues."""
+        if not event_ids:
+            return 0
+        result = await self._session.execute(
+            delete(NotificationOutbox).where(NotificationOutbox.id.in_(event_ids))
+        )
+        return result.rowcount
+
+    async def mark_failed(
+        self, event_id: UUID, error: str, retry_at: datetime
+    ) -> None:
+        """Registra uma falha de envio e reagenda o evento."""
+        await self._session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id == event_id)
+            .values(
+                attempts=NotificationOutbox.attempts + 1,
+                last_error=error[:1000],
+                available_at=retry_at,
+            )
+        )
+
+    async def mark_dead(self, event_id: UUID, error: str) -> None:
+        """Registra uma falha definitiva; o evento fica retido para inspeção."""
+        await self._session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id == event_id)
+            .values(
+                attempts=NotificationOutbox.attempts + 1,
+                last_error=error[:1000],
+                failed_at=func.now(),
+            )
+        )
+
+    async def commit(self) -> None:
+        """Confirma a transação atual."""
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        """Reverte a transação atual."""
+        await self._session.rollback()
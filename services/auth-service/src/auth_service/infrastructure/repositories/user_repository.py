@@ -42,9 +42,14 @@ class UserRepository(IUserRepository):
         result = await self._session.scalars(stmt)
         return result.all()
 
-    async def get_all(self) -> Sequence[User]:
-        """Obtém todos os usuários (admin)."""
-        stmt = select(User).order_by(User.created_at.desc())
+    async def get_all(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> Sequence[User]:
+        """Obtém todos os usuários, com paginação opcional (admin)."""
+        stmt = select(User).order_by(User.created_at.desc(), User.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        stmt = stmt.offset(offset)
         result = await self._session.scalars(stmt)
         return result.all()
 
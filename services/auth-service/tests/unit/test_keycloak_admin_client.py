@@ -0,0 +1,64 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from auth_service.infrastructure.external.keycloak_admin_client import KeycloakAdminClient
+
+
+class FakeConnection:
+    """Conexão do KeycloakAdmin com token expirado que conta as renovações."""
+
+    def __init__(self):
+        self.token = None
+        self.expires_at = None
+        self.refreshes = 0
+
+    async def a_refresh_token(self):
+        self.refreshes += 1
+        await asyncio.sleep(0)
+        self.token = {"access_token": "token"}
+        self.expires_at = datetime.now(tz=timezone.utc) + timedelta(minutes=5)
+
+
+class FakeAdmin:
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.role_lookups = 0
+
+    async def a_get_realm_role(self, role_name):
+        self.role_lookups += 1
+        return {"name": role_name}
+
+
+def _client() -> KeycloakAdminClient:
+    client = KeycloakAdminClient()
+    client._admin = FakeAdmin()
+    return client
+
+
+async def test_concurrent_requests_refresh_the_token_once():
+    client = _client()
+
+    admins = await asyncio.gather(*(client.get() for _ in range(10)))
+
+    assert all(admin is client._admin for admin in admins)
+    assert client._admin.connection.refreshes == 1
+
+
+async def test_valid_token_is_not_refreshed():
+    client = _client()
+    client._admin.connection.token = {"access_token": "token"}
+    client._admin.connection.expires_at = datetime.now(tz=timezone.utc) + timedelta(minutes=5)
+
+    await client.get()
+
+    assert client._admin.connection.refreshes == 0
+
+
+async def test_realm_roles_are_cached():
+    client = _client()
+
+    await client.get_realm_role("user")
+    await client.get_realm_role("user")
+
+    assert client._admin.role_lookups == 1
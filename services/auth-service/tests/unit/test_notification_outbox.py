@@ -0,0 +1,192 @@
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from auth_service.domain.services.organization_service import OrganizationService
+from auth_service.infrastructure.database.models.outbox_model import NotificationOutbox
+from auth_service.infrastructure.outbox import notification_dispatcher as dispatcher_module
+from auth_service.infrastructure.outbox.notification_dispatcher import (
+    NotificationOutboxDispatcher,
+)
+
+
+class FakeOutboxRepository:
+    """Outbox em memória que registra as chamadas feitas pelo serviço e pelo despachante."""
+
+    def __init__(self, pending=()):
+        self.pending = list(pending)
+        self.added = []
+        self.deleted = []
+        self.failed = []
+        self.dead = []
+
+    async def add(self, event_type, payload):
+        self.added.append((event_type, payload))
+
+    async def claim_pending(self, limit, max_attempts, lease_seconds):
+        claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        return claimed
+
+    async def delete_many(self, event_ids):
+        self.deleted.extend(event_ids)
+        return len(event_ids)
+
+    async def mark_failed(self, event_id, error, retry_at):
+        self.failed.append(event_id)
+
+    async def mark_dead(self, event_id, error):
+        self.dead.append(event_id)
+
+
+class FakeDatabase:
+    """Substitui o `db` do despachante, contando as sessões abertas."""
+
+    def __init__(self):
+        self.open_sessions = 0
+
+    @asynccontextmanager
+    async def session(self):
+        self.open_sessions += 1
+        try:
+            yield None
+        finally:
+            self.open_sessions -= 1
+
+
+class FakeNotificationsClient:
+    """Responde cada envio com o status definido para o evento."""
+
+    def __init__(self, database, statuses):
+        self.database = database
+        self.statuses = statuses
+        self.sessions_during_post = []
+
+    async def post(self, path, json):
+        self.sessions_during_post.append(self.database.open_sessions)
+        status = self.statuses[json["id"]]
+        return httpx.Response(status, request=httpx.Request("POST", f"http://notifications{path}"))
+
+
+def _event(attempts=0):
+    event_id = uuid.uuid4()
+    return NotificationOutbox(
+        id=event_id, event_type="test", payload={"id": str(event_id)}, attempts=attempts
+    )
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    """Instala o outbox, o banco e o cliente HTTP falsos no módulo do despachante."""
+
+    def install(events, statuses):
+        repo = FakeOutboxRepository(events)
+        database = FakeDatabase()
+        client = FakeNotificationsClient(
+            database, {str(event.id): statuses[i] for i, event in enumerate(events)}
+        )
+        monkeypatch.setattr(dispatcher_module, "db", database)
+        monkeypatch.setattr(dispatcher_module, "OutboxRepository", lambda session: repo)
+        monkeypatch.setattr(dispatcher_module, "notifications_http_client", client)
+        return repo, client
+
+    return install
+
+
+async def test_dispatch_deletes_delivered_events_outside_the_claim_transaction(outbox):
+    events = [_event(), _event()]
+    repo, client = outbox(events, [202, 202])
+
+    processed = await NotificationOutboxDispatcher().dispatch_batch()
+
+    assert processed == 2
+    assert repo.deleted == [event.id for event in events]
+    assert client.sessions_during_post == [0, 0]
+
+
+async def test_dispatch_retries_transient_failures(outbox):
+    unavailable, rate_limited = _event(), _event()
+    repo, _ = outbox([unavailable, rate_limited], [503, 429])
+
+    await NotificationOutboxDispatcher().dispatch_batch()
+
+    assert repo.failed == [unavailable.id, rate_limited.id]
+    assert repo.dead == []
+    assert repo.deleted == []
+
+
+async def test_dispatch_gives_up_on_client_errors(outbox):
+    invalid = _event()
+    repo, _ = outbox([invalid], [422])
+
+    await NotificationOutboxDispatcher().dispatch_batch()
+
+    assert repo.dead == [invalid.id]
+    assert repo.failed == []
+
+
+async def test_dispatch_gives_up_after_max_attempts(outbox):
+    last_try, retry = _event(attempts=2), _event(attempts=1)
+    repo, _ = outbox([last_try, retry], [503, 503])
+
+    await NotificationOutboxDispatcher(max_attempts=3).dispatch_batch()
+
+    assert repo.dead == [last_try.id]
+    assert repo.failed == [retry.id]
+
+
+async def test_dispatch_without_pending_events(outbox):
+    repo, client = outbox([], [])
+
+    assert await NotificationOutboxDispatcher().dispatch_batch() == 0
+    assert client.sessions_during_post == []
+
+
+def _organization_service(outbox_repository):
+    return OrganizationService(
+        org_repository=None,
+        member_repository=None,
+        organizer_repository=None,
+        user_repository=None,
+        outbox_repository=outbox_repository,
+    )
+
+
+async def test_enqueue_splits_recipients_by_batch_limit(monkeypatch):
+    monkeypatch.setattr(
+        "auth_service.domain.services.organization_service.settings.NOTIFICATION_BATCH_MAX_RECIPIENTS",
+        5000,
+    )
+    repo = FakeOutboxRepository()
+    organization = SimpleNamespace(id=uuid.uuid4(), name="Org", slug="org")
+    user_ids = [uuid.uuid4() for _ in range(12001)]
+
+    await _organization_service(repo)._enqueue_notification_batch(
+        user_ids=user_ids + user_ids[:10],
+        notification_type="org_update",
+        title="Título",
+        message="Mensagem",
+        organization=organization,
+    )
+
+    sizes = [len(payload["user_ids"]) for _, payload in repo.added]
+    assert sizes == [5000, 5000, 2001]
+    sent = [user_id for _, payload in repo.added for user_id in payload["user_ids"]]
+    assert sent == [str(user_id) for user_id in user_ids]
+
+
+async def test_enqueue_without_recipients_adds_nothing():
+    repo = FakeOutboxRepository()
+    organization = SimpleNamespace(id=uuid.uuid4(), name="Org", slug="org")
+
+    await _organization_service(repo)._enqueue_notification_batch(
+        user_ids=[],
+        notification_type="org_update",
+        title="Título",
+        message="Mensagem",
+        organization=organization,
+    )
+
+    assert repo.added == []
@@ -0,0 +1,75 @@
+import sys
+import uuid
+
+from auth_service.infrastructure.cache.user_identity_cache import UserIdentityCache
+from auth_service.infrastructure.database.models.user_model import User
+
+
+def _user(email: str = "ana@example.com") -> User:
+    return User(id=uuid.uuid4(), keycloak_id=str(uuid.uuid4()), email=email, enabled=True)
+
+
+def _claims(email: str = "ana@example.com") -> dict:
+    return {"sub": "sub", "email": email, "preferred_username": "ana", "enabled": True}
+
+
+def test_returns_detached_copy_while_claims_are_unchanged():
+    cache = UserIdentityCache(maxsize=10, ttl_seconds=60)
+    user = _user()
+    cache.set(user.keycloak_id, cache.fingerprint(_claims()), user)
+
+    cached = cache.get(user.keycloak_id, cache.fingerprint(_claims()))
+
+    assert cached is not user
+    assert (cached.id, cached.email) == (user.id, user.email)
+
+
+def test_changed_claims_miss_and_drop_the_entry():
+    cache = UserIdentityCache(maxsize=10, ttl_seconds=60)
+    user = _user()
+    cache.set(user.keycloak_id, cache.fingerprint(_claims()), user)
+
+    assert cache.get(user.keycloak_id, cache.fingerprint(_claims("novo@example.com"))) is None
+    assert cache.get(user.keycloak_id, cache.fingerprint(_claims())) is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    # O pacote reexporta a instância com o mesmo nome do módulo
+    cache_module = sys.modules[UserIdentityCache.__module__]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = UserIdentityCache(maxsize=10, ttl_seconds=60)
+    user = _user()
+    fingerprint = cache.fingerprint(_claims())
+    cache.set(user.keycloak_id, fingerprint, user)
+
+    now[0] = 159.0
+    assert cache.get(user.keycloak_id, fingerprint) is not None
+    now[0] = 160.0
+    assert cache.get(user.keycloak_id, fingerprint) is None
+
+
+def test_invalidate_by_local_user_id():
+    cache = UserIdentityCache(maxsize=10, ttl_seconds=60)
+    user = _user()
+    fingerprint = cache.fingerprint(_claims())
+    cache.set(user.keycloak_id, fingerprint, user)
+
+    cache.invalidate_user_id(user.id)
+
+    assert cache.get(user.keycloak_id, fingerprint) is None
+
+
+def test_evicts_least_recently_used():
+    cache = UserIdentityCache(maxsize=2, ttl_seconds=60)
+    fingerprint = cache.fingerprint(_claims())
+    first, second, third = _user(), _user(), _user()
+    cache.set(first.keycloak_id, fingerprint, first)
+    cache.set(second.keycloak_id, fingerprint, second)
+    cache.get(first.keycloak_id, fingerprint)
+
+    cache.set(third.keycloak_id, fingerprint, third)
+
+    assert cache.get(second.keycloak_id, fingerprint) is None
+    assert cache.get(first.keycloak_id, fingerprint) is not None
+    assert cache.get(third.keycloak_id, fingerprint) is not None
@@ -0,0 +1,32 @@
+"""ruleset_points
+
+Revision ID: 4f6a9c2d8e15
+Revises: c3b7e68d2bce
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f6a9c2d8e15'
+down_revision: Union[str, Sequence[str], None] = 'c3b7e68d2bce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sport_rulesets', sa.Column('points_per_win', sa.Integer(), server_default='3', nullable=False))
+    op.add_column('sport_rulesets', sa.Column('points_per_draw', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('sport_rulesets', sa.Column('points_per_loss', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('sport_rulesets', 'points_per_loss')
+    op.drop_column('sport_rulesets', 'points_per_draw')
+    op.drop_column('sport_rulesets', 'points_per_win')
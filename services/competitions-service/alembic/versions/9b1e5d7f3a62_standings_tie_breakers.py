@@ -0,0 +1,30 @@
+"""standings_tie_breakers
+
+Revision ID: 9b1e5d7f3a62
+Revises: 4f6a9c2d8e15
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1e5d7f3a62'
+down_revision: Union[str, Sequence[str], None] = '4f6a9c2d8e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sport_rulesets', sa.Column('tie_breakers', sa.String(length=200), nullable=True))
+    op.add_column('classifications', sa.Column('position', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('classifications', 'position')
+    op.drop_column('sport_rulesets', 'tie_breakers')
@@ -0,0 +1,45 @@
+"""match_next_match
+
+Revision ID: d5a8e3c1b7f4
+Revises: 9b1e5d7f3a62
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8e3c1b7f4'
+down_revision: Union[str, Sequence[str], None] = '9b1e5d7f3a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('matches', sa.Column('next_match_id', sa.UUID(), nullable=True))
+    op.add_column('matches', sa.Column('next_match_slot', sa.String(length=4), nullable=True))
+    op.create_foreign_key(
+        'matches_next_match_id_fkey', 'matches', 'matches', ['next_match_id'], ['id'],
+        deferrable=True, initially='DEFERRED'
+    )
+
+    # Preenche o índice de avanço a partir dos alimentadores já existentes
+    op.execute(
+        "UPDATE matches AS m SET next_match_id = n.id, next_match_slot = 'home' "
+        "FROM matches AS n WHERE n.home_feeder_match_id = m.id"
+    )
+    op.execute(
+        "UPDATE matches AS m SET next_match_id = n.id, next_match_slot = 'away' "
+        "FROM matches AS n WHERE n.away_feeder_match_id = m.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('matches_next_match_id_fkey', 'matches', type_='foreignkey')
+    op.drop_column('matches', 'next_match_slot')
+    op.drop_column('matches', 'next_match_id')
@@ -0,0 +1,27 @@
+"""
+Critérios de desempate da classificação, compartilhados pelo ruleset
+(validação no schema) e pelo cálculo da classificação.
+"""
+from typing import Optional, Tuple
+
+DEFAULT_TIE_BREAKERS = ("points", "wins", "score_balance", "score_pro")
+
+TIE_BREAKERS = {
+    "points", "wins", "draws", "score_balance", "score_pro", "score_against",
+    # Confronto direto: mini-tabela só com os jogos entre os times ainda empatados
+    "h2h_points", "h2h_score_balance", "h2h_score_pro",
+}
+
+# Critérios em que o menor valor leva vantagem
+LOWER_IS_BETTER = {"score_against"}
+
+def parse_tie_breakers(value: Optional[str]) -> Tuple[str, ...]:
+    """Converte a lista de critérios do ruleset ("points,h2h_points,...") em tupla."""
+    if not value:
+        return DEFAULT_TIE_BREAKERS
+
+    criteria = tuple(c.strip() for c in value.split(",") if c.strip())
+    unknown = [c for c in criteria if c not in TIE_BREAKERS]
+    if unknown:
+        raise ValueError(f"Critérios de desempate desconhecidos: {', '.join(unknown)}")
+    return criteria or DEFAULT_TIE_BREAKERS
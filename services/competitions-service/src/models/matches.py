@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 
 # Enums para status
 class MatchStatus(str, enum.Enum):
+    PENDING = "pending"     # Aguardando definição dos times (mata-mata)
     SCHEDULED = "scheduled" 
     LIVE = "live"           
     FINISHED = "finished"   
@@ -56,6 +57,13 @@ class MatchModel(Base):
     # Feeders (Auto-relacionamento)
     home_feeder_match_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("matches.id"), nullable=True)
     away_feeder_match_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("matches.id"), nullable=True)
+
+    # Índice de avanço: jogo e lado ("home"/"away") que recebem o vencedor.
+    # FK adiável porque o jogo seguinte é gravado no mesmo lote, depois deste.
+    next_match_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        ForeignKey("matches.id", deferrable=True, initially="DEFERRED"), nullable=True
+    )
+    next_match_slot: Mapped[Optional[str]] = mapped_column(String(4), nullable=True)
     
     # Dados da Partida
     local: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -1,6 +1,6 @@
 from sqlalchemy import String, Integer, ForeignKey, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from src.models.base import Base
 
@@ -22,6 +22,14 @@ class SportRulesetModel(Base):
     
     has_break_segments: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # Pontuação da classificação
+    points_per_win: Mapped[int] = mapped_column(Integer, default=3, server_default="3")
+    points_per_draw: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    points_per_loss: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    # Critérios de desempate em ordem, separados por vírgula (ex: "points,h2h_points,score_balance")
+    tie_breakers: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+
     competitions: Mapped[List["CompetitionModel"]] = relationship(
         "CompetitionModel", 
         back_populates="sport_ruleset"
@@ -26,6 +26,7 @@ class ClassificationModel(Base):
     score_pro: Mapped[int] = mapped_column(Integer, default=0) 
     score_against: Mapped[int] = mapped_column(Integer, default=0) 
     score_balance: Mapped[int] = mapped_column(Integer, default=0) 
+    position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     team: Mapped["TeamModel"] = relationship("TeamModel")
     group: Mapped["GroupModel"] = relationship("GroupModel")
\ No newline at end of file
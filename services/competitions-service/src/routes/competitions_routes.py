@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 # Ajuste o import do db conforme sua estrutura (src.core.client ou src.dependencies)
 from src.routes.routes import get_session
 from src.services.competitions_service import CompetitionService
 from src.services.competition_generator.competition_generator import StructureGeneratorService
+from src.services.standings_service import StandingsService
 from src.schemas.competition_schema import (
     CompetitionCreate, 
     CompetitionResponse, 
-    CompetitionUpdate
+    CompetitionUpdate,
+    StructurePreviewResponse
 )
 
 router = APIRouter(prefix="/competitions", tags=["Competitions"])
@@ -64,6 +66,7 @@ async def get_competition(
 )
 async def generate_structure(
     competition_id: int,
+    seed: Optional[int] = Query(None, description="Semente do sorteio (a mesma da prévia)"),
     session: AsyncSession = Depends(get_session)
 ):
     """
@@ -71,4 +74,42 @@ async def generate_structure(
     Muda o status da competição para ACTIVE.
     """
     service = StructureGeneratorService(session)
-    return await service.generate_structure(competition_id)
\ No newline at end of file
+    return await service.generate_structure(competition_id, seed)
+
+@router.post(
+    "/{competition_id}/preview-structure",
+    response_model=StructurePreviewResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Prévia da estrutura sem gravar"
+)
+async def preview_structure(
+    competition_id: int,
+    seed: Optional[int] = Query(None, description="Semente do sorteio"),
+    teams_per_group: Optional[int] = Query(None, ge=1, description="Simular outro tamanho de grupo"),
+    teams_qualified_per_group: Optional[int] = Query(None, ge=1, description="Simular outro número de classificados"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Calcula rodadas, jogos, alimentadores e segmentos em memória, sem escrever no banco.
+    Os parâmetros de simulação não são salvos: `generate-structure` com a `seed`
+    retornada reproduz o sorteio com as configurações da competição.
+    """
+    service = StructureGeneratorService(session)
+    return await service.preview_structure(competition_id, seed, teams_per_group, teams_qualified_per_group)
+
+@router.post(
+    "/{competition_id}/standings/recompute",
+    status_code=status.HTTP_200_OK,
+    summary="Recalcular a classificação a partir dos jogos"
+)
+async def recompute_standings(
+    competition_id: int,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Reconstrói pontos, vitórias, saldos e posições de todos os times a partir
+    dos jogos encerrados, aplicando os critérios de desempate do ruleset
+    (inclusive confronto direto). Para auditorias e correções.
+    """
+    service = StandingsService(session)
+    return await service.recompute(competition_id)
@@ -6,7 +6,7 @@ import uuid
 
 from src.routes.routes import get_session
 from src.services.matches_service import MatchesService
-from src.schemas.matches_schema import MatchOrgResponse, MatchPeriodFilter, MatchResponse, MatchUpdateRequest
+from src.schemas.matches_schema import MatchOrgResponse, MatchPeriodFilter, MatchResponse, MatchResultRequest, MatchUpdateRequest
 from src.services.rounds_service import RoundsService
 from src.schemas.rounds_schema import RoundMatchesResponse
 
@@ -141,4 +141,22 @@ async def update_match(
         raise HTTPException(status_code=400, detail="ID de jogo inválido.")
 
     service = MatchesService(session)
-    return await service.update_match_details(match_uuid, update_data)
\ No newline at end of file
+    return await service.update_match_details(match_uuid, update_data)
+
+@router.put(
+    "/{match_id}/result",
+    response_model=MatchResponse,
+    summary="Lançar ou corrigir o resultado do jogo"
+)
+async def submit_match_result(
+    match_id: uuid.UUID,
+    result_data: MatchResultRequest,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Registra o placar final e encerra o jogo.
+    - Atualiza a classificação dos dois times de forma incremental.
+    - Pode ser chamado de novo para corrigir o placar, sem duplicar pontos.
+    """
+    service = MatchesService(session)
+    return await service.submit_result(match_id, result_data)
@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+import uuid
 
 from src.models.competition import CompetitionStatus, CompetitionSystem
+from src.models.matches import MatchStatus
+from src.core.tie_breakers import parse_tie_breakers
 
 
 class SportRulesetBase(BaseModel):
@@ -12,6 +15,20 @@ class SportRulesetBase(BaseModel):
     overtime_segments: int = Field(default=0, ge=0, description="Número de tempos de prorrogação")
     penalty_segments: int = Field(default=0, ge=0, description="Número de séries de pênaltis")
     has_break_segments: bool = Field(default=True, description="Se existe intervalo entre segmentos")
+    points_per_win: int = Field(default=3, ge=0, description="Pontos por vitória")
+    points_per_draw: int = Field(default=1, ge=0, description="Pontos por empate")
+    points_per_loss: int = Field(default=0, ge=0, description="Pontos por derrota")
+    tie_breakers: Optional[str] = Field(
+        None, max_length=200,
+        description="Critérios de desempate em ordem (ex: points,h2h_points,score_balance,score_pro)"
+    )
+
+    @field_validator("tie_breakers")
+    @classmethod
+    def check_tie_breakers(cls, value: Optional[str]):
+        if value is not None:
+            parse_tie_breakers(value)
+        return value
 
 class SportRulesetCreate(SportRulesetBase):
     pass
@@ -80,4 +97,43 @@ class CompetitionResponse(CompetitionBase):
     sport_ruleset_id: int    
     sport_ruleset: Optional[SportRulesetResponse] = None
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class PlannedGroupResponse(BaseModel):
+    index: int
+    name: str
+    team_ids: List[uuid.UUID]
+    model_config = ConfigDict(from_attributes=True)
+
+class PlannedRoundResponse(BaseModel):
+    index: int
+    name: str
+    group_index: Optional[int] = None
+    model_config = ConfigDict(from_attributes=True)
+
+class PlannedMatchResponse(BaseModel):
+    id: uuid.UUID
+    round_index: int
+    round_number_match: int
+    group_index: Optional[int] = None
+    home_team_id: Optional[uuid.UUID] = None
+    away_team_id: Optional[uuid.UUID] = None
+    home_feeder_match_id: Optional[uuid.UUID] = None
+    away_feeder_match_id: Optional[uuid.UUID] = None
+    next_match_id: Optional[uuid.UUID] = None
+    next_match_slot: Optional[str] = None
+    status: MatchStatus
+    has_overtime: bool
+    has_penalties: bool
+    model_config = ConfigDict(from_attributes=True)
+
+class StructurePreviewResponse(BaseModel):
+    """Prévia da estrutura; gere com a mesma `seed` para gravar exatamente este sorteio."""
+    system: CompetitionSystem
+    seed: int
+    segments: List[tuple[int, str]]
+    total_segments: int
+    groups: List[PlannedGroupResponse]
+    rounds: List[PlannedRoundResponse]
+    matches: List[PlannedMatchResponse]
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from datetime import datetime
 from typing import Optional, List
 import uuid
@@ -40,6 +40,9 @@ class MatchOrgResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+# Validador pré-construído para as listagens montadas a partir de projeções planas
+MatchOrgListAdapter = TypeAdapter(List[MatchOrgResponse])
+
 class RoundSummary(BaseModel):
     id: int
     name: str
@@ -67,4 +70,11 @@ class MatchUpdateRequest(BaseModel):
     scheduled_datetime: Optional[datetime] = Field(None, description="Nova data e hora do jogo (ISO 8601)")
     local: Optional[str] = Field(None, description="Novo local da partida")
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class MatchResultRequest(BaseModel):
+    home_score: int = Field(..., ge=0, description="Placar final do mandante")
+    away_score: int = Field(..., ge=0, description="Placar final do visitante")
+    winner_team_id: Optional[uuid.UUID] = Field(
+        None, description="Vencedor em caso de empate no placar (pênaltis/prorrogação no mata-mata)"
+    )
@@ -0,0 +1,57 @@
+import uuid
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import case, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.matches import MatchModel, MatchStatus
+
+async def advance_winner(
+    session: AsyncSession,
+    match: MatchModel,
+    previous_winner_id: Optional[uuid.UUID],
+    winner_team_id: Optional[uuid.UUID]
+) -> Optional[uuid.UUID]:
+    """
+    Leva o vencedor de um jogo de mata-mata para o lado certo do jogo seguinte,
+    usando o índice de avanço (`next_match_id`/`next_match_slot`): um único
+    UPDATE pela chave primária, sem procurar quem referencia o jogo.
+
+    O jogo seguinte passa a SCHEDULED quando os dois times estão definidos.
+    Numa correção que troca o vencedor, o lado é sobrescrito, desde que o
+    jogo seguinte ainda não tenha começado.
+    Retorna o id do jogo seguinte atualizado (ou None).
+    """
+    if match.next_match_id is None or match.next_match_slot not in ("home", "away"):
+        return None
+    if winner_team_id == previous_winner_id:
+        return None
+
+    matches = MatchModel.__table__
+    other_slot = "away" if match.next_match_slot == "home" else "home"
+    other_team = matches.c[f"{other_slot}_team_id"]
+
+    if winner_team_id is None:
+        status = MatchStatus.PENDING.value
+    else:
+        status = case(
+            (other_team.is_not(None), MatchStatus.SCHEDULED.value),
+            else_=MatchStatus.PENDING.value
+        )
+
+    result = await session.execute(
+        update(matches)
+        .where(
+            matches.c.id == match.next_match_id,
+            matches.c.status.in_([MatchStatus.PENDING.value, MatchStatus.SCHEDULED.value])
+        )
+        .values({f"{match.next_match_slot}_team_id": winner_team_id, "status": status})
+        .returning(matches.c.id)
+    )
+    next_match_id = result.scalar_one_or_none()
+
+    if next_match_id is None:
+        raise HTTPException(
+            status_code=400,
+            detail="O jogo seguinte do chaveamento já começou; não é possível alterar o vencedor."
+        )
+    return next_match_id
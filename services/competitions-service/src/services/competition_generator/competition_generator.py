@@ -1,21 +1,21 @@
+from typing import Optional
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.competition import CompetitionModel, CompetitionSystem, CompetitionStatus
+from src.models.competition import CompetitionModel, CompetitionStatus
 from src.models.teams import TeamModel
 
 from .standings_manager import initialize_standings
-from .generate_league import GenerateLeagueCompetitionService as LeagueService
-from .generate_elimination import GenerateEliminationCompetitionService as EliminationService
-from .generate_group import GenerateGroupCompetitionService as GroupService
+from .generate_competitions_utils import CompetitionGeneratorUtils as util
+from .structure_planner import StructurePlan, plan_structure, segment_template
 
 class StructureGeneratorService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def generate_structure(self, competition_id: int):
+    async def _load(self, competition_id: int):
         query = (
             select(CompetitionModel)
             .options(selectinload(CompetitionModel.sport_ruleset))
@@ -34,30 +34,113 @@ class StructureGeneratorService:
         if not competition.sport_ruleset:
             raise HTTPException(status_code=400, detail="A competição precisa de um Ruleset configurado.")
 
-        teams_query = select(TeamModel).where(TeamModel.competition_id == competition_id)
+        teams_query = select(TeamModel).where(TeamModel.competition_id == competition_id).order_by(TeamModel.id)
         teams_result = await self.session.execute(teams_query)
         teams = list(teams_result.scalars().all())
 
         if len(teams) < 2:
             raise HTTPException(status_code=400, detail="Mínimo de 2 times necessários.")
 
-        await initialize_standings(self.session, competition, teams)
+        return competition, teams
 
-        if competition.system == CompetitionSystem.POINTS:
-            league_service = LeagueService(self.session)
-            await league_service.generate_league_system(competition, teams)
+    def _plan(
+        self,
+        competition: CompetitionModel,
+        teams: list,
+        seed: Optional[int] = None,
+        teams_per_group: Optional[int] = None,
+        teams_qualified_per_group: Optional[int] = None
+    ) -> StructurePlan:
+        ruleset = competition.sport_ruleset
+        try:
+            return plan_structure(
+                competition.system,
+                [team.id for team in teams],
+                segment_template(
+                    ruleset.segment_type,
+                    ruleset.segments_regular_number,
+                    ruleset.overtime_segments,
+                    ruleset.penalty_segments
+                ),
+                teams_per_group=teams_per_group or competition.teams_per_group,
+                qualified_per_group=teams_qualified_per_group or competition.teams_qualified_per_group,
+                seed=seed
+            )
+        except NotImplementedError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        elif competition.system == CompetitionSystem.ELIMINATION:
-            elimination_service = EliminationService(self.session)
-            await elimination_service.generate_elimination_system(competition, teams)
-        elif competition.system == CompetitionSystem.MIXED:
-            group_service = GroupService(self.session)
-            await group_service.generate_groups_elimination_system(competition, teams)
-        else:
-            raise HTTPException(status_code=501, detail="Sistema de disputa ainda não implementado.")
+    async def preview_structure(
+        self,
+        competition_id: int,
+        seed: Optional[int] = None,
+        teams_per_group: Optional[int] = None,
+        teams_qualified_per_group: Optional[int] = None
+    ) -> StructurePlan:
+        """
+        Calcula a estrutura sem gravar nada.
+        Gerar depois com a mesma `seed` (e as mesmas configurações) reproduz o sorteio.
+        """
+        competition, teams = await self._load(competition_id)
+        return self._plan(competition, teams, seed, teams_per_group, teams_qualified_per_group)
+
+    async def generate_structure(self, competition_id: int, seed: Optional[int] = None):
+        competition, teams = await self._load(competition_id)
+        plan = self._plan(competition, teams, seed)
+
+        await self._persist(competition, teams, plan)
 
         competition.status = CompetitionStatus.STARTED if hasattr(CompetitionStatus, 'STARTED') else "STARTED"
         self.session.add(competition)
-        
+
         await self.session.commit()
-        return {"message": "Estrutura gerada com sucesso", "system": competition.system}
\ No newline at end of file
+        return {"message": "Estrutura gerada com sucesso", "system": competition.system, "seed": plan.seed}
+
+    async def _persist(self, competition: CompetitionModel, teams: list, plan: StructurePlan):
+        """Grava o plano em lote: grupos, classificação, rodadas, jogos e segmentos."""
+        group_ids = await util.insert_groups(self.session, competition.id, [g.name for g in plan.groups])
+        group_by_team = {
+            team_id: group_ids[group.index]
+            for group in plan.groups
+            for team_id in group.team_ids
+        }
+
+        await initialize_standings(self.session, competition, teams, group_by_team)
+
+        round_ids = await util.insert_rounds(self.session, competition.id, [r.name for r in plan.rounds])
+
+        matches = [
+            {
+                "id": m.id,
+                "competition_id": competition.id,
+                "group_id": group_ids[m.group_index] if m.group_index is not None else None,
+                "round_id": round_ids[m.round_index],
+                "round_number_match": m.round_number_match,
+                "home_team_id": m.home_team_id,
+                "away_team_id": m.away_team_id,
+                "home_feeder_match_id": m.home_feeder_match_id,
+                "away_feeder_match_id": m.away_feeder_match_id,
+                "next_match_id": m.next_match_id,
+                "next_match_slot": m.next_match_slot,
+                "local": "A definir",
+                "status": m.status.value,
+                "home_score": 0,
+                "away_score": 0,
+                "has_penalties": m.has_penalties,
+                "has_overtime": m.has_overtime,
+            }
+            for m in plan.matches
+        ]
+        segments = [
+            {
+                "match_id": m.id,
+                "segment_number": number,
+                "segment_type": segment_type,
+                "home_score": 0, "away_score": 0, "finished": False
+            }
+            for m in plan.matches
+            for number, segment_type in plan.segments
+        ]
+
+        await util.insert_matches(self.session, matches, segments)
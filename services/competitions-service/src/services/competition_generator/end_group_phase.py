@@ -1,12 +1,11 @@
 from sqlalchemy.future import select
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import selectinload
-from sqlalchemy import desc
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.competition import CompetitionModel
 from src.models.matches import GroupModel, RoundModel, MatchModel, MatchStatus
-from src.models.standings import ClassificationModel
-from .generate_competitions_utils import CompetitionGeneratorUtils as util
+from src.services.standings_service import StandingsService
 
 
 class EndGroupPhaseService:
@@ -16,18 +15,25 @@ class EndGroupPhaseService:
     async def advance_group_phase(self, competition_id: int):
         """
         Finaliza a fase de grupos:
-        1. Lê a classificação final de cada grupo.
+        1. Recalcula a classificação de todos os grupos a partir dos jogos,
+           com os critérios de desempate do ruleset (inclusive confronto direto),
+           e grava as posições atualizadas.
         2. Determina os cruzamentos (Ex: 1º do A vs 2º do B).
         3. Atualiza os jogos da primeira rodada do mata-mata com os times reais.
+        O número de instruções não depende do número de grupos.
         """
-        query = select(CompetitionModel).where(CompetitionModel.id == competition_id)
+        query = (
+            select(CompetitionModel)
+            .options(selectinload(CompetitionModel.sport_ruleset))
+            .where(CompetitionModel.id == competition_id)
+        )
         result = await self.session.execute(query)
         competition = result.scalar_one_or_none()
         
         if not competition:
             raise HTTPException(status_code=404, detail="Competição não encontrada.")
 
-        QUALIFIED_PER_GROUP = getattr(competition, "teams_qualified_per_group", 2)
+        QUALIFIED_PER_GROUP = competition.teams_qualified_per_group or 2
 
         groups_query = select(GroupModel).where(GroupModel.competition_id == competition.id).order_by(GroupModel.name)
         groups_result = await self.session.execute(groups_query)
@@ -36,62 +42,43 @@ class EndGroupPhaseService:
         if not groups:
             raise HTTPException(status_code=400, detail="Esta competição não possui grupos para avançar.")
 
-        placeholder_map = {}
-        
-        for group in groups:
-            standings_query = (
-                select(ClassificationModel)
-                .where(ClassificationModel.group_id == group.id)
-                .order_by(
-                    desc(ClassificationModel.points),
-                    desc(ClassificationModel.wins),
-                    desc(ClassificationModel.score_balance),
-                    desc(ClassificationModel.score_pro)
-                )
-                .options(selectinload(ClassificationModel.team))
-                .limit(QUALIFIED_PER_GROUP)
-            )
-            
-            standings_result = await self.session.execute(standings_query)
-            top_teams_classification = standings_result.scalars().all()
+        # 1. Classificação de todos os grupos em um único recálculo
+        rows, positions, _ = await StandingsService(self.session).refresh(competition)
 
-            if len(top_teams_classification) < QUALIFIED_PER_GROUP:
+        group_names = {group.id: group.name for group in groups}
+        placeholder_map = {
+            f"{position}º {group_names[row.group_id]}": row.team_id
+            for row, position in zip(rows, positions)
+            if row.group_id in group_names and position <= QUALIFIED_PER_GROUP
+        }
+
+        for group in groups:
+            if f"{QUALIFIED_PER_GROUP}º {group.name}" not in placeholder_map:
                 raise HTTPException(
                     status_code=400, 
                     detail=f"O grupo {group.name} não tem times suficientes classificados (esperado {QUALIFIED_PER_GROUP})."
                 )
 
-            for pos, classification in enumerate(top_teams_classification, start=1):
-                key = f"{pos}º {group.name}"
-                placeholder_map[key] = classification.team
-
         clashes = self._create_clashes(groups, QUALIFIED_PER_GROUP)
-
         total_qualified = len(groups) * QUALIFIED_PER_GROUP
-        
-        elimination_names = util.get_elimination_round_names(total_qualified)
-        if not elimination_names:
-             raise HTTPException(status_code=400, detail="Erro ao calcular fases eliminatórias.")
-             
-        first_round_name = elimination_names[0]
-
-        round_query = select(RoundModel).where(
-            RoundModel.competition_id == competition.id,
-            RoundModel.name.contains(first_round_name) 
-        )
-        round_result = await self.session.execute(round_query)
-        target_round = round_result.scalar_one_or_none()
-
-        if not target_round:
-             raise HTTPException(status_code=404, detail=f"Rodada '{first_round_name}' não encontrada no banco.")
 
+        # 2. Primeira rodada do mata-mata pela estrutura: jogos fora dos grupos
+        #    e sem alimentadores (os demais recebem times pelo avanço do vencedor)
         matches_query = (
-            select(MatchModel)
-            .where(MatchModel.round_id == target_round.id)
+            select(MatchModel.id, RoundModel.name)
+            .join(RoundModel, MatchModel.round_id == RoundModel.id)
+            .where(
+                MatchModel.competition_id == competition.id,
+                MatchModel.group_id.is_(None),
+                MatchModel.home_feeder_match_id.is_(None),
+                MatchModel.away_feeder_match_id.is_(None)
+            )
             .order_by(MatchModel.round_number_match)
         )
-        matches_result = await self.session.execute(matches_query)
-        matches = matches_result.scalars().all()
+        matches = (await self.session.execute(matches_query)).all()
+
+        if not matches:
+             raise HTTPException(status_code=404, detail="Primeira rodada do mata-mata não encontrada no banco.")
 
         if len(matches) != len(clashes):
             raise HTTPException(
@@ -99,28 +86,32 @@ class EndGroupPhaseService:
                 detail=f"Inconsistência: Temos {len(clashes)} confrontos previstos mas {len(matches)} jogos na rodada."
             )
 
-        matches_updated = 0
-        for i, match in enumerate(matches):
-            home_placeholder, away_placeholder = clashes[i]
-            
-            home_team = placeholder_map.get(home_placeholder)
-            away_team = placeholder_map.get(away_placeholder)
-            
-            if home_team and away_team:
-                match.home_team_id = home_team.id
-                match.away_team_id = away_team.id
-                match.status = MatchStatus.SCHEDULED
-                self.session.add(match)
-                matches_updated += 1
-            else:
-                print(f"ERRO: Não encontrei times para o confronto {home_placeholder} x {away_placeholder}")
+        # 3. Atualiza todos os confrontos em lote (executemany)
+        match_table = MatchModel.__table__
+        await self.session.execute(
+            update(match_table)
+            .where(match_table.c.id == bindparam("b_id"))
+            .values(
+                home_team_id=bindparam("b_home_team_id"),
+                away_team_id=bindparam("b_away_team_id"),
+                status=MatchStatus.SCHEDULED.value
+            ),
+            [
+                {
+                    "b_id": match.id,
+                    "b_home_team_id": placeholder_map[home_placeholder],
+                    "b_away_team_id": placeholder_map[away_placeholder]
+                }
+                for match, (home_placeholder, away_placeholder) in zip(matches, clashes)
+            ]
+        )
 
         await self.session.commit()
         return {
             "message": "Fase de grupos finalizada com sucesso.",
             "qualified_teams": total_qualified,
-            "matches_updated": matches_updated,
-            "round_name": first_round_name
+            "matches_updated": len(matches),
+            "round_name": matches[0].name
         }
     
     def _create_clashes(self, groups: list, qualified_per_group: int) -> list:
@@ -131,8 +122,6 @@ class EndGroupPhaseService:
         - Separa os 'Cabeças de Chave' (1ºs lugares) dos 'Potes Baixos' (2ºs lugares).
         - Inverte o pote baixo para cruzar extremos (A vs H, B vs G...).
         """
-        all_placeholders = []
-        
         first_places = []
         second_places = []
         
@@ -1,22 +1,29 @@
-
 from math import log2
-from typing import List
-import uuid
-from src.models.sport_ruleset import SportRulesetModel
-from src.models.matches import SegmentModel
+from typing import Any, Dict, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.models.matches import GroupModel, RoundModel, MatchModel, SegmentModel
+
+Row = Dict[str, Any]
 
 
 class CompetitionGeneratorUtils:
-    """Utilitários para geração de competições."""
-    def get_elimination_round_names(self, num_feeders: int) -> list:
+    """
+    Utilitários para geração de competições.
+
+    A estrutura planejada é gravada com INSERTs em lote (executemany do Core),
+    sem passar pelo unit of work do ORM.
+    """
+    @staticmethod
+    def get_elimination_round_names(num_feeders: int) -> list:
         """Retorna nomes das rodadas baseados no número de participantes da fase."""
         num_rounds = int(log2(num_feeders))
         names = []
-        
+
         round_name_map = {
-            2: "Final", 
-            4: "Semifinais", 
-            8: "Quartas de Final", 
+            2: "Final",
+            4: "Semifinais",
+            8: "Quartas de Final",
             16: "Oitavas de Final"
         }
 
@@ -24,37 +31,38 @@ class CompetitionGeneratorUtils:
             teams_in_round = 2**(num_rounds - i)
             name = round_name_map.get(teams_in_round, f'Fase de {teams_in_round}')
             names.append(name)
-            
+
         return names
 
-    def create_segments_for_match(self, match_id: uuid.UUID, ruleset: SportRulesetModel) -> List[SegmentModel]:
-        """Cria segmentos (tempos/sets) para um jogo baseado no ruleset."""
-        segments = []
-        
-        for seg_num in range(1, ruleset.segments_regular_number + 1):
-            segments.append(SegmentModel(
-                match_id=match_id,
-                segment_number=seg_num,
-                segment_type=ruleset.segment_type,
-                home_score=0, away_score=0, finished=False
-            ))
-        
-        if getattr(ruleset, 'overtime_segments', 0) > 0:
-            for overtime_num in range(1, ruleset.overtime_segments + 1):
-                segments.append(SegmentModel(
-                    match_id=match_id,
-                    segment_number=overtime_num,
-                    segment_type='OVERTIME',
-                    home_score=0, away_score=0, finished=False
-                ))
-
-        if getattr(ruleset, 'penalty_segments', 0) > 0:
-            for penalty_num in range(1, ruleset.penalty_segments + 1):
-                segments.append(SegmentModel(
-                    match_id=match_id,
-                    segment_number=penalty_num,
-                    segment_type='PENALTY',
-                    home_score=0, away_score=0, finished=False
-                ))
-        
-        return segments
\ No newline at end of file
+    @staticmethod
+    async def insert_rounds(session: AsyncSession, competition_id: int, names: List[str]) -> List[int]:
+        """Cria todas as rodadas em um único INSERT ... RETURNING, na ordem de `names`."""
+        if not names:
+            return []
+        result = await session.execute(
+            insert(RoundModel).returning(RoundModel.id, sort_by_parameter_order=True),
+            [{"competition_id": competition_id, "name": name} for name in names]
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def insert_groups(session: AsyncSession, competition_id: int, names: List[str]) -> List[int]:
+        """Cria todos os grupos em um único INSERT ... RETURNING, na ordem de `names`."""
+        if not names:
+            return []
+        result = await session.execute(
+            insert(GroupModel).returning(GroupModel.id, sort_by_parameter_order=True),
+            [{"competition_id": competition_id, "name": name} for name in names]
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def insert_matches(session: AsyncSession, matches: List[Row], segments: List[Row]):
+        """
+        Grava jogos e segmentos em lote.
+        Os jogos devem vir em ordem de rodada: alimentadores antes dos jogos que dependem deles.
+        """
+        if matches:
+            await session.execute(insert(MatchModel), matches)
+        if segments:
+            await session.execute(insert(SegmentModel), segments)
@@ -0,0 +1,95 @@
+from typing import Dict, Sequence, Tuple
+import numpy as np
+
+from src.core.tie_breakers import DEFAULT_TIE_BREAKERS, LOWER_IS_BETTER
+
+def _refine(cluster: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Divide os grupos de empate atuais pelos valores de `key`."""
+    order = np.lexsort((key, cluster))
+    changed = np.empty(len(order), dtype=bool)
+    changed[:1] = True
+    changed[1:] = (cluster[order][1:] != cluster[order][:-1]) | (key[order][1:] != key[order][:-1])
+    refined = np.empty_like(cluster)
+    refined[order] = np.cumsum(changed) - 1
+    return refined
+
+def compute_standings(
+    team_group: Sequence[int],
+    home: Sequence[int],
+    away: Sequence[int],
+    home_score: Sequence[int],
+    away_score: Sequence[int],
+    points_rule: Tuple[int, int, int] = (3, 1, 0),
+    tie_breakers: Sequence[str] = DEFAULT_TIE_BREAKERS,
+) -> Dict[str, np.ndarray]:
+    """
+    Recalcula a classificação inteira a partir dos jogos encerrados, de forma vetorizada.
+
+    Os times são índices 0..n-1; `team_group` diz o grupo de cada um (a posição
+    é calculada dentro do grupo). Cada jogo é uma posição nos arrays
+    `home`/`away`/`home_score`/`away_score`.
+
+    Retorna um array por coluna da classificação, mais `position`.
+    """
+    group = np.asarray(team_group, dtype=np.int64)
+    home = np.asarray(home, dtype=np.intp)
+    away = np.asarray(away, dtype=np.intp)
+    hs = np.asarray(home_score, dtype=np.int64)
+    as_ = np.asarray(away_score, dtype=np.int64)
+    n = len(group)
+
+    def per_team(home_values, away_values) -> np.ndarray:
+        totals = np.bincount(home, weights=home_values, minlength=n)
+        totals += np.bincount(away, weights=away_values, minlength=n)
+        return totals.astype(np.int64)
+
+    home_won, away_won, drawn = hs > as_, as_ > hs, hs == as_
+    win, draw, loss = points_rule
+    home_points = np.where(home_won, win, np.where(drawn, draw, loss))
+    away_points = np.where(away_won, win, np.where(drawn, draw, loss))
+
+    columns = {
+        "games_played": per_team(np.ones_like(hs), np.ones_like(as_)),
+        "wins": per_team(home_won, away_won),
+        "draws": per_team(drawn, drawn),
+        "losses": per_team(away_won, home_won),
+        "score_pro": per_team(hs, as_),
+        "score_against": per_team(as_, hs),
+        "points": per_team(home_points, away_points),
+    }
+    columns["score_balance"] = columns["score_pro"] - columns["score_against"]
+
+    head_to_head = {
+        "h2h_points": (home_points, away_points),
+        "h2h_score_balance": (hs - as_, as_ - hs),
+        "h2h_score_pro": (hs, as_),
+    }
+
+    # Cada critério desempata apenas quem continua empatado nos anteriores
+    cluster = _refine(np.zeros(n, dtype=np.int64), group)
+    keys = []
+    for criterion in tie_breakers:
+        if criterion in head_to_head:
+            same_cluster = cluster[home] == cluster[away]
+            home_values, away_values = head_to_head[criterion]
+            key = per_team(home_values * same_cluster, away_values * same_cluster)
+        else:
+            key = columns[criterion]
+
+        key = key if criterion in LOWER_IS_BETTER else -key
+        keys.append(key)
+        cluster = _refine(cluster, key)
+
+    # np.lexsort ordena pela última chave primeiro: grupo, depois critérios em ordem
+    order = np.lexsort(tuple(reversed(keys)) + (group,))
+    sorted_group = group[order]
+    index = np.arange(n)
+    first_of_group = np.ones(n, dtype=bool)
+    first_of_group[1:] = sorted_group[1:] != sorted_group[:-1]
+    group_start = np.maximum.accumulate(np.where(first_of_group, index, 0)) if n else index
+
+    position = np.empty(n, dtype=np.int64)
+    position[order] = index - group_start + 1
+    columns["position"] = position
+
+    return columns
@@ -1,32 +1,119 @@
+import uuid
+from typing import Dict, Optional, Tuple
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.standings import ClassificationModel
 from src.models.teams import TeamModel
 from src.models.competition import CompetitionModel
+from src.models.sport_ruleset import SportRulesetModel
+
+STANDINGS_COLUMNS = (
+    "points", "games_played", "wins", "draws", "losses",
+    "score_pro", "score_against", "score_balance",
+)
+
+StandingsDelta = Dict[str, int]
 
 async def initialize_standings(
     session: AsyncSession, 
     competition: CompetitionModel, 
-    teams: list[TeamModel]
+    teams: list[TeamModel],
+    group_by_team: Optional[Dict[uuid.UUID, int]] = None
 ):
     """
-    Cria a entrada na tabela de classificação para todos os times da competição.
-    """
-    standings_list = []
-    
-    for team in teams:
-        standing = ClassificationModel(
-            competition_id=competition.id,
-            team_id=team.id,
-            group_id=None,
-            points=0,
-            games_played=0,
-            wins=0,
-            draws=0,
-            losses=0,
-            score_pro=0,
-            score_against=0,
-            score_balance=0
-        )
-        standings_list.append(standing)
+    Cria a entrada na tabela de classificação para todos os times da competição
+    em um único INSERT em lote, já vinculada ao grupo de cada time (se houver).
+    """
+    group_by_team = group_by_team or {}
+    if not teams:
+        return
+
+    await session.execute(
+        insert(ClassificationModel),
+        [
+            {
+                "competition_id": competition.id,
+                "team_id": team.id,
+                "group_id": group_by_team.get(team.id),
+                **{col: 0 for col in STANDINGS_COLUMNS}
+            }
+            for team in teams
+        ]
+    )
+
+def compute_result_delta(
+    home_score: int, 
+    away_score: int, 
+    ruleset: Optional[SportRulesetModel] = None
+) -> Tuple[StandingsDelta, StandingsDelta]:
+    """
+    Calcula o quanto um resultado soma na classificação de cada time.
+    Retorna (delta do mandante, delta do visitante).
+    """
+    points_win = getattr(ruleset, "points_per_win", None)
+    points_draw = getattr(ruleset, "points_per_draw", None)
+    points_loss = getattr(ruleset, "points_per_loss", None)
+    points_win = 3 if points_win is None else points_win
+    points_draw = 1 if points_draw is None else points_draw
+    points_loss = 0 if points_loss is None else points_loss
+
+    def side(pro: int, against: int) -> StandingsDelta:
+        won, drew, lost = int(pro > against), int(pro == against), int(pro < against)
+        return {
+            "points": won * points_win + drew * points_draw + lost * points_loss,
+            "games_played": 1,
+            "wins": won,
+            "draws": drew,
+            "losses": lost,
+            "score_pro": pro,
+            "score_against": against,
+            "score_balance": pro - against,
+        }
+
+    return side(home_score, away_score), side(away_score, home_score)
 
-    session.add_all(standings_list)
\ No newline at end of file
+def net_result_delta(
+    previous: Optional[Tuple[int, int]], 
+    current: Tuple[int, int], 
+    ruleset: Optional[SportRulesetModel] = None
+) -> Tuple[StandingsDelta, StandingsDelta]:
+    """
+    Delta líquido de um lançamento de resultado.
+    Na correção de um resultado já lançado, o delta anterior é revertido,
+    então aplicar o mesmo resultado duas vezes não altera a classificação.
+    """
+    home, away = compute_result_delta(*current, ruleset)
+    if previous is None:
+        return home, away
+
+    old_home, old_away = compute_result_delta(*previous, ruleset)
+    return (
+        {col: home[col] - old_home[col] for col in STANDINGS_COLUMNS},
+        {col: away[col] - old_away[col] for col in STANDINGS_COLUMNS},
+    )
+
+async def apply_standings_delta(
+    session: AsyncSession, 
+    competition_id: int, 
+    team_id: uuid.UUID, 
+    delta: StandingsDelta
+):
+    """
+    Aplica o delta na linha de classificação do time com um único
+    UPDATE ... SET col = col + :d (sem ler a linha antes).
+    """
+    values = {
+        col: getattr(ClassificationModel, col) + value
+        for col, value in delta.items() if value
+    }
+    if not values:
+        return
+
+    await session.execute(
+        update(ClassificationModel)
+        .where(
+            ClassificationModel.competition_id == competition_id,
+            ClassificationModel.team_id == team_id
+        )
+        .values(**values)
+    )
@@ -0,0 +1,217 @@
+import random
+import uuid
+from dataclasses import dataclass, field
+from math import ceil, log2
+from typing import List, Optional, Sequence, Tuple
+
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from .generate_competitions_utils import CompetitionGeneratorUtils as util
+
+# (segment_number, segment_type): igual para todos os jogos da competição
+SegmentTemplate = Tuple[Tuple[int, str], ...]
+
+
+@dataclass(slots=True)
+class PlannedGroup:
+    index: int
+    name: str
+    team_ids: List[uuid.UUID]
+
+@dataclass(slots=True)
+class PlannedRound:
+    index: int
+    name: str
+    group_index: Optional[int] = None
+
+@dataclass(slots=True)
+class PlannedMatch:
+    id: uuid.UUID
+    round_index: int
+    round_number_match: int
+    group_index: Optional[int] = None
+    home_team_id: Optional[uuid.UUID] = None
+    away_team_id: Optional[uuid.UUID] = None
+    home_feeder_match_id: Optional[uuid.UUID] = None
+    away_feeder_match_id: Optional[uuid.UUID] = None
+    next_match_id: Optional[uuid.UUID] = None
+    next_match_slot: Optional[str] = None
+    status: MatchStatus = MatchStatus.SCHEDULED
+    has_overtime: bool = False
+    has_penalties: bool = False
+
+@dataclass(slots=True)
+class StructurePlan:
+    """
+    Estrutura completa de uma competição, calculada em memória sem acessar o banco.
+    Os jogos já têm UUID definitivo e estão em ordem de rodada (alimentadores primeiro).
+    """
+    system: CompetitionSystem
+    seed: int
+    segments: SegmentTemplate
+    groups: List[PlannedGroup] = field(default_factory=list)
+    rounds: List[PlannedRound] = field(default_factory=list)
+    matches: List[PlannedMatch] = field(default_factory=list)
+
+    def add_round(self, name: str, group_index: Optional[int] = None) -> int:
+        self.rounds.append(PlannedRound(len(self.rounds), name, group_index))
+        return len(self.rounds) - 1
+
+    def add_knockout_match(self, round_index: int, number: int, home, away, **options) -> PlannedMatch:
+        """
+        Cria um jogo de mata-mata. `home`/`away` são o id de um time, o jogo
+        alimentador (PlannedMatch) ou None; os alimentadores recebem o índice
+        de avanço (`next_match_id`/`next_match_slot`).
+        """
+        match = PlannedMatch(uuid.uuid4(), round_index, number, **options)
+        for slot, source in (("home", home), ("away", away)):
+            if isinstance(source, PlannedMatch):
+                setattr(match, f"{slot}_feeder_match_id", source.id)
+                source.next_match_id, source.next_match_slot = match.id, slot
+            else:
+                setattr(match, f"{slot}_team_id", source)
+        if match.home_team_id is None or match.away_team_id is None:
+            match.status = MatchStatus.PENDING
+        self.matches.append(match)
+        return match
+
+    @property
+    def total_segments(self) -> int:
+        return len(self.matches) * len(self.segments)
+
+
+def segment_template(
+    segment_type: str,
+    segments_regular_number: int,
+    overtime_segments: int = 0,
+    penalty_segments: int = 0
+) -> SegmentTemplate:
+    """Segmentos (tempos/sets) de cada jogo a partir das regras do ruleset."""
+    return (
+        tuple((n, segment_type) for n in range(1, segments_regular_number + 1))
+        + tuple((n, 'OVERTIME') for n in range(1, (overtime_segments or 0) + 1))
+        + tuple((n, 'PENALTY') for n in range(1, (penalty_segments or 0) + 1))
+    )
+
+def _round_robin(plan: StructurePlan, team_ids: Sequence[uuid.UUID], round_prefix: str,
+                 group_index: Optional[int] = None):
+    """Método do círculo: o primeiro time fica fixo e os demais giram a cada rodada."""
+    if len(team_ids) < 2:
+        return
+
+    teams: List[Optional[uuid.UUID]] = list(team_ids)
+    if len(teams) % 2 != 0:
+        teams.append(None)
+
+    num_teams = len(teams)
+    for r in range(num_teams - 1):
+        round_index = plan.add_round(f"{round_prefix}Rodada {r + 1}", group_index)
+        for i in range(num_teams // 2):
+            home, away = teams[i], teams[num_teams - 1 - i]
+            if home is not None and away is not None:
+                plan.matches.append(PlannedMatch(
+                    uuid.uuid4(), round_index, i + 1, group_index,
+                    home_team_id=home, away_team_id=away
+                ))
+        teams = [teams[0]] + [teams[-1]] + teams[1:-1]
+
+def plan_league(plan: StructurePlan, team_ids: Sequence[uuid.UUID]):
+    """Pontos corridos: todos contra todos em turno único."""
+    _round_robin(plan, team_ids, "")
+
+def plan_elimination(plan: StructurePlan, team_ids: Sequence[uuid.UUID], rng: random.Random,
+                     has_overtime: bool, has_penalties: bool):
+    """
+    Mata-mata com byes: os times que sobram até a próxima potência de 2 avançam
+    direto e os demais jogam a rodada preliminar.
+    """
+    teams = list(team_ids)
+    rng.shuffle(teams)
+
+    num_of_byes = 2**ceil(log2(len(teams))) - len(teams)
+    teams_with_byes, teams_in_preliminary = teams[:num_of_byes], teams[num_of_byes:]
+
+    # Cada participante de uma rodada é o id de um time (bye) ou o jogo alimentador
+    feeders = list(teams_with_byes)
+    options = dict(has_overtime=has_overtime, has_penalties=has_penalties)
+
+    if teams_in_preliminary:
+        round_index = plan.add_round("Rodada Preliminar")
+        pairs = zip(teams_in_preliminary[::2], teams_in_preliminary[1::2])
+        for i, (home, away) in enumerate(pairs, start=1):
+            feeders.append(plan.add_knockout_match(round_index, i, home, away, **options))
+
+    for round_name in util.get_elimination_round_names(len(feeders)):
+        round_index = plan.add_round(round_name)
+        pairs = zip(feeders[::2], feeders[1::2])
+        feeders = [
+            plan.add_knockout_match(round_index, i, home, away, **options)
+            for i, (home, away) in enumerate(pairs, start=1)
+        ]
+
+def plan_groups(plan: StructurePlan, team_ids: Sequence[uuid.UUID], rng: random.Random,
+                teams_per_group: int, qualified_per_group: int):
+    """Fase de grupos (todos contra todos em cada grupo) seguida do mata-mata vazio."""
+    num_teams = len(team_ids)
+    if num_teams < teams_per_group:
+        raise ValueError(f"Número de times ({num_teams}) insuficiente para o tamanho do grupo ({teams_per_group}).")
+
+    num_groups = ceil(num_teams / teams_per_group)
+    total_qualified = num_groups * qualified_per_group
+    if total_qualified & (total_qualified - 1) != 0 or total_qualified == 0:
+        raise ValueError(f"Número de classificados ({total_qualified}) deve ser potência de 2 (2, 4, 8, 16...). Ajuste times/grupos.")
+
+    teams = list(team_ids)
+    rng.shuffle(teams)
+
+    for g in range(num_groups):
+        group = PlannedGroup(g, f"Grupo {chr(65 + g)}", teams[g * teams_per_group:(g + 1) * teams_per_group])
+        plan.groups.append(group)
+        _round_robin(plan, group.team_ids, f"{group.name} - ", g)
+
+    # Árvore vazia: os times são definidos ao encerrar a fase de grupos
+    previous: List[PlannedMatch] = []
+    for r_idx, round_name in enumerate(util.get_elimination_round_names(total_qualified)):
+        round_index = plan.add_round(f"Fase Final - {round_name}")
+        previous = [
+            plan.add_knockout_match(
+                round_index, i + 1,
+                previous[i * 2] if previous else None,
+                previous[i * 2 + 1] if previous else None,
+                has_overtime=True, has_penalties=True
+            )
+            for i in range(total_qualified // (2 ** (r_idx + 1)))
+        ]
+
+def plan_structure(
+    system: CompetitionSystem,
+    team_ids: Sequence[uuid.UUID],
+    segments: SegmentTemplate,
+    teams_per_group: Optional[int] = None,
+    qualified_per_group: Optional[int] = None,
+    seed: Optional[int] = None
+) -> StructurePlan:
+    """
+    Calcula a estrutura completa (rodadas, jogos, alimentadores e segmentos) em uma passada.
+    A mesma `seed` gera sempre o mesmo sorteio, então uma prévia pode ser gravada depois
+    exatamente como foi exibida (os UUIDs dos jogos são novos a cada chamada).
+    """
+    if len(team_ids) < 2:
+        raise ValueError("Mínimo de 2 times necessários.")
+
+    seed = random.randrange(2**31) if seed is None else seed
+    rng = random.Random(seed)
+    plan = StructurePlan(system=system, seed=seed, segments=segments)
+    has_overtime = any(kind == 'OVERTIME' for _, kind in segments)
+    has_penalties = any(kind == 'PENALTY' for _, kind in segments)
+
+    if system == CompetitionSystem.POINTS:
+        plan_league(plan, team_ids)
+    elif system == CompetitionSystem.ELIMINATION:
+        plan_elimination(plan, team_ids, rng, has_overtime, has_penalties)
+    elif system == CompetitionSystem.MIXED:
+        plan_groups(plan, team_ids, rng, teams_per_group or 4, qualified_per_group or 2)
+    else:
+        raise NotImplementedError("Sistema de disputa ainda não implementado.")
+
+    return plan
@@ -1,15 +1,99 @@
 import uuid
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 from sqlalchemy import and_, or_
 from datetime import datetime, timedelta, time
 from fastapi import HTTPException
 
 from src.models.matches import MatchModel, MatchStatus
-from src.models.competition import CompetitionModel
+from src.models.competition import CompetitionModel, CompetitionSystem
 from src.models.modality import ModalityModel 
-from src.schemas.matches_schema import MatchPeriodFilter, MatchUpdateRequest
+from src.models.teams import TeamModel
+from src.schemas.matches_schema import MatchOrgListAdapter, MatchPeriodFilter, MatchResultRequest, MatchUpdateRequest
+from src.services.competition_generator.bracket_manager import advance_winner
+from src.services.competition_generator.standings_manager import (
+    apply_standings_delta,
+    net_result_delta,
+)
+
+HomeTeam = aliased(TeamModel, name="home_team")
+AwayTeam = aliased(TeamModel, name="away_team")
+
+def select_match_org_rows():
+    """
+    Consulta com as colunas exatas do MatchOrgResponse (jogo, competição,
+    modalidade e times) em um único JOIN, sem hidratar objetos do ORM.
+    """
+    return (
+        select(
+            MatchModel.id,
+            MatchModel.round_id,
+            MatchModel.status,
+            MatchModel.scheduled_datetime,
+            MatchModel.local,
+            MatchModel.round_number_match.label("round_match_number"),
+            CompetitionModel.name.label("competition_name"),
+            ModalityModel.name.label("modality_name"),
+            HomeTeam.id.label("home_team_id"),
+            HomeTeam.name.label("home_team_name"),
+            HomeTeam.abbreviation.label("home_team_abbreviation"),
+            AwayTeam.id.label("away_team_id"),
+            AwayTeam.name.label("away_team_name"),
+            AwayTeam.abbreviation.label("away_team_abbreviation"),
+            MatchModel.home_score,
+            MatchModel.away_score
+        )
+        .join(CompetitionModel, MatchModel.competition_id == CompetitionModel.id)
+        .join(ModalityModel, CompetitionModel.modality_id == ModalityModel.id)
+        .outerjoin(HomeTeam, MatchModel.home_team_id == HomeTeam.id)
+        .outerjoin(AwayTeam, MatchModel.away_team_id == AwayTeam.id)
+    )
+
+def format_match_org_rows(rows) -> List[dict]:
+    """Converte as linhas da projeção no formato do MatchOrgResponse (times aninhados)."""
+    return [
+        {
+            "id": r.id,
+            "status": r.status,
+            "scheduled_datetime": r.scheduled_datetime,
+            "local": r.local,
+            "round_match_number": r.round_match_number,
+            "competition_name": r.competition_name,
+            "modality_name": r.modality_name,
+            "home_team": {
+                "id": r.home_team_id, "name": r.home_team_name, "abbreviation": r.home_team_abbreviation
+            } if r.home_team_id else None,
+            "away_team": {
+                "id": r.away_team_id, "name": r.away_team_name, "abbreviation": r.away_team_abbreviation
+            } if r.away_team_id else None,
+            "home_score": r.home_score,
+            "away_score": r.away_score
+        }
+        for r in rows
+    ]
+
+def apply_period_filter(query, period: MatchPeriodFilter):
+    """Filtra os jogos de hoje ou da semana calendário (segunda a domingo); ALL não filtra."""
+    now = datetime.now()
+
+    if period == MatchPeriodFilter.TODAY:
+        start = datetime.combine(now.date(), time.min)
+        end = datetime.combine(now.date(), time.max)
+    elif period == MatchPeriodFilter.WEEK:
+        start_of_week = now - timedelta(days=now.weekday()) # Segunda-feira
+        start = datetime.combine(start_of_week.date(), time.min)
+        end = datetime.combine((start + timedelta(days=6)).date(), time.max) # Domingo
+    else:
+        return query
+
+    return query.where(
+        and_(
+            MatchModel.scheduled_datetime >= start,
+            MatchModel.scheduled_datetime <= end
+        )
+    )
 
 class MatchesService:
     def __init__(self, session: AsyncSession):
@@ -20,84 +104,16 @@ class MatchesService:
         org_code: str, 
         period: MatchPeriodFilter = MatchPeriodFilter.ALL
     ):
-        # 1. Monta a Query Base com Joins
-        # Match -> Competition -> Modality
+        # Projeção plana: Match -> Competition -> Modality (+ times) em uma única consulta
         query = (
-            select(MatchModel)
-            .join(MatchModel.competition) # Join com Competition
-            .join(CompetitionModel.modality) # Join com Modality
+            select_match_org_rows()
             .where(ModalityModel.org_code == org_code)
             .order_by(MatchModel.scheduled_datetime)
-            .options(
-                # Carrega os relacionamentos para o Schema preencher os nomes
-                selectinload(MatchModel.competition).selectinload(CompetitionModel.modality),
-                selectinload(MatchModel.home_team),
-                selectinload(MatchModel.away_team)
-            )
         )
+        query = apply_period_filter(query, period)
 
-        # 2. Aplica Filtros de Data
-        now = datetime.now()
-        
-        if period == MatchPeriodFilter.TODAY:
-            # Do inicio (00:00) ao fim (23:59) de hoje
-            start_of_day = datetime.combine(now.date(), time.min)
-            end_of_day = datetime.combine(now.date(), time.max)
-            
-            query = query.where(
-                and_(
-                    MatchModel.scheduled_datetime >= start_of_day,
-                    MatchModel.scheduled_datetime <= end_of_day
-                )
-            )
-
-        elif period == MatchPeriodFilter.WEEK:
-            # Semana atual (Segunda a Domingo ou Domingo a Sábado, dependendo da regra)
-            # Aqui faremos: Hoje até o fim dos próximos 7 dias (Jogos da semana)
-            # OU se quiser a semana calendário (Segunda a Domingo):
-            start_of_week = now - timedelta(days=now.weekday()) # Segunda-feira
-            start_of_week = datetime.combine(start_of_week.date(), time.min)
-            
-            end_of_week = start_of_week + timedelta(days=6) # Domingo
-            end_of_week = datetime.combine(end_of_week.date(), time.max)
-
-            query = query.where(
-                and_(
-                    MatchModel.scheduled_datetime >= start_of_week,
-                    MatchModel.scheduled_datetime <= end_of_week
-                )
-            )
-            
-        # Se for ALL, não aplica filtro de data
-
-        # 3. Executa
         result = await self.session.execute(query)
-        matches = result.scalars().all()
-
-        # 4. Formatação Manual para o Schema (Flattening)
-        # Como o Schema pede 'competition_name' e 'modality_name' flat,
-        # e o Model tem isso aninhado, podemos fazer um map ou deixar o Pydantic tentar resolver.
-        # Mas para garantir performance e estrutura, vou mapear manualmente aqui ou 
-        # ajustar o Model do Pydantic para pegar nested attributes.
-        # Vamos usar uma abordagem de construção de lista para facilitar:
-        
-        response_list = []
-        for m in matches:
-            response_list.append({
-                "id": m.id,
-                "status": m.status,
-                "scheduled_datetime": m.scheduled_datetime,
-                "local": m.local,
-                "round_match_number": m.round_match_number,
-                "competition_name": m.competition.name,
-                "modality_name": m.competition.modality.name,
-                "home_team": m.home_team,
-                "away_team": m.away_team,
-                "home_score": m.home_score,
-                "away_score": m.away_score
-            })
-            
-        return response_list
+        return MatchOrgListAdapter.validate_python(format_match_org_rows(result.all()))
     
     async def get_matches_by_competition(
         self, 
@@ -119,32 +135,8 @@ class MatchesService:
             )
         )
 
-        # 2. Aplica Filtros de Data (Reaproveitando a lógica)
-        now = datetime.now()
-        
-        if period == MatchPeriodFilter.TODAY:
-            start_of_day = datetime.combine(now.date(), time.min)
-            end_of_day = datetime.combine(now.date(), time.max)
-            query = query.where(
-                and_(
-                    MatchModel.scheduled_datetime >= start_of_day,
-                    MatchModel.scheduled_datetime <= end_of_day
-                )
-            )
-
-        elif period == MatchPeriodFilter.WEEK:
-            start_of_week = now - timedelta(days=now.weekday())
-            start_of_week = datetime.combine(start_of_week.date(), time.min)
-            
-            end_of_week = start_of_week + timedelta(days=6)
-            end_of_week = datetime.combine(end_of_week.date(), time.max)
-            
-            query = query.where(
-                and_(
-                    MatchModel.scheduled_datetime >= start_of_week,
-                    MatchModel.scheduled_datetime <= end_of_week
-                )
-            )
+        # 2. Aplica Filtros de Data
+        query = apply_period_filter(query, period)
 
         # 3. Executa
         result = await self.session.execute(query)
@@ -158,9 +150,8 @@ class MatchesService:
         """
         Busca todos os jogos onde o time participa (Seja como Home ou Away).
         """
-        # 1. Query Base: Time é Mandante OU Visitante
         query = (
-            select(MatchModel)
+            select_match_org_rows()
             .where(
                 or_(
                     MatchModel.home_team_id == team_id,
@@ -168,69 +159,11 @@ class MatchesService:
                 )
             )
             .order_by(MatchModel.scheduled_datetime)
-            .options(
-                # Carregamos Competição e Modalidade para contexto
-                selectinload(MatchModel.competition).selectinload(CompetitionModel.modality),
-                selectinload(MatchModel.home_team),
-                selectinload(MatchModel.away_team),
-                selectinload(MatchModel.round)
-            )
         )
+        query = apply_period_filter(query, period)
 
-        # 2. Filtros de Data (Reaproveitados)
-        now = datetime.now()
-        
-        if period == MatchPeriodFilter.TODAY:
-            start_of_day = datetime.combine(now.date(), time.min)
-            end_of_day = datetime.combine(now.date(), time.max)
-            query = query.where(
-                and_(
-                    MatchModel.scheduled_datetime >= start_of_day,
-                    MatchModel.scheduled_datetime <= end_of_day
-                )
-            )
-
-        elif period == MatchPeriodFilter.WEEK:
-            start_of_week = now - timedelta(days=now.weekday())
-            start_of_week = datetime.combine(start_of_week.date(), time.min)
-            
-            end_of_week = start_of_week + timedelta(days=6)
-            end_of_week = datetime.combine(end_of_week.date(), time.max)
-            
-            query = query.where(
-                and_(
-                    MatchModel.scheduled_datetime >= start_of_week,
-                    MatchModel.scheduled_datetime <= end_of_week
-                )
-            )
-
-        # 3. Executa
         result = await self.session.execute(query)
-        matches = result.scalars().all()
-
-        # 4. Formatação (Flattening)
-        # Usamos uma estrutura similar ao MatchOrgResponse para mostrar o contexto
-        response_list = []
-        for m in matches:
-            response_list.append({
-                "id": m.id,
-                "status": m.status,
-                "scheduled_datetime": m.scheduled_datetime,
-                "local": m.local,
-                "round_match_number": m.round_match_number,
-                
-                # Contexto extra é útil aqui (qual campeonato é esse jogo?)
-                "competition_name": m.competition.name,
-                "modality_name": m.competition.modality.name,
-                
-                "home_team": m.home_team,
-                "away_team": m.away_team,
-                "home_score": m.home_score,
-                "away_score": m.away_score,
-                "round": m.round # Opcional, se quiser mostrar a fase
-            })
-            
-        return response_list
+        return MatchOrgListAdapter.validate_python(format_match_org_rows(result.all()))
     
     async def update_match_details(self, match_id: uuid.UUID, update_data: MatchUpdateRequest):
         """
@@ -272,4 +205,88 @@ class MatchesService:
         await self.session.commit()
         await self.session.refresh(match)
         
-        return match
\ No newline at end of file
+        return match
+
+    async def submit_result(self, match_id: uuid.UUID, result_data: MatchResultRequest):
+        """
+        Lança (ou corrige) o resultado de um jogo e atualiza a classificação.
+        A classificação recebe apenas o delta do resultado, em O(1); numa
+        correção o delta anterior é revertido antes de aplicar o novo.
+        No mata-mata, o vencedor avança para o jogo seguinte.
+        """
+        # 1. Busca o Jogo bloqueando a linha (evita dois lançamentos simultâneos)
+        query = (
+            select(MatchModel)
+            .where(MatchModel.id == match_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        match = result.scalar_one_or_none()
+
+        if not match:
+            raise HTTPException(status_code=404, detail="Jogo não encontrado.")
+
+        if not match.home_team_id or not match.away_team_id:
+            raise HTTPException(status_code=400, detail="O jogo ainda não tem os dois times definidos.")
+
+        if match.status == MatchStatus.CANCELED:
+            raise HTTPException(status_code=400, detail="Não é possível lançar resultado de um jogo cancelado.")
+
+        competition_query = (
+            select(CompetitionModel)
+            .options(selectinload(CompetitionModel.sport_ruleset))
+            .where(CompetitionModel.id == match.competition_id)
+        )
+        competition = (await self.session.execute(competition_query)).scalar_one()
+        counts_for_standings = match.group_id is not None or competition.system == CompetitionSystem.POINTS
+
+        # 2. Define o vencedor
+        if result_data.home_score > result_data.away_score:
+            winner_team_id = match.home_team_id
+        elif result_data.away_score > result_data.home_score:
+            winner_team_id = match.away_team_id
+        else:
+            winner_team_id = result_data.winner_team_id
+            if winner_team_id and winner_team_id not in (match.home_team_id, match.away_team_id):
+                raise HTTPException(status_code=400, detail="O vencedor deve ser um dos times do jogo.")
+            # Mata-mata não termina empatado: sem vencedor a chave ficaria parada
+            if not winner_team_id and (match.next_match_id is not None or not counts_for_standings):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Empate em jogo de mata-mata: informe o vencedor (winner_team_id)."
+                )
+
+        # 3. Atualiza a classificação (apenas pontos corridos e fase de grupos)
+        if counts_for_standings:
+            previous = (match.home_score, match.away_score) if match.status == MatchStatus.FINISHED else None
+            home_delta, away_delta = net_result_delta(
+                previous,
+                (result_data.home_score, result_data.away_score),
+                competition.sport_ruleset
+            )
+            await apply_standings_delta(self.session, competition.id, match.home_team_id, home_delta)
+            await apply_standings_delta(self.session, competition.id, match.away_team_id, away_delta)
+
+        # 4. Mata-mata: leva o vencedor ao jogo seguinte
+        previous_winner_id = match.winner_team_id if match.status == MatchStatus.FINISHED else None
+        await advance_winner(self.session, match, previous_winner_id, winner_team_id)
+
+        # 5. Persiste o resultado
+        match.home_score = result_data.home_score
+        match.away_score = result_data.away_score
+        match.winner_team_id = winner_team_id
+        match.status = MatchStatus.FINISHED
+        await self.session.commit()
+
+        refreshed = await self.session.execute(
+            select(MatchModel)
+            .where(MatchModel.id == match_id)
+            .options(
+                selectinload(MatchModel.home_team),
+                selectinload(MatchModel.away_team),
+                selectinload(MatchModel.round)
+            )
+            .execution_options(populate_existing=True)
+        )
+        return refreshed.scalar_one()
@@ -1,11 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 from typing import List
 
 from src.models.matches import RoundModel, MatchModel
 from src.models.competition import CompetitionModel
 from src.models.modality import ModalityModel
+from src.schemas.matches_schema import MatchOrgListAdapter
+from src.services.matches_service import format_match_org_rows, select_match_org_rows
 
 class RoundsService:
     def __init__(self, session: AsyncSession):
@@ -16,104 +17,72 @@ class RoundsService:
         Lista todas as rodadas de uma competição com seus respectivos jogos.
         Útil para campeonatos de pontos corridos ou visualização geral.
         """
-        query = (
-            select(RoundModel)
+        rounds_query = (
+            select(RoundModel.id, RoundModel.name)
             .where(RoundModel.competition_id == competition_id)
             .order_by(RoundModel.id) # Ou order_by(RoundModel.name)
-            .options(
-                # Carrega os jogos da rodada
-                selectinload(RoundModel.matches).options(
-                    # E dentro dos jogos, carrega Times, Competição e Modalidade
-                    # (Necessário para preencher o MatchOrgResponse)
-                    selectinload(MatchModel.home_team),
-                    selectinload(MatchModel.away_team),
-                    selectinload(MatchModel.competition).selectinload(CompetitionModel.modality)
-                )
-            )
         )
-        
-        result = await self.session.execute(query)
-        return self._format_response(result.scalars().all())
+        matches_query = (
+            select_match_org_rows()
+            .where(MatchModel.competition_id == competition_id)
+            .order_by(MatchModel.round_number_match)
+        )
+
+        rounds = (await self.session.execute(rounds_query)).all()
+        matches = (await self.session.execute(matches_query)).all()
+        return self._format_response(rounds, matches)
 
     async def get_rounds_by_group(self, group_id: int):
         """
         Lista as rodadas e jogos específicos de um Grupo.
-        Faz um JOIN com MatchModel para garantir que só pegamos rodadas que têm jogos desse grupo.
+        As rodadas vêm dos próprios jogos do grupo, então só aparecem rodadas com jogos dele.
         """
         query = (
-            select(RoundModel)
-            .join(RoundModel.matches) # Join para filtrar pelo grupo dos jogos
+            select_match_org_rows()
+            .add_columns(RoundModel.name.label("round_name"))
+            .join(RoundModel, MatchModel.round_id == RoundModel.id)
             .where(MatchModel.group_id == group_id)
-            .distinct() # Evita duplicatas se a rodada tiver múltiplos jogos
-            .order_by(RoundModel.id)
-            .options(
-                selectinload(RoundModel.matches).options(
-                    selectinload(MatchModel.home_team),
-                    selectinload(MatchModel.away_team),
-                    selectinload(MatchModel.competition).selectinload(CompetitionModel.modality)
-                )
-            )
+            .order_by(RoundModel.id, MatchModel.round_number_match)
         )
+        matches = (await self.session.execute(query)).all()
 
-        result = await self.session.execute(query)
-        rounds = result.scalars().all()
-        
-        # IMPORTANTE: O selectinload acima traz TODOS os jogos da rodada.
-        # Se por acaso uma rodada for compartilhada entre grupos (raro, mas possível),
-        # precisaríamos filtrar os jogos no Python.
-        # Assumindo que o gerador cria rodadas exclusivas por grupo ("Grupo A - Rodada 1"),
-        # o retorno direto funciona.
-        
-        return self._format_response(rounds)
+        rounds = list({m.round_id: (m.round_id, m.round_name) for m in matches}.values())
+        return self._format_response(rounds, matches)
+
+    def _format_response(self, rounds, matches) -> List[dict]:
+        """
+        Agrupa os jogos (linhas da projeção plana) nas rodadas, no padrão do Schema.
+        `rounds` são pares (id, name) na ordem de exibição.
+        """
+        validated = MatchOrgListAdapter.validate_python(format_match_org_rows(matches))
+
+        matches_by_round = {round_id: [] for round_id, _ in rounds}
+        for row, match in zip(matches, validated):
+            if row.round_id in matches_by_round:
+                matches_by_round[row.round_id].append(match)
+
+        return [
+            {"id": round_id, "name": name, "matches": matches_by_round[round_id]}
+            for round_id, name in rounds
+        ]
 
-    def _format_response(self, rounds: List[RoundModel]):
-        """Helper para formatar a resposta no padrão do Schema (Flattening dos jogos)"""
-        response = []
-        for r in rounds:
-            matches_formatted = []
-            for m in r.matches:
-                # Transforma o Model Match no dicionário plano esperado pelo MatchOrgResponse
-                matches_formatted.append({
-                    "id": m.id,
-                    "status": m.status,
-                    "scheduled_datetime": m.scheduled_datetime,
-                    "local": m.local,
-                    "round_match_number": m.round_match_number,
-                    "competition_name": m.competition.name,
-                    "modality_name": m.competition.modality.name,
-                    "home_team": m.home_team,
-                    "away_team": m.away_team,
-                    "home_score": m.home_score,
-                    "away_score": m.away_score
-                })
-            
-            response.append({
-                "id": r.id,
-                "name": r.name,
-                "matches": matches_formatted
-            })
-            
-        return response
-    
     async def get_rounds_by_org(self, org_code: str):
         """
         Lista todas as rodadas de todas as competições de uma organização.
         """
-        query = (
-            select(RoundModel)
-            .join(RoundModel.competition)    # Join com Competition
-            .join(CompetitionModel.modality) # Join com Modality
+        rounds_query = (
+            select(RoundModel.id, RoundModel.name)
+            .join(CompetitionModel, RoundModel.competition_id == CompetitionModel.id)
+            .join(ModalityModel, CompetitionModel.modality_id == ModalityModel.id)
             .where(ModalityModel.org_code == org_code)
             .order_by(CompetitionModel.id, RoundModel.id) # Ordena por competição e depois por rodada
-            .options(
-                # Carregamento profundo para montar a resposta completa
-                selectinload(RoundModel.matches).options(
-                    selectinload(MatchModel.home_team),
-                    selectinload(MatchModel.away_team),
-                    selectinload(MatchModel.competition).selectinload(CompetitionModel.modality)
-                )
-            )
+        )
+        matches_query = (
+            select_match_org_rows()
+            .where(ModalityModel.org_code == org_code)
+            .order_by(MatchModel.round_number_match)
         )
 
-        result = await self.session.execute(query)
-        return self._format_response(result.scalars().all())
\ No newline at end of file
+        rounds = (await self.session.execute(rounds_query)).all()
+        matches = (await self.session.execute(matches_query)).all()
+        return self._format_response(rounds, matches)
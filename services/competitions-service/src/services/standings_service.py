@@ -0,0 +1,117 @@
+from typing import List, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+
+from src.models.competition import CompetitionModel, CompetitionSystem
+from src.models.matches import MatchModel, MatchStatus
+from src.models.standings import ClassificationModel
+from src.core.tie_breakers import parse_tie_breakers
+from src.services.competition_generator.standings_engine import compute_standings
+from src.services.competition_generator.standings_manager import STANDINGS_COLUMNS
+
+class StandingsService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def recompute(self, competition_id: int):
+        """
+        Reconstrói a classificação inteira a partir do histórico de jogos.
+        Usado em auditorias e correções; o caminho normal é o incremental
+        (lançamento de resultado).
+        """
+        query = (
+            select(CompetitionModel)
+            .options(selectinload(CompetitionModel.sport_ruleset))
+            .where(CompetitionModel.id == competition_id)
+        )
+        competition = (await self.session.execute(query)).scalar_one_or_none()
+        if not competition:
+            raise HTTPException(status_code=404, detail="Competição não encontrada")
+
+        rows, _, match_count = await self.refresh(competition)
+        await self.session.commit()
+
+        return {"teams": len(rows), "matches": match_count}
+
+    async def refresh(self, competition: CompetitionModel) -> Tuple[list, List[int], int]:
+        """
+        Recalcula e grava (sem commit) a classificação de uma competição já
+        carregada com o ruleset, aplicando os critérios de desempate dele.
+
+        Retorna as linhas (id, team_id, group_id), a posição de cada uma
+        dentro do grupo e o número de jogos considerados.
+        """
+        # 1. Regras
+        ruleset = competition.sport_ruleset
+        try:
+            tie_breakers = parse_tie_breakers(getattr(ruleset, "tie_breakers", None))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        points_rule = (
+            getattr(ruleset, "points_per_win", 3),
+            getattr(ruleset, "points_per_draw", 1),
+            getattr(ruleset, "points_per_loss", 0),
+        )
+
+        # 2. Linhas da classificação (apenas colunas)
+        rows = (await self.session.execute(
+            select(ClassificationModel.id, ClassificationModel.team_id, ClassificationModel.group_id)
+            .where(ClassificationModel.competition_id == competition.id)
+            .order_by(ClassificationModel.id)
+        )).all()
+
+        if not rows:
+            return rows, [], 0
+
+        team_index = {row.team_id: i for i, row in enumerate(rows)}
+        team_group = np.fromiter(
+            (row.group_id if row.group_id is not None else -1 for row in rows),
+            dtype=np.int64, count=len(rows)
+        )
+
+        # 3. Jogos encerrados que contam para a classificação, em colunas
+        matches_query = select(
+            MatchModel.home_team_id, MatchModel.away_team_id,
+            MatchModel.home_score, MatchModel.away_score
+        ).where(
+            MatchModel.competition_id == competition.id,
+            MatchModel.status == MatchStatus.FINISHED,
+            MatchModel.home_team_id.is_not(None),
+            MatchModel.away_team_id.is_not(None)
+        )
+        if competition.system != CompetitionSystem.POINTS:
+            matches_query = matches_query.where(MatchModel.group_id.is_not(None))
+
+        matches = [
+            (team_index[m.home_team_id], team_index[m.away_team_id], m.home_score, m.away_score)
+            for m in (await self.session.execute(matches_query)).all()
+            if m.home_team_id in team_index and m.away_team_id in team_index
+        ]
+        home, away, home_score, away_score = (
+            np.array(column, dtype=np.int64) for column in zip(*matches)
+        ) if matches else (np.empty(0, dtype=np.int64) for _ in range(4))
+
+        # 4. Cálculo vetorizado
+        columns = compute_standings(
+            team_group, home, away, home_score, away_score,
+            points_rule=points_rule, tie_breakers=tie_breakers
+        )
+
+        # 5. Escrita em lote (UPDATE por chave primária, executemany)
+        output = STANDINGS_COLUMNS + ("position",)
+        values = {col: columns[col].tolist() for col in output}
+        await self.session.execute(
+            update(ClassificationModel),
+            [
+                {"id": row.id, **{col: values[col][i] for col in output}}
+                for i, row in enumerate(rows)
+            ]
+        )
+
+        return rows, values["position"], len(matches)
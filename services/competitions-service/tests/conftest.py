@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
@@ -6,6 +8,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.core.app import create_app
+from src.models import CompetitionModel, SportRulesetModel, TeamModel
 from src.models.base import Base
 from src.routes.routes import get_session
 
@@ -52,4 +55,32 @@ async def client_fixture(session: AsyncSession):
 
     # Cria o cliente async
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
\ No newline at end of file
+        yield client
+
+@pytest.fixture(name="create_competition")
+def create_competition_fixture(session: AsyncSession):
+    """
+    Fábrica de competições PENDING com ruleset e `num_teams` times ("Time 0"...),
+    pronta para gerar a estrutura. `options` vai direto para o CompetitionModel.
+    """
+    async def create(system, num_teams, **options) -> CompetitionModel:
+        ruleset = SportRulesetModel(name="Futsal", segment_type="TIME", segments_regular_number=2)
+        session.add(ruleset)
+        await session.flush()
+
+        competition = CompetitionModel(
+            modality_id=1, name="Copa", sport_ruleset_id=ruleset.id, status="PENDING",
+            start_date=datetime(2026, 1, 1), end_date=datetime(2026, 12, 31),
+            system=system, **options
+        )
+        session.add(competition)
+        await session.flush()
+
+        session.add_all([
+            TeamModel(org_code="org", competition_id=competition.id, name=f"Time {i}", abbreviation="TM")
+            for i in range(num_teams)
+        ])
+        await session.commit()
+        return competition
+
+    return create
@@ -0,0 +1,92 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.future import select
+
+from src.models import MatchModel
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from src.schemas.matches_schema import MatchResultRequest
+from src.services.competition_generator.competition_generator import StructureGeneratorService
+from src.services.matches_service import MatchesService
+
+pytestmark = pytest.mark.asyncio
+
+async def _matches(session):
+    result = await session.execute(
+        select(MatchModel).execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+async def test_winners_advance_to_next_match(session, create_competition):
+    # 4 times: duas partidas iniciais alimentando a final
+    competition = await create_competition(CompetitionSystem.ELIMINATION, 4)
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    matches = await _matches(session)
+    final = next(m for m in matches if m.next_match_id is None)
+    first, second = sorted(
+        (m for m in matches if m.next_match_id == final.id),
+        key=lambda m: m.next_match_slot != "home"
+    )
+    assert final.status == MatchStatus.PENDING
+
+    service = MatchesService(session)
+    await service.submit_result(first.id, MatchResultRequest(home_score=2, away_score=1))
+
+    final = next(m for m in await _matches(session) if m.id == final.id)
+    assert final.home_team_id == first.home_team_id and final.away_team_id is None
+    assert final.status == MatchStatus.PENDING
+
+    await service.submit_result(second.id, MatchResultRequest(home_score=0, away_score=1))
+
+    final = next(m for m in await _matches(session) if m.id == final.id)
+    assert final.away_team_id == second.away_team_id
+    assert final.status == MatchStatus.SCHEDULED
+
+    # Correção que troca o vencedor sobrescreve o lado do jogo seguinte
+    await service.submit_result(first.id, MatchResultRequest(home_score=0, away_score=3))
+
+    final = next(m for m in await _matches(session) if m.id == final.id)
+    assert final.home_team_id == first.away_team_id
+
+async def test_winner_cannot_change_after_next_match_finished(session, create_competition):
+    competition = await create_competition(CompetitionSystem.ELIMINATION, 4)
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    matches = await _matches(session)
+    final = next(m for m in matches if m.next_match_id is None)
+    feeders = [m for m in matches if m.next_match_id == final.id]
+
+    service = MatchesService(session)
+    for feeder in feeders:
+        await service.submit_result(feeder.id, MatchResultRequest(home_score=1, away_score=0))
+    await service.submit_result(final.id, MatchResultRequest(home_score=1, away_score=0))
+
+    # Reenviar o mesmo vencedor é permitido; trocar não
+    await service.submit_result(feeders[0].id, MatchResultRequest(home_score=2, away_score=0))
+    with pytest.raises(HTTPException):
+        await service.submit_result(feeders[0].id, MatchResultRequest(home_score=0, away_score=2))
+
+async def test_tied_knockout_result_requires_winner(session, create_competition):
+    competition = await create_competition(CompetitionSystem.ELIMINATION, 4)
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    matches = await _matches(session)
+    final = next(m for m in matches if m.next_match_id is None)
+    feeder = next(m for m in matches if m.next_match_id == final.id)
+
+    service = MatchesService(session)
+    with pytest.raises(HTTPException) as exc_info:
+        await service.submit_result(feeder.id, MatchResultRequest(home_score=1, away_score=1))
+    assert exc_info.value.status_code == 400
+
+    feeder = next(m for m in await _matches(session) if m.id == feeder.id)
+    assert feeder.status == MatchStatus.SCHEDULED
+
+    # Com o vencedor (ex.: nos pênaltis) o empate é aceito e o time avança
+    await service.submit_result(
+        feeder.id,
+        MatchResultRequest(home_score=1, away_score=1, winner_team_id=feeder.away_team_id)
+    )
+    final = next(m for m in await _matches(session) if m.id == final.id)
+    assert feeder.away_team_id in (final.home_team_id, final.away_team_id)
@@ -0,0 +1,122 @@
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.future import select
+
+from src.models import ClassificationModel, GroupModel, MatchModel, SportRulesetModel, TeamModel
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from src.services.competition_generator.competition_generator import StructureGeneratorService
+from src.services.competition_generator.end_group_phase import EndGroupPhaseService
+
+pytestmark = pytest.mark.asyncio
+
+async def _finish_group_matches(session, competition_id, score):
+    """Encerra todos os jogos de grupo com o placar `score(home_team_id, away_team_id)`."""
+    matches = (await session.execute(
+        select(MatchModel).where(
+            MatchModel.competition_id == competition_id,
+            MatchModel.group_id.is_not(None)
+        )
+    )).scalars().all()
+    for match in matches:
+        match.home_score, match.away_score = score(match.home_team_id, match.away_team_id)
+        match.status = MatchStatus.FINISHED
+    await session.commit()
+
+async def test_advance_group_phase_ranks_all_groups_in_few_statements(session, create_competition):
+    # 16 grupos de 4, 2 classificados por grupo
+    competition = await create_competition(
+        CompetitionSystem.MIXED, 64, teams_per_group=4, teams_qualified_per_group=2
+    )
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    # Resultados fictícios: dentro de cada grupo, o time de menor id vence sempre,
+    # então a ordem de id define a posição
+    standings = (await session.execute(
+        select(ClassificationModel).order_by(ClassificationModel.group_id, ClassificationModel.id)
+    )).scalars().all()
+    strength = {c.team_id: i % 4 for i, c in enumerate(standings)}
+    expected = {
+        (c.group_id, strength[c.team_id] + 1): c.team_id
+        for c in standings if strength[c.team_id] < 2
+    }
+    await _finish_group_matches(
+        session, competition.id,
+        lambda home, away: (1, 0) if strength[home] < strength[away] else (0, 1)
+    )
+
+    statements = []
+    engine = session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = await EndGroupPhaseService(session).advance_group_phase(competition.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert result["matches_updated"] == 16
+    assert result["round_name"] == "Fase Final - Fase de 32"
+    assert len(statements) <= 8
+
+    groups = {
+        g.name: g.id for g in (await session.execute(select(GroupModel))).scalars().all()
+    }
+    first_round = (await session.execute(
+        select(MatchModel)
+        .where(
+            MatchModel.group_id.is_(None),
+            MatchModel.home_feeder_match_id.is_(None)
+        )
+        .order_by(MatchModel.round_number_match)
+        .execution_options(populate_existing=True)
+    )).scalars().all()
+
+    assert all(m.status == MatchStatus.SCHEDULED for m in first_round)
+    # 1º do Grupo A enfrenta o 2º do Grupo B
+    assert first_round[0].home_team_id == expected[(groups["Grupo A"], 1)]
+    assert first_round[0].away_team_id == expected[(groups["Grupo B"], 2)]
+
+async def test_advance_group_phase_uses_head_to_head_tie_breaker(session, create_competition):
+    # Um grupo de 4; apenas os 2 primeiros vão à final
+    competition = await create_competition(
+        CompetitionSystem.MIXED, 4, teams_per_group=4, teams_qualified_per_group=2
+    )
+    await session.execute(
+        update(SportRulesetModel)
+        .where(SportRulesetModel.id == competition.sport_ruleset_id)
+        .values(tie_breakers="points,h2h_points,score_balance")
+    )
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    teams = {
+        t.name: t.id for t in (await session.execute(select(TeamModel))).scalars().all()
+    }
+    leader, a, b, last = (teams[f"Time {i}"] for i in range(4))
+    # A e B terminam com 4 pontos e 1 vitória; B tem saldo maior, mas A venceu o confronto
+    results = {
+        (leader, a): (3, 0), (leader, b): (0, 0), (leader, last): (1, 0),
+        (a, b): (1, 0), (a, last): (0, 0), (b, last): (6, 0),
+    }
+
+    def score(home, away):
+        if (home, away) in results:
+            return results[(home, away)]
+        away_score, home_score = results[(away, home)]
+        return home_score, away_score
+
+    await _finish_group_matches(session, competition.id, score)
+
+    result = await EndGroupPhaseService(session).advance_group_phase(competition.id)
+
+    assert result["matches_updated"] == 1
+    final = (await session.execute(
+        select(MatchModel)
+        .where(MatchModel.group_id.is_(None))
+        .execution_options(populate_existing=True)
+    )).scalar_one()
+    assert (final.home_team_id, final.away_team_id) == (leader, a)
+
+    positions = dict((await session.execute(
+        select(ClassificationModel.team_id, ClassificationModel.position)
+    )).all())
+    assert positions == {leader: 1, a: 2, b: 3, last: 4}
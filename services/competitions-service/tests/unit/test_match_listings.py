@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.future import select
+
+from src.models import GroupModel, MatchModel, ModalityModel
+from src.models.competition import CompetitionSystem
+from src.schemas.matches_schema import MatchOrgResponse
+from src.services.competition_generator.competition_generator import StructureGeneratorService
+from src.services.matches_service import MatchesService
+from src.services.rounds_service import RoundsService
+
+pytestmark = pytest.mark.asyncio
+
+async def _setup(session, create_competition, system=CompetitionSystem.POINTS, num_teams=6, **options):
+    session.add(ModalityModel(id=1, org_code="ORG", name="Futsal"))
+    competition = await create_competition(system, num_teams, **options)
+    await StructureGeneratorService(session).generate_structure(competition.id)
+    return competition
+
+async def test_org_matches_come_from_a_single_projection(session, create_competition):
+    await _setup(session, create_competition)
+
+    statements = []
+    engine = session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        matches = await MatchesService(session).get_matches_by_org("ORG")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert len(matches) == 15
+    assert all(isinstance(m, MatchOrgResponse) for m in matches)
+    assert matches[0].competition_name == "Copa" and matches[0].modality_name == "Futsal"
+    assert matches[0].home_team.name.startswith("Time")
+
+async def test_team_matches(session, create_competition):
+    await _setup(session, create_competition)
+    team_id = (await session.execute(select(MatchModel.home_team_id).limit(1))).scalar_one()
+
+    matches = await MatchesService(session).get_matches_by_team(team_id)
+
+    assert len(matches) == 5
+    assert all(team_id in (m.home_team.id, m.away_team.id) for m in matches)
+
+async def test_rounds_keep_placeholder_matches_and_group_filter(session, create_competition):
+    competition = await _setup(
+        session, create_competition, CompetitionSystem.MIXED, 8, teams_per_group=4, teams_qualified_per_group=2
+    )
+    service = RoundsService(session)
+
+    rounds = await service.get_rounds_by_competition(competition.id)
+    assert len(rounds) == 8
+    # Mata-mata ainda sem times
+    assert rounds[-1]["name"] == "Fase Final - Final"
+    assert rounds[-1]["matches"][0].home_team is None
+
+    group_id = (await session.execute(select(GroupModel.id).order_by(GroupModel.name).limit(1))).scalar_one()
+    group_rounds = await service.get_rounds_by_group(group_id)
+    assert [r["name"] for r in group_rounds] == [f"Grupo A - Rodada {i}" for i in (1, 2, 3)]
+    assert all(len(r["matches"]) == 2 for r in group_rounds)
+
+    assert len(await service.get_rounds_by_org("ORG")) == 8
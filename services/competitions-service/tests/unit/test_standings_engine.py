@@ -0,0 +1,101 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.future import select
+
+from src.models import ClassificationModel, CompetitionModel, MatchModel, RoundModel, SportRulesetModel
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from src.core.tie_breakers import parse_tie_breakers
+from src.services.competition_generator.standings_engine import compute_standings
+from src.services.standings_service import StandingsService
+
+pytestmark = pytest.mark.asyncio
+
+async def test_parse_tie_breakers_rejects_unknown_criteria():
+    assert parse_tie_breakers(None) == ("points", "wins", "score_balance", "score_pro")
+    assert parse_tie_breakers("points, h2h_points") == ("points", "h2h_points")
+
+    with pytest.raises(ValueError):
+        parse_tie_breakers("points,gols_fora")
+
+async def test_compute_standings_uses_head_to_head():
+    # Times 0 e 1 terminam com 3 pontos; 0 tem saldo melhor, mas 1 venceu o confronto direto
+    matches = dict(
+        team_group=[0, 0, 0, 0],
+        home=[0, 1, 2, 2],
+        away=[3, 0, 1, 3],
+        home_score=[5, 1, 1, 1],
+        away_score=[0, 0, 0, 0],
+    )
+
+    by_balance = compute_standings(**matches)
+    by_h2h = compute_standings(**matches, tie_breakers=("points", "h2h_points"))
+
+    assert by_balance["points"].tolist() == [3, 3, 6, 0]
+    assert by_balance["position"].tolist() == [2, 3, 1, 4]
+    assert by_h2h["position"].tolist() == [3, 2, 1, 4]
+
+async def test_compute_standings_positions_per_group():
+    columns = compute_standings(
+        team_group=[10, 10, 20, 20],
+        home=[0, 2],
+        away=[1, 3],
+        home_score=[0, 3],
+        away_score=[1, 2],
+    )
+
+    assert columns["position"].tolist() == [2, 1, 1, 2]
+    assert columns["wins"].tolist() == [0, 1, 1, 0]
+
+async def test_recompute_rebuilds_standings(session):
+    ruleset = SportRulesetModel(name="Futsal", segment_type="TIME", tie_breakers="points,score_balance")
+    session.add(ruleset)
+    await session.flush()
+
+    competition = CompetitionModel(
+        modality_id=1, name="Liga", sport_ruleset_id=ruleset.id,
+        start_date=datetime(2026, 1, 1), end_date=datetime(2026, 12, 31),
+        system=CompetitionSystem.POINTS
+    )
+    session.add(competition)
+    await session.flush()
+
+    round_obj = RoundModel(competition_id=competition.id, name="Rodada 1")
+    session.add(round_obj)
+    await session.flush()
+
+    teams = [uuid.uuid4() for _ in range(3)]
+    # Valores inconsistentes que o recálculo deve corrigir
+    session.add_all([
+        ClassificationModel(competition_id=competition.id, team_id=team_id,
+                            points=99, games_played=0, wins=0, draws=0, losses=0,
+                            score_pro=0, score_against=0, score_balance=0)
+        for team_id in teams
+    ])
+    session.add_all([
+        MatchModel(competition_id=competition.id, round_id=round_obj.id, round_number_match=1,
+                   home_team_id=teams[0], away_team_id=teams[1], home_score=3, away_score=0,
+                   status=MatchStatus.FINISHED),
+        MatchModel(competition_id=competition.id, round_id=round_obj.id, round_number_match=2,
+                   home_team_id=teams[1], away_team_id=teams[2], home_score=1, away_score=1,
+                   status=MatchStatus.FINISHED),
+        MatchModel(competition_id=competition.id, round_id=round_obj.id, round_number_match=3,
+                   home_team_id=teams[2], away_team_id=teams[0], status=MatchStatus.SCHEDULED),
+    ])
+    await session.commit()
+
+    result = await StandingsService(session).recompute(competition.id)
+    assert result == {"teams": 3, "matches": 2}
+
+    rows = await session.execute(
+        select(ClassificationModel).execution_options(populate_existing=True)
+    )
+    standings = {c.team_id: c for c in rows.scalars().all()}
+
+    assert standings[teams[0]].points == 3 and standings[teams[0]].position == 1
+    assert standings[teams[0]].score_balance == 3
+    assert standings[teams[2]].points == 1 and standings[teams[2]].position == 2
+    assert standings[teams[1]].points == 1 and standings[teams[1]].position == 3
+    assert standings[teams[1]].games_played == 2
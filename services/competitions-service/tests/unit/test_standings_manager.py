@@ -0,0 +1,85 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.future import select
+
+from src.models import ClassificationModel, CompetitionModel, MatchModel, RoundModel, SportRulesetModel
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from src.schemas.matches_schema import MatchResultRequest
+from src.services.competition_generator.standings_manager import compute_result_delta, net_result_delta
+from src.services.matches_service import MatchesService
+
+pytestmark = pytest.mark.asyncio
+
+async def test_compute_result_delta_win_and_draw():
+    home, away = compute_result_delta(3, 1)
+
+    assert home["points"] == 3 and home["wins"] == 1 and home["score_balance"] == 2
+    assert away["points"] == 0 and away["losses"] == 1 and away["score_balance"] == -2
+
+    home, away = compute_result_delta(2, 2)
+    assert home["points"] == away["points"] == 1
+    assert home["draws"] == away["draws"] == 1
+
+async def test_net_result_delta_reverts_previous_result():
+    # 2x0 corrigido para 1x1: mandante perde a vitória e ganha um empate
+    home, away = net_result_delta((2, 0), (1, 1))
+
+    assert home == {
+        "points": -2, "games_played": 0, "wins": -1, "draws": 1, "losses": 0,
+        "score_pro": -1, "score_against": 1, "score_balance": -2,
+    }
+    assert away["points"] == 1 and away["losses"] == -1
+
+    # Reenviar o mesmo resultado não muda nada
+    home, away = net_result_delta((1, 1), (1, 1))
+    assert not any(home.values()) and not any(away.values())
+
+async def test_submit_result_is_idempotent_on_correction(session):
+    ruleset = SportRulesetModel(name="Futsal", segment_type="TIME")
+    session.add(ruleset)
+    await session.flush()
+
+    competition = CompetitionModel(
+        modality_id=1, name="Liga", sport_ruleset_id=ruleset.id,
+        start_date=datetime(2026, 1, 1), end_date=datetime(2026, 12, 31),
+        system=CompetitionSystem.POINTS
+    )
+    session.add(competition)
+    await session.flush()
+
+    round_obj = RoundModel(competition_id=competition.id, name="Rodada 1")
+    session.add(round_obj)
+    await session.flush()
+
+    home_id, away_id = uuid.uuid4(), uuid.uuid4()
+    session.add_all([
+        ClassificationModel(competition_id=competition.id, team_id=home_id,
+                            points=0, games_played=0, wins=0, draws=0, losses=0,
+                            score_pro=0, score_against=0, score_balance=0),
+        ClassificationModel(competition_id=competition.id, team_id=away_id,
+                            points=0, games_played=0, wins=0, draws=0, losses=0,
+                            score_pro=0, score_against=0, score_balance=0),
+    ])
+    match = MatchModel(
+        competition_id=competition.id, round_id=round_obj.id, round_number_match=1,
+        home_team_id=home_id, away_team_id=away_id, status=MatchStatus.SCHEDULED
+    )
+    session.add(match)
+    await session.commit()
+
+    service = MatchesService(session)
+    await service.submit_result(match.id, MatchResultRequest(home_score=2, away_score=0))
+    await service.submit_result(match.id, MatchResultRequest(home_score=1, away_score=3))
+
+    result = await session.execute(
+        select(ClassificationModel).execution_options(populate_existing=True)
+    )
+    standings = {c.team_id: c for c in result.scalars().all()}
+
+    assert standings[home_id].points == 0 and standings[home_id].losses == 1
+    assert standings[home_id].games_played == 1 and standings[home_id].score_balance == -2
+    assert standings[away_id].points == 3 and standings[away_id].wins == 1
+    assert standings[away_id].score_pro == 3
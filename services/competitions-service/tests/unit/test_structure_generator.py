@@ -0,0 +1,93 @@
+import time
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from src.models import (
+    ClassificationModel, GroupModel, MatchModel, RoundModel, SegmentModel
+)
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from src.services.competition_generator.competition_generator import StructureGeneratorService
+
+pytestmark = pytest.mark.asyncio
+
+async def _count(session, model, competition_id=None):
+    query = select(func.count()).select_from(model)
+    if competition_id is not None:
+        query = query.where(model.competition_id == competition_id)
+    return (await session.execute(query)).scalar_one()
+
+async def test_generate_large_league_in_bulk(session, create_competition):
+    competition = await create_competition(CompetitionSystem.POINTS, 64)
+
+    start = time.perf_counter()
+    await StructureGeneratorService(session).generate_structure(competition.id)
+    elapsed = time.perf_counter() - start
+
+    assert await _count(session, RoundModel) == 63
+    assert await _count(session, MatchModel) == 64 * 63 // 2
+    assert await _count(session, SegmentModel) == 64 * 63
+    assert await _count(session, ClassificationModel) == 64
+    assert elapsed < 1.0
+
+async def test_generate_elimination_links_feeders(session, create_competition):
+    competition = await create_competition(CompetitionSystem.ELIMINATION, 6)
+
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    matches = (await session.execute(select(MatchModel))).scalars().all()
+    ids = {m.id for m in matches}
+    # 2 preliminares + 2 semifinais + final
+    assert len(matches) == 5
+    feeders = [m.home_feeder_match_id for m in matches] + [m.away_feeder_match_id for m in matches]
+    assert len([f for f in feeders if f is not None]) == 4
+    assert all(f in ids for f in feeders if f is not None)
+
+async def test_generate_groups_with_empty_knockout(session, create_competition):
+    competition = await create_competition(
+        CompetitionSystem.MIXED, 8, teams_per_group=4, teams_qualified_per_group=2
+    )
+
+    await StructureGeneratorService(session).generate_structure(competition.id)
+
+    assert await _count(session, GroupModel) == 2
+    group_matches = (await session.execute(
+        select(MatchModel).where(MatchModel.group_id.is_not(None))
+    )).scalars().all()
+    assert len(group_matches) == 12
+
+    knockout = (await session.execute(
+        select(MatchModel).where(MatchModel.group_id.is_(None))
+    )).scalars().all()
+    assert len(knockout) == 3
+    assert all(m.status == MatchStatus.PENDING for m in knockout)
+
+    standings = (await session.execute(select(ClassificationModel))).scalars().all()
+    assert all(c.group_id is not None for c in standings)
+
+async def test_preview_structure_writes_nothing_and_matches_generation(session, create_competition):
+    competition = await create_competition(
+        CompetitionSystem.MIXED, 8, teams_per_group=4, teams_qualified_per_group=2
+    )
+    service = StructureGeneratorService(session)
+
+    preview = await service.preview_structure(competition.id, seed=42)
+    assert await _count(session, MatchModel) == 0
+    assert await _count(session, RoundModel) == 0
+    assert len(preview.matches) == 15 and preview.total_segments == 30
+
+    # Simular grupos de 2 (4 grupos, 8 classificados) sem gravar
+    alternative = await service.preview_structure(competition.id, seed=42, teams_per_group=2, teams_qualified_per_group=2)
+    assert len(alternative.groups) == 4
+
+    await service.generate_structure(competition.id, seed=42)
+    groups = {
+        g.name: g.id for g in (await session.execute(select(GroupModel))).scalars().all()
+    }
+    standings = (await session.execute(select(ClassificationModel))).scalars().all()
+    expected = {
+        team_id: groups[g.name] for g in preview.groups for team_id in g.team_ids
+    }
+    assert {c.team_id: c.group_id for c in standings} == expected
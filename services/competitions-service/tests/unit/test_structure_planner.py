@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+
+from src.models.competition import CompetitionSystem
+from src.models.matches import MatchStatus
+from src.services.competition_generator.structure_planner import plan_structure, segment_template
+
+SEGMENTS = segment_template("TIME", 2, overtime_segments=1)
+
+def _teams(n):
+    return [uuid.uuid4() for _ in range(n)]
+
+def test_league_plan_every_team_plays_each_other_once():
+    teams = _teams(7)
+    plan = plan_structure(CompetitionSystem.POINTS, teams, SEGMENTS)
+
+    pairs = {frozenset((m.home_team_id, m.away_team_id)) for m in plan.matches}
+    assert len(plan.rounds) == 7
+    assert len(plan.matches) == len(pairs) == 21
+    assert plan.total_segments == 21 * 3
+
+def test_elimination_plan_wires_byes_and_feeders():
+    plan = plan_structure(CompetitionSystem.ELIMINATION, _teams(5), SEGMENTS, seed=1)
+
+    assert [r.name for r in plan.rounds] == ["Rodada Preliminar", "Semifinais", "Final"]
+    ids = [m.id for m in plan.matches]
+    for m in plan.matches:
+        for feeder in (m.home_feeder_match_id, m.away_feeder_match_id):
+            if feeder is not None:
+                # Alimentadores sempre antes do jogo que dependem deles
+                assert ids.index(feeder) < ids.index(m.id)
+    assert plan.matches[-1].has_overtime and not plan.matches[-1].has_penalties
+
+def test_group_plan_is_reproducible_by_seed():
+    teams = _teams(8)
+    first = plan_structure(CompetitionSystem.MIXED, teams, SEGMENTS, 4, 2, seed=7)
+    second = plan_structure(CompetitionSystem.MIXED, teams, SEGMENTS, 4, 2, seed=7)
+
+    assert [g.team_ids for g in first.groups] == [g.team_ids for g in second.groups]
+    knockout = [m for m in first.matches if m.group_index is None]
+    assert len(knockout) == 3 and all(m.status == MatchStatus.PENDING for m in knockout)
+
+def test_group_plan_rejects_non_power_of_two_qualified():
+    with pytest.raises(ValueError):
+        plan_structure(CompetitionSystem.MIXED, _teams(12), SEGMENTS, 4, 2)
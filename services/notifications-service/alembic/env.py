@@ -14,7 +14,7 @@ from notifications_service.core.config import settings
 
 # Importa os modelos
 from database.base import Base
-from notifications_service.infrastructure.database.models import Notification
+from notifications_service.infrastructure.database.models import Notification, UnreadCounter
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,42 @@
+"""Add notification unread counters
+
+Revision ID: 5e2f1a7c9d41
+Revises: b4d8abcd7df6
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2f1a7c9d41'
+down_revision: Union[str, None] = 'b4d8abcd7df6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_unread_counters',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('user_id', name=op.f('pk_notification_unread_counters')),
+    schema='notifications_schema'
+    )
+    # Preenche os contadores a partir das notificações existentes
+    op.execute(
+        """
+        INSERT INTO notifications_schema.notification_unread_counters (user_id, count, updated_at)
+        SELECT user_id, count(*), now()
+        FROM notifications_schema.notifications
+        WHERE is_read = false
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('notification_unread_counters', schema='notifications_schema')
@@ -0,0 +1,32 @@
+"""Add keyset pagination index to notifications
+
+Revision ID: 8a3c6b1e0f27
+Revises: 5e2f1a7c9d41
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a3c6b1e0f27'
+down_revision: Union[str, None] = '5e2f1a7c9d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_notifications_user_id_created_at_id',
+        'notifications',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        schema='notifications_schema',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_id_created_at_id', table_name='notifications', schema='notifications_schema')
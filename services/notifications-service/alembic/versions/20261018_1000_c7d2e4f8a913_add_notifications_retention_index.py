@@ -0,0 +1,33 @@
+"""Add partial index for read notification retention
+
+Revision ID: c7d2e4f8a913
+Revises: 8a3c6b1e0f27
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e4f8a913'
+down_revision: Union[str, None] = '8a3c6b1e0f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_notifications_read_created_at',
+        'notifications',
+        ['created_at'],
+        unique=False,
+        schema='notifications_schema',
+        postgresql_where=sa.text('is_read = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_read_created_at', table_name='notifications', schema='notifications_schema')
@@ -0,0 +1,70 @@
+"""
+Benchmark do registro de conexões SSE.
+
+Mede a vazão de connect, envio e disconnect com 10k a 100k conexões
+simuladas em um único worker, incluindo uma tempestade de reconexões
+concorrentes (asyncio.gather).
+
+Uso (a partir de services/notifications-service/src):
+    NOVU_API_KEY=x NOVU_APP_ID=x python ../benchmarks/sse_registry.py [10000 50000 100000]
+"""
+
+import asyncio
+import sys
+import time
+from uuid import uuid4
+
+from notifications_service.infrastructure.sse.sse_manager import SSEManager
+
+CONNECTIONS_PER_USER = 2
+
+
+def _report(label: str, operations: int, elapsed: float) -> None:
+    print(f"  {label:<31} {operations:>8} ops  {elapsed:8.3f}s  {operations / elapsed:>12,.0f} ops/s")
+
+
+async def run(total: int) -> None:
+    manager = SSEManager(replay_size_per_user=10, replay_max_users=total)
+    users = [uuid4() for _ in range(total // CONNECTIONS_PER_USER)]
+    print(f"{total} conexões ({len(users)} usuários)")
+
+    start = time.perf_counter()
+    connections = await asyncio.gather(
+        *(manager.connect(user_id) for user_id in users for _ in range(CONNECTIONS_PER_USER))
+    )
+    _report("connect (concorrente)", len(connections), time.perf_counter() - start)
+
+    for connection in connections:
+        await connection.get()  # frame "connected"
+
+    events = [manager.unread_count_event(user_id, 1) for user_id in users]
+    start = time.perf_counter()
+    await manager.publish(events)
+    _report("send (entregas)", len(users) * CONNECTIONS_PER_USER, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(manager.disconnect(connection.user_id, connection) for connection in connections)
+    )
+    _report("disconnect (concorrente)", len(connections), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    connections = await asyncio.gather(
+        *(manager.connect(user_id) for user_id in users for _ in range(CONNECTIONS_PER_USER))
+    )
+    await asyncio.gather(
+        *(manager.disconnect(connection.user_id, connection) for connection in connections)
+    )
+    _report("reconexão (connect+disconnect)", len(connections) * 2, time.perf_counter() - start)
+
+    assert manager.get_metrics()["connections"] == 0
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000, 100_000]
+    for size in sizes:
+        asyncio.run(run(size))
+
+
+if __name__ == "__main__":
+    main()
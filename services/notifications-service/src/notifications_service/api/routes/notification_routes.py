@@ -1,11 +1,10 @@
 """Rotas de notificações."""
 
 import asyncio
-import json
-from typing import Annotated
+from typing import Annotated, Literal, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 from fastapi.responses import StreamingResponse
 
 from notifications_service.api.dependencies import (
@@ -18,23 +17,47 @@ from notifications_service.infrastructure.sse import sse_manager
 from notifications_service.schemas import (
     NotificationResponse,
     NotificationListResponse,
+    NotificationCursorPage,
     UnreadCountResponse,
     SendNotificationRequest,
+    SendBatchNotificationRequest,
+    SendBatchNotificationResponse,
+    MarkManyReadRequest,
+    MarkManyReadResponse,
     NotificationCreate,
 )
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
-@router.get("", response_model=NotificationListResponse)
+@router.get("", response_model=Union[NotificationListResponse, NotificationCursorPage])
 async def list_notifications(
     service: Annotated[NotificationService, Depends(get_notification_service)],
     user_id: UUID = Query(..., description="ID do usuário"),
     page: int = Query(1, ge=1, description="Número da página"),
     page_size: int = Query(50, ge=1, le=100, description="Tamanho da página"),
     unread_only: bool = Query(False, description="Listar apenas não lidas"),
+    pagination: Literal["page", "cursor"] = Query(
+        "page", description="Modo de paginação: por página (legado) ou por cursor"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (implica pagination=cursor)"),
+    include_total: bool = Query(False, description="Incluir o total no modo cursor"),
 ):
-    """Lista notificações do usuário com paginação."""
+    """
+    Lista notificações do usuário com paginação.
+    
+    No modo cursor, a resposta traz `next_cursor` (nulo na última página) e o
+    total apenas quando `include_total=true`.
+    """
+    if pagination == "cursor" or cursor is not None:
+        return await service.list_user_notifications_by_cursor(
+            user_id=user_id,
+            limit=page_size,
+            cursor=cursor,
+            unread_only=unread_only,
+            include_total=include_total,
+        )
+    
     return await service.list_user_notifications(
         user_id=user_id,
         page=page,
@@ -56,28 +79,34 @@ async def get_unread_count(
 @router.get("/stream")
 async def stream_notifications(
     user_id: UUID = Query(..., description="ID do usuário"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
 ):
     """
     Stream de notificações em tempo real usando Server-Sent Events (SSE).
     
     O cliente mantém uma conexão aberta e recebe notificações em tempo real.
+    Ao reconectar, o header Last-Event-ID (enviado pelo EventSource) faz com
+    que os eventos perdidos sejam reenviados.
     """
+    try:
+        resume_from = int(last_event_id) if last_event_id else None
+    except ValueError:
+        resume_from = None
+
     async def event_generator():
-        queue = await sse_manager.connect(user_id)
+        connection = await sse_manager.connect(user_id, last_event_id=resume_from)
         
         try:
-            yield f"data: {json.dumps({'type': 'connected', 'data': {'message': 'Conectado ao stream de notificações'}})}\n\n"
-            
+            # Frames já serializados; o heartbeat vem da tarefa global do SSEManager
             while True:
-                try:
-                    event_data = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"data: {event_data}\n\n"
-                except asyncio.TimeoutError:
-                    yield f": heartbeat\n\n"
+                frame = await connection.get()
+                if frame is None:
+                    break
+                yield frame
         except asyncio.CancelledError:
             pass
         finally:
-            await sse_manager.disconnect(user_id, queue)
+            await sse_manager.disconnect(user_id, connection)
     
     return StreamingResponse(
         event_generator(),
@@ -90,6 +119,12 @@ async def stream_notifications(
     )
 
 
+@router.get("/stream/metrics")
+async def stream_metrics():
+    """Métricas agregadas das conexões SSE deste worker (fila pendente, descartes, coalescência), sem dados por usuário."""
+    return sse_manager.get_metrics()
+
+
 @router.get("/{notification_id}", response_model=NotificationResponse)
 async def get_notification(
     notification_id: UUID,
@@ -120,6 +155,17 @@ async def mark_all_as_read(
     return {"message": f"{count} notificações marcadas como lidas"}
 
 
+@router.post("/mark-read", response_model=MarkManyReadResponse)
+async def mark_many_as_read(
+    request: MarkManyReadRequest,
+    service: Annotated[NotificationService, Depends(get_notification_service)],
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+):
+    """Marca várias notificações como lidas em uma única requisição."""
+    count, unread_count = await service.mark_many_as_read(request.notification_ids, user_id)
+    return MarkManyReadResponse(count=count, unread_count=unread_count)
+
+
 @router.delete("/clear-all", status_code=status.HTTP_200_OK)
 async def clear_all_notifications(
     service: Annotated[NotificationService, Depends(get_notification_service)],
@@ -160,3 +206,21 @@ async def send_notification(
     )
     
     return await service.create_notification(notification_data)
+
+
+@router.post(
+    "/send-batch",
+    response_model=SendBatchNotificationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def send_notification_batch(
+    request: SendBatchNotificationRequest,
+    service: Annotated[NotificationService, Depends(get_notification_service)],
+):
+    """
+    Envia a mesma notificação para vários usuários em uma única chamada.
+    
+    Esta rota deve ser protegida e usada apenas internamente pelos outros serviços.
+    """
+    count = await service.create_notifications_batch(request)
+    return SendBatchNotificationResponse(count=count)
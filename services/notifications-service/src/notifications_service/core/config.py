@@ -1,6 +1,6 @@
 """Configurações do serviço de notificações."""
 
-from typing import List
+from typing import List, Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -19,6 +19,11 @@ class Settings(BaseSettings):
     # Novu
     novu_api_key: str
     novu_app_id: str
+    novu_queue_max_size: int = 10_000
+    novu_workers: int = 4
+    novu_batch_size: int = 100
+    novu_max_recipients: int = 100
+    novu_max_retries: int = 3
 
     # Service
     service_name: str = "notifications-service"
@@ -26,12 +31,41 @@ class Settings(BaseSettings):
     service_port: int = 8003
     debug: bool = False
 
+    # Backplane SSE entre workers: memory (processo único), postgres ou redis
+    sse_backplane: Literal["memory", "postgres", "redis"] = "memory"
+    sse_backplane_channel: str = "sse_events"
+    redis_url: Optional[str] = None
+
+    # Fila por conexão SSE: tamanho máximo e política para consumidores lentos
+    sse_queue_max_size: int = 100
+    sse_overflow_policy: Literal["drop_oldest", "coalesce", "disconnect"] = "coalesce"
+    sse_heartbeat_interval_seconds: float = 30.0
+    sse_max_connections_per_user: int = 5
+    sse_stalled_timeout_seconds: float = 120.0
+
+    # Replay de eventos SSE via Last-Event-ID
+    sse_replay_buffer_size: int = 100
+    sse_replay_max_users: int = 10_000
+    sse_replay_db_limit: int = 200
+
+    # Cache em processo das contagens de não lidas
+    unread_cache_max_users: int = 10_000
+    unread_cache_ttl_seconds: float = 30.0
+
+    # Retenção: notificações lidas mais antigas que N dias são removidas (0 desativa)
+    notification_retention_days: int = 90
+    notification_retention_batch_size: int = 1000
+    notification_retention_interval_seconds: float = 3600.0
+
     # CORS
     allowed_origins: str = "http://localhost:3000,http://localhost:8000"
 
     # Auth Service
     auth_service_url: str = "http://localhost:8001"
 
+    # URL da API de notificações usada pelo NotificationsClient
+    notifications_api_url: str = "http://localhost:8003/api/v1"
+
     @property
     def cors_origins(self) -> List[str]:
         """Retorna a lista de origens permitidas."""
@@ -36,6 +36,17 @@ class InvalidNotificationTypeException(AppException):
         )
 
 
+class InvalidCursorException(AppException):
+    """Exceção quando o cursor de paginação é inválido."""
+
+    def __init__(self):
+        super().__init__(
+            message="Cursor de paginação inválido",
+            status_code=400,
+            code="INVALID_CURSOR",
+        )
+
+
 class NovuException(AppException):
     """Exceção quando há erro ao comunicar com Novu."""
 
@@ -1,7 +1,8 @@
 """Interface do repositório de notificações."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
 from notifications_service.infrastructure.database.models import Notification
@@ -12,12 +13,24 @@ class INotificationRepository(ABC):
 
     @abstractmethod
     async def create(self, notification: Notification) -> Notification:
-        """Cria uma nova notificação."""
+        """Cria uma nova notificação na transação corrente (sem commit)."""
         pass
 
     @abstractmethod
-    async def get_by_id(self, notification_id: UUID) -> Optional[Notification]:
-        """Busca uma notificação por ID."""
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> int:
+        """Cria várias notificações em lote (sem commit)."""
+        pass
+
+    @abstractmethod
+    async def set_novu_notification_ids(self, novu_ids: dict[UUID, str]) -> None:
+        """Registra os IDs do Novu de várias notificações em uma única instrução."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(
+        self, notification_id: UUID, for_update: bool = False
+    ) -> Optional[Notification]:
+        """Busca uma notificação por ID, opcionalmente bloqueando a linha."""
         pass
 
     @abstractmethod
@@ -32,21 +45,76 @@ class INotificationRepository(ABC):
         pass
 
     @abstractmethod
-    async def mark_as_read(self, notification_id: UUID) -> Optional[Notification]:
-        """Marca uma notificação como lida."""
+    async def get_by_user_after(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        unread_only: bool = False,
+    ) -> Sequence[Notification]:
+        """Busca notificações de um usuário por keyset (created_at, id), das mais recentes às mais antigas."""
+        pass
+
+    @abstractmethod
+    async def count_by_user(self, user_id: UUID) -> int:
+        """Conta todas as notificações de um usuário."""
+        pass
+
+    @abstractmethod
+    async def get_created_after(
+        self, user_id: UUID, since: datetime, limit: int
+    ) -> Sequence[Notification]:
+        """Busca as notificações de um usuário criadas a partir de `since`, da mais antiga à mais recente."""
+        pass
+
+    @abstractmethod
+    async def mark_as_read(self, notification_id: UUID, user_id: UUID) -> Optional[Notification]:
+        """Marca como lida uma notificação não lida do usuário; None se nada mudou."""
+        pass
+
+    @abstractmethod
+    async def mark_many_as_read(
+        self, notification_ids: Sequence[UUID], user_id: UUID
+    ) -> Sequence[Notification]:
+        """Marca como lidas as notificações não lidas do usuário em um único UPDATE (sem commit)."""
         pass
 
     @abstractmethod
     async def mark_all_as_read(self, user_id: UUID) -> int:
-        """Marca todas as notificações de um usuário como lidas."""
+        """Marca todas as notificações de um usuário como lidas (sem commit)."""
+        pass
+
+    @abstractmethod
+    async def adjust_unread(self, user_id: UUID, delta: int) -> int:
+        """Soma `delta` ao contador de não lidas do usuário e retorna o novo valor."""
+        pass
+
+    @abstractmethod
+    async def increment_unread_many(self, user_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Incrementa em 1 o contador de vários usuários e retorna os novos valores."""
         pass
 
     @abstractmethod
     async def count_unread(self, user_id: UUID) -> int:
-        """Conta notificações não lidas de um usuário."""
+        """Retorna o contador de notificações não lidas de um usuário."""
         pass
 
     @abstractmethod
-    async def delete(self, notification_id: UUID) -> bool:
+    async def count_unread_by_users(self, user_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Retorna o contador de não lidas de vários usuários em uma única consulta."""
+        pass
+
+    @abstractmethod
+    async def delete(self, notification: Notification) -> None:
         """Deleta uma notificação."""
         pass
+
+    @abstractmethod
+    async def delete_all_by_user(self, user_id: UUID) -> tuple[int, int]:
+        """Deleta todas as notificações de um usuário; retorna (deletadas, não lidas)."""
+        pass
+
+    @abstractmethod
+    async def purge_read_before(self, cutoff: datetime, limit: int) -> int:
+        """Remove até `limit` notificações lidas criadas antes de `cutoff`."""
+        pass
@@ -1,33 +1,56 @@
 """Serviço de notificações com lógica de negócio."""
 
+import base64
+import binascii
 import logging
+from datetime import datetime
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 import math
 
 from notifications_service.core.exceptions import (
+    InvalidCursorException,
     NotificationNotFoundException,
     NotificationAccessDeniedException,
 )
 from notifications_service.domain.interfaces.repositories import INotificationRepository
+from notifications_service.infrastructure.cache import unread_count_cache
 from notifications_service.infrastructure.database.models import Notification, NotificationType
-from notifications_service.infrastructure.external import novu_client
+from notifications_service.infrastructure.external import NovuDelivery, novu_delivery_queue
 from notifications_service.infrastructure.sse import sse_manager
 from notifications_service.schemas import (
     NotificationCreate,
     NotificationResponse,
     NotificationListResponse,
+    NotificationCursorPage,
+    SendBatchNotificationRequest,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_cursor(notification: Notification) -> str:
+    """Codifica a chave (created_at, id) de uma notificação como cursor opaco."""
+    raw = f"{notification.created_at.isoformat()}|{notification.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decodifica um cursor gerado por `_encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, notification_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(notification_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorException()
+
+
 class NotificationService:
     """Serviço de gerenciamento de notificações."""
 
     def __init__(self, notification_repo: INotificationRepository):
         self.notification_repo = notification_repo
-        self.novu = novu_client
+        self.novu_queue = novu_delivery_queue
 
     async def create_notification(
         self,
@@ -39,7 +62,7 @@ class NotificationService:
         
         Args:
             notification_data: Dados da notificação
-            send_to_novu: Se deve enviar para o Novu
+            send_to_novu: Se deve agendar a entrega pelo Novu
             
         Returns:
             Notificação criada
@@ -54,11 +77,15 @@ class NotificationService:
         )
         
         notification = await self.notification_repo.create(notification)
+        unread_count = await self.notification_repo.adjust_unread(notification.user_id, 1)
+        await self.notification_repo.session.commit()
+        unread_count_cache.set(notification.user_id, unread_count)
         
         if send_to_novu:
-            try:
-                novu_id = await self.novu.send_notification(
-                    user_id=notification_data.user_id,
+            self.novu_queue.enqueue(
+                NovuDelivery(
+                    notification_ids=[notification.id],
+                    user_ids=[notification_data.user_id],
                     template_id=notification_data.type,
                     payload={
                         "title": notification_data.title,
@@ -67,10 +94,7 @@ class NotificationService:
                         "action_url": notification_data.action_url,
                     },
                 )
-                notification.novu_notification_id = novu_id
-                await self.notification_repo.session.commit()
-            except Exception as e:
-                logger.error(f"Erro ao enviar notificação para Novu: {e}")
+            )
         
         notification_response = NotificationResponse.model_validate(notification)
         
@@ -81,7 +105,6 @@ class NotificationService:
                 user_id=notification_data.user_id,
                 notification_data=notification_dict
             )
-            unread_count = await self.count_unread(notification_data.user_id)
             logger.info(f"Enviando atualização de contagem via SSE para usuário {notification_data.user_id}: {unread_count}")
             await sse_manager.send_unread_count_update(notification_data.user_id, unread_count)
         except Exception as e:
@@ -89,6 +112,80 @@ class NotificationService:
         
         return notification_response
 
+    async def create_notifications_batch(
+        self,
+        batch: SendBatchNotificationRequest,
+        send_to_novu: bool = True,
+    ) -> int:
+        """
+        Cria a mesma notificação para vários usuários.
+        
+        As linhas são gravadas em lote (executemany), os contadores de não
+        lidas são incrementados em um único upsert na mesma transação e os
+        eventos SSE são publicados no backplane de uma só vez.
+        
+        Args:
+            batch: Template da notificação e lista de destinatários
+            send_to_novu: Se deve enviar para o Novu
+            
+        Returns:
+            Número de notificações criadas
+        """
+        user_ids = list(dict.fromkeys(batch.user_ids))
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_id,
+                "type": batch.type,
+                "title": batch.title,
+                "message": batch.message,
+                "extra_data": batch.extra_data,
+                "action_url": batch.action_url,
+                "is_read": False,
+                "read_at": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user_id in user_ids
+        ]
+        
+        count = await self.notification_repo.create_many(rows)
+        unread_counts = await self.notification_repo.increment_unread_many(user_ids)
+        await self.notification_repo.session.commit()
+        for user_id, unread_count in unread_counts.items():
+            unread_count_cache.set(user_id, unread_count)
+        
+        if send_to_novu:
+            self.novu_queue.enqueue(
+                NovuDelivery(
+                    notification_ids=[row["id"] for row in rows],
+                    user_ids=user_ids,
+                    template_id=batch.type,
+                    payload={
+                        "title": batch.title,
+                        "message": batch.message,
+                        "extra_data": batch.extra_data or {},
+                        "action_url": batch.action_url,
+                    },
+                )
+            )
+        
+        try:
+            events = []
+            for row in rows:
+                notification_dict = NotificationResponse.model_validate(row).model_dump(mode='json')
+                events.append(sse_manager.notification_event(row["user_id"], notification_dict))
+                events.append(
+                    sse_manager.unread_count_event(row["user_id"], unread_counts.get(row["user_id"], 0))
+                )
+            await sse_manager.publish(events)
+        except Exception as e:
+            logger.error(f"Erro ao enviar notificações em lote via SSE: {e}", exc_info=True)
+        
+        logger.info(f"{count} notificações {batch.type} criadas em lote")
+        return count
+
     async def get_notification(
         self,
         notification_id: UUID,
@@ -152,6 +249,56 @@ class NotificationService:
             total_pages=total_pages,
         )
 
+    async def list_user_notifications_by_cursor(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        unread_only: bool = False,
+        include_total: bool = False,
+    ) -> NotificationCursorPage:
+        """
+        Lista notificações de um usuário com paginação por cursor (keyset).
+        
+        O custo de cada página independe da profundidade. O total só é
+        calculado quando pedido; para não lidas vem do contador mantido.
+        
+        Args:
+            user_id: ID do usuário
+            limit: Tamanho da página
+            cursor: Cursor retornado pela página anterior
+            unread_only: Se deve listar apenas não lidas
+            include_total: Se deve incluir o total de notificações
+            
+        Returns:
+            Página de notificações e o cursor da próxima página
+        """
+        after = _decode_cursor(cursor) if cursor else None
+        
+        notifications = await self.notification_repo.get_by_user_after(
+            user_id=user_id,
+            limit=limit + 1,
+            after=after,
+            unread_only=unread_only,
+        )
+        
+        has_more = len(notifications) > limit
+        notifications = notifications[:limit]
+        
+        total = None
+        if include_total:
+            if unread_only:
+                total = await self.count_unread(user_id)
+            else:
+                total = await self.notification_repo.count_by_user(user_id)
+        
+        return NotificationCursorPage(
+            items=[NotificationResponse.model_validate(n) for n in notifications],
+            next_cursor=_encode_cursor(notifications[-1]) if has_more else None,
+            total=total,
+            limit=limit,
+        )
+
     async def mark_as_read(
         self,
         notification_id: UUID,
@@ -160,6 +307,10 @@ class NotificationService:
         """
         Marca uma notificação como lida.
         
+        Um único UPDATE ... RETURNING com verificação de dono; a notificação só
+        é buscada novamente quando nada mudou, para distinguir inexistente,
+        de outro usuário ou já lida.
+        
         Args:
             notification_id: ID da notificação
             user_id: ID do usuário (para verificar acesso)
@@ -167,12 +318,19 @@ class NotificationService:
         Returns:
             Notificação atualizada
         """
-        await self.get_notification(notification_id, user_id)
+        notification = await self.notification_repo.mark_as_read(notification_id, user_id)
         
-        notification = await self.notification_repo.mark_as_read(notification_id)
+        if notification is None:
+            existing = await self.notification_repo.get_by_id(notification_id)
+            if not existing:
+                raise NotificationNotFoundException(str(notification_id))
+            if existing.user_id != user_id:
+                raise NotificationAccessDeniedException()
+            return NotificationResponse.model_validate(existing)
         
-        if not notification:
-            raise NotificationNotFoundException(str(notification_id))
+        unread_count = await self.notification_repo.adjust_unread(user_id, -1)
+        await self.notification_repo.session.commit()
+        unread_count_cache.set(user_id, unread_count)
         
         notification_response = NotificationResponse.model_validate(notification)
         
@@ -183,7 +341,6 @@ class NotificationService:
                 user_id=user_id,
                 notification_data=notification_dict
             )
-            unread_count = await self.count_unread(user_id)
             logger.info(f"Enviando atualização de contagem via SSE para usuário {user_id}: {unread_count}")
             await sse_manager.send_unread_count_update(user_id, unread_count)
         except Exception as e:
@@ -191,6 +348,48 @@ class NotificationService:
         
         return notification_response
 
+    async def mark_many_as_read(
+        self,
+        notification_ids: list[UUID],
+        user_id: UUID,
+    ) -> tuple[int, int]:
+        """
+        Marca várias notificações do usuário como lidas em uma única instrução.
+        
+        IDs inexistentes, de outros usuários ou já lidos são ignorados.
+        
+        Args:
+            notification_ids: IDs das notificações
+            user_id: ID do usuário
+            
+        Returns:
+            Tupla (notificações marcadas, nova contagem de não lidas)
+        """
+        notifications = await self.notification_repo.mark_many_as_read(
+            list(dict.fromkeys(notification_ids)), user_id
+        )
+        
+        if not notifications:
+            return 0, await self.count_unread(user_id)
+        
+        unread_count = await self.notification_repo.adjust_unread(user_id, -len(notifications))
+        await self.notification_repo.session.commit()
+        unread_count_cache.set(user_id, unread_count)
+        
+        try:
+            events = [
+                sse_manager.notification_event(
+                    user_id, NotificationResponse.model_validate(n).model_dump(mode='json')
+                )
+                for n in notifications
+            ]
+            events.append(sse_manager.unread_count_event(user_id, unread_count))
+            await sse_manager.publish(events)
+        except Exception as e:
+            logger.error(f"Erro ao enviar atualizações em lote via SSE: {e}", exc_info=True)
+        
+        return len(notifications), unread_count
+
     async def mark_all_as_read(self, user_id: UUID) -> int:
         """
         Marca todas as notificações de um usuário como lidas.
@@ -202,9 +401,11 @@ class NotificationService:
             Número de notificações marcadas como lidas
         """
         count = await self.notification_repo.mark_all_as_read(user_id)
+        unread_count = await self.notification_repo.adjust_unread(user_id, -count)
+        await self.notification_repo.session.commit()
+        unread_count_cache.set(user_id, unread_count)
         
         try:
-            unread_count = await self.count_unread(user_id)
             await sse_manager.send_unread_count_update(user_id, unread_count)
         except Exception as e:
             logger.error(f"Erro ao enviar atualização de contagem via SSE: {e}")
@@ -215,13 +416,19 @@ class NotificationService:
         """
         Conta notificações não lidas de um usuário.
         
+        Lê o contador mantido pelas escritas, passando antes pelo cache em processo.
+        
         Args:
             user_id: ID do usuário
             
         Returns:
             Número de notificações não lidas
         """
-        return await self.notification_repo.count_unread(user_id)
+        unread_count = unread_count_cache.get(user_id)
+        if unread_count is None:
+            unread_count = await self.notification_repo.count_unread(user_id)
+            unread_count_cache.set(user_id, unread_count)
+        return unread_count
 
     async def send_organization_invite(
         self,
@@ -303,7 +510,7 @@ class NotificationService:
             notification_id: ID da notificação
             user_id: ID do usuário (para verificar acesso)
         """
-        notification = await self.notification_repo.get_by_id(notification_id)
+        notification = await self.notification_repo.get_by_id(notification_id, for_update=True)
         
         if not notification:
             raise NotificationNotFoundException(str(notification_id))
@@ -311,11 +518,13 @@ class NotificationService:
         if notification.user_id != user_id:
             raise NotificationAccessDeniedException()
         
+        was_unread = not notification.is_read
         await self.notification_repo.delete(notification)
+        unread_count = await self.notification_repo.adjust_unread(user_id, -1 if was_unread else 0)
         await self.notification_repo.session.commit()
+        unread_count_cache.set(user_id, unread_count)
         
         try:
-            unread_count = await self.count_unread(user_id)
             await sse_manager.send_unread_count_update(user_id, unread_count)
         except Exception as e:
             logger.error(f"Erro ao enviar atualização de contagem via SSE: {e}")
@@ -335,11 +544,12 @@ class NotificationService:
         Returns:
             Número de notificações deletadas
         """
-        count = await self.notification_repo.delete_all_by_user(user_id)
+        count, unread_deleted = await self.notification_repo.delete_all_by_user(user_id)
+        unread_count = await self.notification_repo.adjust_unread(user_id, -unread_deleted)
         await self.notification_repo.session.commit()
+        unread_count_cache.set(user_id, unread_count)
         
         try:
-            unread_count = await self.count_unread(user_id)
             await sse_manager.send_unread_count_update(user_id, unread_count)
         except Exception as e:
             logger.error(f"Erro ao enviar atualização de contagem via SSE: {e}")
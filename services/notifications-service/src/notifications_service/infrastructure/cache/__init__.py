@@ -0,0 +1,8 @@
+"""Caches em processo do serviço de notificações."""
+
+from notifications_service.infrastructure.cache.unread_count_cache import (
+    UnreadCountCache,
+    unread_count_cache,
+)
+
+__all__ = ["UnreadCountCache", "unread_count_cache"]
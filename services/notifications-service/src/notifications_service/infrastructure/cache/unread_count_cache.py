@@ -0,0 +1,54 @@
+"""Cache em processo das contagens de não lidas dos usuários mais ativos."""
+
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from uuid import UUID
+
+from notifications_service.core.config import settings
+
+
+class UnreadCountCache:
+    """
+    LRU com TTL das contagens de não lidas.
+
+    É alimentado pelos valores retornados pelas escritas e pelos eventos
+    `unread_count` recebidos do backplane SSE, o que mantém os workers
+    coerentes; o TTL limita a defasagem quando um evento se perde.
+    """
+
+    def __init__(self, max_users: int = 10_000, ttl_seconds: float = 30.0):
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[int, float]]" = OrderedDict()
+
+    def get(self, user_id: UUID) -> Optional[int]:
+        """Retorna a contagem em cache ou None se ausente ou expirada."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        count, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return count
+
+    def set(self, user_id: UUID, count: int) -> None:
+        """Registra a contagem atual do usuário."""
+        if self.max_users <= 0:
+            return
+        self._entries[user_id] = (count, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Remove a contagem do usuário do cache."""
+        self._entries.pop(user_id, None)
+
+
+unread_count_cache = UnreadCountCache(
+    max_users=settings.unread_cache_max_users,
+    ttl_seconds=settings.unread_cache_ttl_seconds,
+)
@@ -4,5 +4,6 @@ from notifications_service.infrastructure.database.models.notification_model imp
     Notification,
     NotificationType,
 )
+from notifications_service.infrastructure.database.models.unread_counter_model import UnreadCounter
 
-__all__ = ["Notification", "NotificationType"]
+__all__ = ["Notification", "NotificationType", "UnreadCounter"]
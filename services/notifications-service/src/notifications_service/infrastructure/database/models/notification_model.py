@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, String, Boolean, Text, JSON
+from sqlalchemy import DateTime, String, Boolean, Text, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from database.base import Base
 from notifications_service.core.config import settings
@@ -73,3 +73,19 @@ class Notification(Base):
 
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type})>"
+
+
+# Índice da paginação por cursor: (user_id, created_at DESC, id DESC)
+Index(
+    "ix_notifications_user_id_created_at_id",
+    Notification.user_id,
+    Notification.created_at.desc(),
+    Notification.id.desc(),
+)
+
+# Índice parcial da rotina de retenção (apenas notificações lidas)
+Index(
+    "ix_notifications_read_created_at",
+    Notification.created_at,
+    postgresql_where=Notification.is_read == True,
+)
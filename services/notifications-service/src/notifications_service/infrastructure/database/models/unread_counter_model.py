@@ -0,0 +1,33 @@
+"""Modelo do contador de notificações não lidas."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from database.base import Base
+from notifications_service.core.config import settings
+
+
+class UnreadCounter(Base):
+    """
+    Contador de notificações não lidas por usuário.
+
+    Atualizado na mesma transação de cada mutação em `notifications`, evita
+    um COUNT(*) sobre as notificações do usuário a cada leitura.
+    """
+
+    __tablename__ = "notification_unread_counters"
+    __table_args__ = {"schema": settings.notifications_database_schema}
+
+    user_id: Mapped[UUID] = mapped_column(primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<UnreadCounter(user_id={self.user_id}, count={self.count})>"
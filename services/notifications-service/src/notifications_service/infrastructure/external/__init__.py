@@ -4,5 +4,22 @@ from notifications_service.infrastructure.external.novu_client import (
     NovuClient,
     novu_client,
 )
+from notifications_service.infrastructure.external.novu_delivery_queue import (
+    NovuDelivery,
+    NovuDeliveryQueue,
+    novu_delivery_queue,
+)
+from notifications_service.infrastructure.external.notifications_client import (
+    NotificationsClient,
+    notifications_client,
+)
 
-__all__ = ["NovuClient", "novu_client"]
+__all__ = [
+    "NovuClient",
+    "novu_client",
+    "NovuDelivery",
+    "NovuDeliveryQueue",
+    "novu_delivery_queue",
+    "NotificationsClient",
+    "notifications_client",
+]
@@ -5,6 +5,7 @@ from typing import Dict, Any, Optional
 from uuid import UUID
 
 import httpx
+from common.http import CircuitOpenError, ServiceHttpClient
 
 from notifications_service.core.config import settings
 
@@ -14,9 +15,22 @@ logger = logging.getLogger(__name__)
 class NotificationsClient:
     """Cliente para comunicação com o serviço de notificações."""
 
-    def __init__(self, base_url: str = "http://localhost:8003/api/v1"):
-        self.base_url = base_url
-        self.timeout = 10.0
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0):
+        self.base_url = base_url or settings.notifications_api_url
+        self.timeout = timeout
+        self.http = ServiceHttpClient(
+            name="notifications-service",
+            base_url=self.base_url,
+            timeout=self.timeout,
+        )
+
+    async def start(self) -> None:
+        """Abre o pool de conexões keep-alive (chamado no lifespan)."""
+        await self.http.start()
+
+    async def close(self) -> None:
+        """Fecha o pool de conexões."""
+        await self.http.close()
 
     async def send_notification(
         self,
@@ -42,21 +56,23 @@ class NotificationsClient:
             True se enviado com sucesso
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/notifications/send",
-                    json={
-                        "user_id": str(user_id),
-                        "type": notification_type,
-                        "title": title,
-                        "message": message,
-                        "extra_data": extra_data or {},
-                        "action_url": action_url,
-                    },
-                )
-                response.raise_for_status()
-                logger.info(f"Notificação enviada com sucesso para usuário {user_id}")
-                return True
+            response = await self.http.post(
+                "/notifications/send",
+                json={
+                    "user_id": str(user_id),
+                    "type": notification_type,
+                    "title": title,
+                    "message": message,
+                    "extra_data": extra_data or {},
+                    "action_url": action_url,
+                },
+            )
+            response.raise_for_status()
+            logger.info(f"Notificação enviada com sucesso para usuário {user_id}")
+            return True
+        except CircuitOpenError as e:
+            logger.warning(f"Notificação não enviada: {e}")
+            return False
         except httpx.HTTPError as e:
             logger.error(f"Erro ao enviar notificação: {e}")
             return False
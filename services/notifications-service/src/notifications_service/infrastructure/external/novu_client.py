@@ -1,10 +1,12 @@
 """Cliente Novu para envio de notificações."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from uuid import UUID
 
 from novu.api import EventApi
+from novu.dto.event import InputEventDto
 
 from notifications_service.core.config import settings
 from notifications_service.core.exceptions import NovuException
@@ -45,7 +47,8 @@ class NovuClient:
         try:
             subscriber_id = str(user_id)
             
-            response = self.event_api.trigger(
+            response = await asyncio.to_thread(
+                self.event_api.trigger,
                 name=template_id,
                 recipients=subscriber_id,
                 payload=payload,
@@ -62,6 +65,38 @@ class NovuClient:
             logger.error(f"Erro ao enviar notificação via Novu: {e}")
             raise NovuException(f"Erro ao enviar notificação: {str(e)}")
 
+    async def trigger_bulk(self, events: Sequence[Dict[str, Any]]) -> List[str]:
+        """
+        Dispara vários eventos em uma única chamada ao endpoint bulk do Novu.
+        
+        A chamada HTTP do SDK é síncrona e roda em uma thread para não
+        bloquear o event loop.
+        
+        Args:
+            events: Eventos com `name`, `recipients`, `payload` e `transaction_id`
+            
+        Returns:
+            IDs de transação na mesma ordem dos eventos
+        """
+        try:
+            responses = await asyncio.to_thread(
+                self.event_api.trigger_bulk,
+                [
+                    InputEventDto(
+                        name=event["name"],
+                        recipients=event["recipients"],
+                        payload=event["payload"],
+                        transaction_id=event.get("transaction_id"),
+                    )
+                    for event in events
+                ],
+            )
+            return [getattr(response, "transaction_id", "") or "" for response in responses]
+            
+        except Exception as e:
+            logger.error(f"Erro ao enviar lote de {len(events)} eventos via Novu: {e}")
+            raise NovuException(f"Erro ao enviar notificações: {str(e)}")
+
     async def create_subscriber(
         self,
         user_id: UUID,
@@ -87,7 +122,8 @@ class NovuClient:
             subscriber_api = SubscriberApi(url="https://api.novu.co", api_key=settings.novu_api_key)
             subscriber_id = str(user_id)
             
-            subscriber_api.create(
+            await asyncio.to_thread(
+                subscriber_api.create,
                 subscriber_id=subscriber_id,
                 email=email,
                 first_name=first_name,
@@ -0,0 +1,217 @@
+"""Fila assíncrona de entrega de notificações ao Novu."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from database.client import db
+
+from notifications_service.core.config import settings
+from notifications_service.infrastructure.external.novu_client import NovuClient, novu_client
+from notifications_service.infrastructure.repositories import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NovuDelivery:
+    """
+    Entrega pendente: um template para um ou mais destinatários.
+
+    `notification_ids` e `user_ids` são paralelos: a notificação `i` é a do
+    destinatário `i`.
+    """
+
+    notification_ids: List[UUID]
+    user_ids: List[UUID]
+    template_id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+class NovuDeliveryQueue:
+    """
+    Entrega notificações ao Novu fora do caminho da requisição.
+
+    Workers com concorrência limitada agrupam as entregas disponíveis na fila
+    em chamadas ao endpoint bulk do Novu, com novas tentativas e backoff
+    exponencial. Cada entrega vira um ou mais eventos de até
+    `max_recipients` destinatários, e cada chamada leva até `batch_size`
+    eventos (os limites do Novu). Os IDs de transação retornados são
+    gravados em lote.
+    """
+
+    def __init__(
+        self,
+        client: NovuClient,
+        max_size: int = 10_000,
+        workers: int = 4,
+        batch_size: int = 100,
+        max_recipients: int = 100,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        flush_interval: float = 1.0,
+    ):
+        self.client = client
+        self.max_size = max_size
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_recipients = max_recipients
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pending_ids: Dict[UUID, str] = {}
+
+    def enqueue(self, delivery: NovuDelivery) -> bool:
+        """
+        Agenda uma entrega sem bloquear quem chamou.
+
+        Returns:
+            False se a fila estiver cheia ou não iniciada (a entrega é descartada)
+        """
+        if self._queue is None:
+            logger.warning("Fila do Novu não iniciada; entrega descartada")
+            return False
+
+        try:
+            self._queue.put_nowait(delivery)
+            return True
+        except asyncio.QueueFull:
+            logger.error(
+                f"Fila do Novu cheia ({self.max_size}); entrega {delivery.template_id} descartada"
+            )
+            return False
+
+    async def start(self) -> None:
+        """Inicia os workers de entrega e a gravação periódica dos IDs."""
+        if self._tasks:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._flush_loop()))
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Aguarda a fila esvaziar por até `timeout` segundos e encerra os workers."""
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"{self._queue.qsize()} entrega(s) ao Novu descartada(s) no encerramento"
+                )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+        await self._flush_ids()
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                logger.error(f"Erro no worker {worker_id} do Novu: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _build_events(
+        self, batch: List[NovuDelivery]
+    ) -> List[Tuple[List[UUID], Dict[str, Any]]]:
+        """
+        Divide as entregas em eventos de até `max_recipients` destinatários.
+
+        O `transaction_id` de cada evento é a primeira notificação do seu
+        trecho, então é único por evento e estável entre tentativas.
+        """
+        events = []
+        for delivery in batch:
+            for start in range(0, len(delivery.user_ids), self.max_recipients):
+                notification_ids = delivery.notification_ids[start:start + self.max_recipients]
+                user_ids = delivery.user_ids[start:start + self.max_recipients]
+                events.append((
+                    notification_ids,
+                    {
+                        "name": delivery.template_id,
+                        "recipients": [str(user_id) for user_id in user_ids],
+                        "payload": delivery.payload,
+                        "transaction_id": str(notification_ids[0]),
+                    },
+                ))
+        return events
+
+    async def _deliver(self, batch: List[NovuDelivery]) -> None:
+        events = self._build_events(batch)
+        for start in range(0, len(events), self.batch_size):
+            await self._trigger(events[start:start + self.batch_size])
+
+    async def _trigger(self, events: List[Tuple[List[UUID], Dict[str, Any]]]) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                transaction_ids = await self.client.trigger_bulk(
+                    [event for _, event in events]
+                )
+                break
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    logger.error(
+                        f"Falha ao entregar {len(events)} evento(s) ao Novu após "
+                        f"{attempt + 1} tentativas: {e}"
+                    )
+                    return
+                await asyncio.sleep(self.backoff_base * 2 ** attempt)
+
+        for (notification_ids, _), transaction_id in zip(events, transaction_ids):
+            if not transaction_id:
+                continue
+            for notification_id in notification_ids:
+                self._pending_ids[notification_id] = transaction_id
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_ids()
+
+    async def _flush_ids(self) -> None:
+        """Grava em uma única instrução os IDs do Novu acumulados."""
+        if not self._pending_ids:
+            return
+
+        pending, self._pending_ids = self._pending_ids, {}
+        try:
+            async with db.session() as session:
+                await NotificationRepository(session).set_novu_notification_ids(pending)
+        except Exception as e:
+            logger.error(f"Erro ao gravar {len(pending)} ID(s) do Novu: {e}")
+
+    @property
+    def size(self) -> int:
+        """Número de entregas aguardando na fila."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+
+novu_delivery_queue = NovuDeliveryQueue(
+    client=novu_client,
+    max_size=settings.novu_queue_max_size,
+    workers=settings.novu_workers,
+    batch_size=settings.novu_batch_size,
+    max_recipients=settings.novu_max_recipients,
+    max_retries=settings.novu_max_retries,
+)
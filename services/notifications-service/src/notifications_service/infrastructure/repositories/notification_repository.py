@@ -1,14 +1,15 @@
 """Repositório de notificações."""
 
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, func, update
+from sqlalchemy import case, delete, insert, select, func, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from notifications_service.domain.interfaces.repositories import INotificationRepository
-from notifications_service.infrastructure.database.models import Notification
+from notifications_service.infrastructure.database.models import Notification, UnreadCounter
 
 
 class NotificationRepository(INotificationRepository):
@@ -18,17 +19,45 @@ class NotificationRepository(INotificationRepository):
         self.session = session
 
     async def create(self, notification: Notification) -> Notification:
-        """Cria uma nova notificação."""
+        """Cria uma nova notificação na transação corrente (sem commit)."""
         self.session.add(notification)
-        await self.session.commit()
-        await self.session.refresh(notification)
+        await self.session.flush()
         return notification
 
-    async def get_by_id(self, notification_id: UUID) -> Optional[Notification]:
-        """Busca uma notificação por ID."""
-        result = await self.session.execute(
-            select(Notification).where(Notification.id == notification_id)
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> int:
+        """
+        Cria várias notificações em lote (sem commit).
+        
+        Usa executemany em vez de um único VALUES multi-linha: com ~11
+        parâmetros por linha, um lote grande passaria do limite de 32767
+        parâmetros por instrução do asyncpg.
+        """
+        if not rows:
+            return 0
+        await self.session.execute(insert(Notification), list(rows))
+        return len(rows)
+
+    async def set_novu_notification_ids(self, novu_ids: dict[UUID, str]) -> None:
+        """Registra os IDs do Novu de várias notificações em uma única instrução."""
+        if not novu_ids:
+            return
+        await self.session.execute(
+            update(Notification)
+            .where(Notification.id.in_(list(novu_ids)))
+            .values(
+                novu_notification_id=case(novu_ids, value=Notification.id)
+            )
         )
+        await self.session.commit()
+
+    async def get_by_id(
+        self, notification_id: UUID, for_update: bool = False
+    ) -> Optional[Notification]:
+        """Busca uma notificação por ID, opcionalmente bloqueando a linha."""
+        query = select(Notification).where(Notification.id == notification_id)
+        if for_update:
+            query = query.with_for_update()
+        result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
     async def get_by_user(
@@ -54,48 +83,203 @@ class NotificationRepository(INotificationRepository):
         
         return notifications, total
 
-    async def mark_as_read(self, notification_id: UUID) -> Optional[Notification]:
-        """Marca uma notificação como lida."""
-        notification = await self.get_by_id(notification_id)
-        if notification:
-            notification.is_read = True
-            notification.read_at = datetime.utcnow()
-            await self.session.commit()
-            await self.session.refresh(notification)
-        return notification
+    async def get_by_user_after(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        unread_only: bool = False,
+    ) -> Sequence[Notification]:
+        """
+        Busca notificações de um usuário por keyset, das mais recentes às mais antigas.
+        
+        Usa o índice (user_id, created_at DESC, id DESC); `after` é a chave
+        (created_at, id) do último item da página anterior.
+        """
+        query = select(Notification).where(Notification.user_id == user_id)
+        
+        if unread_only:
+            query = query.where(Notification.is_read == False)
+        
+        if after is not None:
+            query = query.where(
+                tuple_(Notification.created_at, Notification.id) < tuple_(*after)
+            )
+        
+        query = query.order_by(
+            Notification.created_at.desc(), Notification.id.desc()
+        ).limit(limit)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def count_by_user(self, user_id: UUID) -> int:
+        """Conta todas as notificações de um usuário."""
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id)
+        )
+        return result.scalar_one()
+
+    async def get_created_after(
+        self, user_id: UUID, since: datetime, limit: int
+    ) -> Sequence[Notification]:
+        """
+        Busca as notificações de um usuário criadas a partir de `since`, da mais antiga à mais recente.
+        
+        Inclui as criadas exatamente em `since`, para não perder as do mesmo
+        instante; a ordem (created_at, id) segue o índice (user_id, created_at, id).
+        """
+        result = await self.session.execute(
+            select(Notification)
+            .where(Notification.user_id == user_id, Notification.created_at >= since)
+            .order_by(Notification.created_at.asc(), Notification.id.asc())
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def mark_as_read(self, notification_id: UUID, user_id: UUID) -> Optional[Notification]:
+        """
+        Marca como lida uma notificação não lida do usuário em uma única instrução.
+        
+        Returns:
+            A notificação atualizada, ou None se não existe, é de outro usuário
+            ou já estava lida
+        """
+        notifications = await self.mark_many_as_read([notification_id], user_id)
+        return notifications[0] if notifications else None
+
+    async def mark_many_as_read(
+        self, notification_ids: Sequence[UUID], user_id: UUID
+    ) -> Sequence[Notification]:
+        """
+        Marca como lidas, em um único UPDATE ... RETURNING, as notificações não
+        lidas do usuário entre `notification_ids` (sem commit).
+        
+        Returns:
+            As notificações que passaram de não lidas para lidas
+        """
+        if not notification_ids:
+            return []
+        result = await self.session.execute(
+            update(Notification)
+            .where(
+                Notification.id.in_(notification_ids),
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+            )
+            .values(is_read=True, read_at=datetime.utcnow())
+            .returning(Notification)
+        )
+        return result.scalars().all()
 
     async def mark_all_as_read(self, user_id: UUID) -> int:
-        """Marca todas as notificações de um usuário como lidas."""
+        """Marca todas as notificações de um usuário como lidas (sem commit)."""
         result = await self.session.execute(
             update(Notification)
             .where(Notification.user_id == user_id, Notification.is_read == False)
             .values(is_read=True, read_at=datetime.utcnow())
         )
-        await self.session.commit()
         return result.rowcount
 
+    async def adjust_unread(self, user_id: UUID, delta: int) -> int:
+        """
+        Soma `delta` ao contador de não lidas do usuário e retorna o novo valor.
+        
+        Um único upsert com RETURNING, na transação corrente; o valor nunca
+        fica negativo.
+        """
+        stmt = pg_insert(UnreadCounter).values(
+            user_id=user_id, count=max(delta, 0), updated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UnreadCounter.user_id],
+            set_={
+                "count": func.greatest(UnreadCounter.count + delta, 0),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(UnreadCounter.count)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def increment_unread_many(self, user_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Incrementa em 1 o contador de vários usuários em uma única instrução."""
+        if not user_ids:
+            return {}
+        now = datetime.utcnow()
+        # Ordem fixa de bloqueio evita deadlock entre lotes concorrentes
+        stmt = pg_insert(UnreadCounter).values(
+            [{"user_id": user_id, "count": 1, "updated_at": now} for user_id in sorted(user_ids)]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UnreadCounter.user_id],
+            set_={
+                "count": UnreadCounter.count + stmt.excluded.count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(UnreadCounter.user_id, UnreadCounter.count)
+        result = await self.session.execute(stmt)
+        return {user_id: count for user_id, count in result.all()}
+
     async def count_unread(self, user_id: UUID) -> int:
-        """Conta notificações não lidas de um usuário."""
+        """Retorna o contador de notificações não lidas de um usuário."""
         result = await self.session.execute(
-            select(func.count())
-            .select_from(Notification)
-            .where(Notification.user_id == user_id, Notification.is_read == False)
+            select(UnreadCounter.count).where(UnreadCounter.user_id == user_id)
         )
-        return result.scalar_one()
+        return result.scalar_one_or_none() or 0
+
+    async def count_unread_by_users(self, user_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Retorna o contador de não lidas de vários usuários em uma única consulta."""
+        if not user_ids:
+            return {}
+        result = await self.session.execute(
+            select(UnreadCounter.user_id, UnreadCounter.count)
+            .where(UnreadCounter.user_id.in_(user_ids))
+        )
+        counts = {user_id: 0 for user_id in user_ids}
+        counts.update({user_id: count for user_id, count in result.all()})
+        return counts
 
     async def delete(self, notification: Notification) -> None:
         """Deleta uma notificação."""
         await self.session.delete(notification)
 
-    async def delete_all_by_user(self, user_id: UUID) -> int:
-        """Deleta todas as notificações de um usuário."""
+    async def delete_all_by_user(self, user_id: UUID) -> tuple[int, int]:
+        """
+        Deleta todas as notificações de um usuário em uma única instrução.
+        
+        Returns:
+            Tupla (notificações deletadas, quantas delas não estavam lidas)
+        """
+        deleted = (
+            delete(Notification)
+            .where(Notification.user_id == user_id)
+            .returning(Notification.is_read)
+            .cte("deleted")
+        )
         result = await self.session.execute(
-            select(Notification).where(Notification.user_id == user_id)
+            select(
+                func.count(),
+                func.count().filter(deleted.c.is_read == False),
+            ).select_from(deleted)
         )
-        notifications = result.scalars().all()
-        
-        count = len(notifications)
-        for notification in notifications:
-            await self.session.delete(notification)
+        count, unread = result.one()
+        return count, unread
+
+    async def purge_read_before(self, cutoff: datetime, limit: int) -> int:
+        """
+        Remove até `limit` notificações lidas criadas antes de `cutoff`.
         
-        return count
+        As linhas já bloqueadas por outro worker são puladas.
+        """
+        batch = (
+            select(Notification.id)
+            .where(Notification.is_read == True, Notification.created_at < cutoff)
+            .order_by(Notification.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            delete(Notification).where(Notification.id.in_(batch.scalar_subquery()))
+        )
+        return result.rowcount
@@ -0,0 +1,8 @@
+"""Rotinas de retenção de notificações."""
+
+from notifications_service.infrastructure.retention.notification_retention import (
+    NotificationRetentionJob,
+    notification_retention_job,
+)
+
+__all__ = ["NotificationRetentionJob", "notification_retention_job"]
@@ -0,0 +1,93 @@
+"""Remoção periódica de notificações lidas antigas."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from database.client import db
+
+from notifications_service.core.config import settings
+from notifications_service.infrastructure.repositories import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationRetentionJob:
+    """
+    Remove em segundo plano as notificações lidas mais antigas que o prazo.
+
+    Cada lote é uma transação curta com no máximo `batch_size` linhas, para
+    não segurar locks nem inflar o WAL; os lotes se repetem até esgotar o
+    backlog. Apenas notificações lidas são removidas, então os contadores de
+    não lidas não mudam.
+    """
+
+    def __init__(
+        self,
+        retention_days: int = 90,
+        batch_size: int = 1000,
+        interval_seconds: float = 3600.0,
+        batch_pause_seconds: float = 0.1,
+    ):
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.batch_pause_seconds = batch_pause_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Inicia a rotina (no-op se a retenção estiver desativada)."""
+        if self.retention_days <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Interrompe a rotina."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge()
+            except Exception as e:
+                logger.error(f"Erro na retenção de notificações: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+    async def purge(self) -> int:
+        """
+        Remove, em lotes, as notificações lidas anteriores ao prazo de retenção.
+
+        Returns:
+            Total de notificações removidas
+        """
+        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        total = 0
+
+        while True:
+            async with db.session() as session:
+                removed = await NotificationRepository(session).purge_read_before(
+                    cutoff, self.batch_size
+                )
+            total += removed
+            if removed < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause_seconds)
+
+        if total:
+            logger.info(f"Retenção: {total} notificação(ões) lida(s) anteriores a {cutoff:%Y-%m-%d} removida(s)")
+        return total
+
+
+notification_retention_job = NotificationRetentionJob(
+    retention_days=settings.notification_retention_days,
+    batch_size=settings.notification_retention_batch_size,
+    interval_seconds=settings.notification_retention_interval_seconds,
+)
@@ -1,5 +1,28 @@
 """Infraestrutura SSE para notificações em tempo real."""
 
+from notifications_service.infrastructure.sse.backplane import (
+    InMemoryBackplane,
+    PostgresBackplane,
+    RedisBackplane,
+    SSEBackplane,
+    create_backplane,
+)
+from notifications_service.infrastructure.sse.connection import OverflowPolicy, SSEConnection
+from notifications_service.infrastructure.sse.registry import ConnectionRegistry
+from notifications_service.infrastructure.sse.replay_buffer import EventIdClock, EventReplayBuffer
 from notifications_service.infrastructure.sse.sse_manager import sse_manager, SSEManager
 
-__all__ = ["sse_manager", "SSEManager"]
+__all__ = [
+    "sse_manager",
+    "SSEManager",
+    "SSEConnection",
+    "OverflowPolicy",
+    "ConnectionRegistry",
+    "EventIdClock",
+    "EventReplayBuffer",
+    "SSEBackplane",
+    "InMemoryBackplane",
+    "PostgresBackplane",
+    "RedisBackplane",
+    "create_backplane",
+]
@@ -0,0 +1,246 @@
+"""Backplanes de broadcast para distribuir eventos SSE entre workers."""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import asyncpg
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - dependência opcional
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class SSEBackplane(ABC):
+    """
+    Canal de broadcast entre workers.
+
+    Cada worker assina o canal uma única vez e entrega localmente os eventos
+    recebidos às conexões SSE que mantém.
+    """
+
+    def __init__(self):
+        self._handler: Optional[EventHandler] = None
+
+    async def start(self, handler: EventHandler) -> None:
+        """Assina o canal e registra o callback de entrega local."""
+        self._handler = handler
+
+    async def stop(self) -> None:
+        """Cancela a assinatura e libera os recursos."""
+        self._handler = None
+
+    @abstractmethod
+    async def publish(self, events: List[Dict[str, Any]]) -> None:
+        """Publica uma lista de eventos para todos os workers."""
+        ...
+
+    async def _dispatch(self, events: List[Dict[str, Any]]) -> None:
+        if self._handler is None:
+            return
+        try:
+            await self._handler(events)
+        except Exception as e:
+            logger.error(f"Erro ao entregar eventos recebidos do backplane: {e}", exc_info=True)
+
+
+class InMemoryBackplane(SSEBackplane):
+    """Backplane de processo único; usado em testes e em deploys com um só worker."""
+
+    async def publish(self, events: List[Dict[str, Any]]) -> None:
+        await self._dispatch(events)
+
+
+class PostgresBackplane(SSEBackplane):
+    """
+    Backplane sobre LISTEN/NOTIFY do Postgres, reaproveitando o banco existente.
+
+    Os eventos são agrupados em payloads abaixo do limite do NOTIFY e enviados
+    em uma única instrução. Um evento que sozinho excede o limite é entregue
+    apenas no worker local.
+    """
+
+    MAX_PAYLOAD_BYTES = 7900
+
+    def __init__(self, dsn: str, channel: str = "sse_events", reconnect_delay: float = 2.0):
+        super().__init__()
+        self.dsn = dsn.replace("postgresql+asyncpg://", "postgresql://")
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+
+        self._listen_conn: Optional[asyncpg.Connection] = None
+        self._publish_pool: Optional[asyncpg.Pool] = None
+        self._supervisor: Optional[asyncio.Task] = None
+        self._connection_lost: Optional[asyncio.Event] = None
+
+    async def start(self, handler: EventHandler) -> None:
+        await super().start(handler)
+        self._publish_pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=4)
+        self._connection_lost = asyncio.Event()
+        await self._listen()
+        self._supervisor = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+
+        if self._listen_conn is not None and not self._listen_conn.is_closed():
+            await self._listen_conn.close()
+        self._listen_conn = None
+
+        if self._publish_pool is not None:
+            await self._publish_pool.close()
+            self._publish_pool = None
+
+        await super().stop()
+
+    async def _listen(self) -> None:
+        self._listen_conn = await asyncpg.connect(self.dsn)
+        self._listen_conn.add_termination_listener(self._on_termination)
+        await self._listen_conn.add_listener(self.channel, self._on_notify)
+        logger.info(f"Backplane SSE escutando o canal Postgres '{self.channel}'")
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        logger.warning("Conexão LISTEN do backplane SSE encerrada")
+        self._connection_lost.set()
+
+    async def _supervise(self) -> None:
+        """Restabelece a conexão LISTEN quando ela cai."""
+        while True:
+            await self._connection_lost.wait()
+            self._connection_lost.clear()
+            while True:
+                try:
+                    await self._listen()
+                    break
+                except Exception as e:
+                    logger.error(f"Falha ao reconectar backplane SSE: {e}")
+                    await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            events = json.loads(payload)
+        except ValueError:
+            logger.error("Payload inválido recebido no backplane SSE")
+            return
+        asyncio.get_running_loop().create_task(self._dispatch(events))
+
+    def _chunk(self, events: List[Dict[str, Any]]) -> tuple[List[str], List[Dict[str, Any]]]:
+        """Agrupa eventos em payloads JSON abaixo do limite do NOTIFY."""
+        payloads: List[str] = []
+        oversized: List[Dict[str, Any]] = []
+        current: List[str] = []
+        size = 2
+
+        for event in events:
+            encoded = json.dumps(event, separators=(",", ":"))
+            length = len(encoded.encode("utf-8")) + 1
+            if length + 2 > self.MAX_PAYLOAD_BYTES:
+                oversized.append(event)
+                continue
+            if size + length > self.MAX_PAYLOAD_BYTES:
+                payloads.append(f"[{','.join(current)}]")
+                current, size = [], 2
+            current.append(encoded)
+            size += length
+
+        if current:
+            payloads.append(f"[{','.join(current)}]")
+        return payloads, oversized
+
+    async def publish(self, events: List[Dict[str, Any]]) -> None:
+        payloads, oversized = self._chunk(events)
+
+        if oversized:
+            logger.warning(
+                f"{len(oversized)} evento(s) SSE acima do limite do NOTIFY; entregues apenas localmente"
+            )
+            await self._dispatch(oversized)
+
+        if payloads:
+            async with self._publish_pool.acquire() as conn:
+                await conn.execute(
+                    "SELECT pg_notify($1, payload) FROM unnest($2::text[]) AS payload",
+                    self.channel,
+                    payloads,
+                )
+
+
+class RedisBackplane(SSEBackplane):
+    """Backplane sobre Redis pub/sub (requer o pacote opcional `redis`)."""
+
+    def __init__(self, url: str, channel: str = "sse_events"):
+        if aioredis is None:
+            raise RuntimeError("Backplane Redis requer o pacote 'redis' instalado")
+        super().__init__()
+        self.url = url
+        self.channel = channel
+
+        self._redis = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self, handler: EventHandler) -> None:
+        await super().start(handler)
+        self._redis = aioredis.from_url(self.url)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._reader = asyncio.create_task(self._read())
+        logger.info(f"Backplane SSE escutando o canal Redis '{self.channel}'")
+
+    async def stop(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+        await super().stop()
+
+    async def _read(self) -> None:
+        async for message in self._pubsub.listen():
+            try:
+                events = json.loads(message["data"])
+            except (KeyError, TypeError, ValueError):
+                logger.error("Payload inválido recebido no backplane SSE")
+                continue
+            await self._dispatch(events)
+
+    async def publish(self, events: List[Dict[str, Any]]) -> None:
+        await self._redis.publish(self.channel, json.dumps(events, separators=(",", ":")))
+
+
+def create_backplane(kind: str, database_url: str, channel: str, redis_url: Optional[str] = None) -> SSEBackplane:
+    """Cria o backplane configurado (`memory`, `postgres` ou `redis`)."""
+    if kind == "memory":
+        return InMemoryBackplane()
+    if kind == "postgres":
+        return PostgresBackplane(database_url, channel=channel)
+    if kind == "redis":
+        if not redis_url:
+            raise RuntimeError("REDIS_URL é obrigatório para o backplane Redis")
+        return RedisBackplane(redis_url, channel=channel)
+    raise ValueError(f"Backplane SSE desconhecido: {kind}")
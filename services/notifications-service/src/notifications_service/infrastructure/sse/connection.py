@@ -0,0 +1,142 @@
+"""Conexão SSE com fila limitada e política de overflow."""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, List, Optional
+from uuid import UUID
+
+
+class OverflowPolicy(str, Enum):
+    """O que fazer quando a fila de uma conexão lenta enche."""
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+class SSEConnection:
+    """
+    Fila limitada de eventos de uma conexão SSE.
+
+    - `drop_oldest`: descarta o evento mais antigo para abrir espaço.
+    - `coalesce`: mantém apenas o último `unread_count` pendente e, se ainda
+      faltar espaço, descarta o evento mais antigo.
+    - `disconnect`: encerra a conexão do consumidor lento.
+    """
+
+    def __init__(
+        self,
+        user_id: UUID,
+        max_size: int = 100,
+        policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ):
+        self.user_id = user_id
+        self.max_size = max_size
+        self.policy = policy
+        self.connected_at = time.monotonic()
+        self.last_activity = self.connected_at
+
+        # Cada item é [tipo, frame, instante em que entrou na fila]; tipo None é heartbeat
+        self._buffer: Deque[List[Any]] = deque()
+        self._pending_unread: Optional[List[Any]] = None
+        self._ready = asyncio.Event()
+        self.closed = False
+
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_lag = 0
+
+    def put(self, event_type: str, data: bytes) -> bool:
+        """
+        Enfileira um evento sem bloquear.
+
+        Returns:
+            False se a conexão foi (ou já estava) encerrada
+        """
+        if self.closed:
+            return False
+
+        now = time.monotonic()
+        self.enqueued += 1
+        self.last_activity = now
+
+        if (
+            event_type == "unread_count"
+            and self.policy == OverflowPolicy.COALESCE
+            and self._pending_unread is not None
+        ):
+            # O frame novo vai para o fim: os IDs na fila seguem crescentes
+            self._buffer.remove(self._pending_unread)
+            self._pending_unread = None
+            self.coalesced += 1
+
+        if len(self._buffer) >= self.max_size:
+            if self.policy == OverflowPolicy.DISCONNECT:
+                self.dropped += 1
+                self.close()
+                return False
+
+            dropped = self._buffer.popleft()
+            if dropped is self._pending_unread:
+                self._pending_unread = None
+            self.dropped += 1
+
+        entry = [event_type, data, now]
+        self._buffer.append(entry)
+        if event_type == "unread_count":
+            self._pending_unread = entry
+
+        self.max_lag = max(self.max_lag, len(self._buffer))
+        self._ready.set()
+        return True
+
+    def heartbeat(self, frame: bytes) -> None:
+        """Enfileira um heartbeat se a conexão estiver ociosa (fora das métricas)."""
+        if self.closed or self._buffer:
+            return
+        self.last_activity = time.monotonic()
+        self._buffer.append([None, frame, self.last_activity])
+        self._ready.set()
+
+    async def get(self) -> Optional[bytes]:
+        """Aguarda o próximo evento; retorna None quando a conexão é encerrada."""
+        while not self._buffer:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+        entry = self._buffer.popleft()
+        if entry is self._pending_unread:
+            self._pending_unread = None
+        if entry[0] is not None:
+            self.delivered += 1
+        return entry[1]
+
+    def close(self) -> None:
+        """Encerra a conexão, acordando o consumidor."""
+        self.closed = True
+        self._buffer.clear()
+        self._pending_unread = None
+        self._ready.set()
+
+    @property
+    def lag(self) -> int:
+        """Número de eventos aguardando envio."""
+        return len(self._buffer)
+
+    @property
+    def idle_for(self) -> float:
+        """Há quanto tempo (s) nada é enfileirado na conexão."""
+        return time.monotonic() - self.last_activity
+
+    @property
+    def oldest_pending_age(self) -> float:
+        """Há quanto tempo (s) o evento mais antigo aguarda envio."""
+        if not self._buffer:
+            return 0.0
+        return time.monotonic() - self._buffer[0][2]
@@ -0,0 +1,71 @@
+"""Registro de conexões SSE sem lock global."""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from notifications_service.infrastructure.sse.connection import SSEConnection
+
+
+class ConnectionRegistry:
+    """
+    Conexões SSE por usuário com tuplas copy-on-write.
+
+    Todas as operações são síncronas e rodam no event loop, logo são
+    atômicas entre corrotinas sem precisar de lock. Alterações trocam a tupla
+    do usuário por uma nova; o caminho de envio apenas lê a tupla atual, sem
+    copiar nem bloquear.
+    """
+
+    def __init__(self, max_per_user: int = 5):
+        self.max_per_user = max_per_user
+        self._by_user: Dict[UUID, Tuple[SSEConnection, ...]] = {}
+        self._total = 0
+
+    def add(self, connection: SSEConnection) -> List[SSEConnection]:
+        """
+        Registra uma conexão.
+
+        Returns:
+            Conexões mais antigas do usuário removidas por exceder o limite
+        """
+        current = self._by_user.get(connection.user_id, ())
+        updated = current + (connection,)
+        evicted: List[SSEConnection] = []
+        if self.max_per_user > 0 and len(updated) > self.max_per_user:
+            evicted = list(updated[: len(updated) - self.max_per_user])
+            updated = updated[len(evicted):]
+        self._by_user[connection.user_id] = updated
+        self._total += 1 - len(evicted)
+        return evicted
+
+    def remove(self, connection: SSEConnection) -> bool:
+        """Remove uma conexão; retorna False se ela não estava registrada."""
+        current = self._by_user.get(connection.user_id)
+        if not current or connection not in current:
+            return False
+        updated = tuple(c for c in current if c is not connection)
+        if updated:
+            self._by_user[connection.user_id] = updated
+        else:
+            del self._by_user[connection.user_id]
+        self._total -= 1
+        return True
+
+    def get(self, user_id: UUID) -> Tuple[SSEConnection, ...]:
+        """Conexões atuais do usuário (snapshot imutável)."""
+        return self._by_user.get(user_id, ())
+
+    def count(self, user_id: Optional[UUID] = None) -> int:
+        """Número de conexões de um usuário ou, sem argumento, do worker."""
+        if user_id is None:
+            return self._total
+        return len(self._by_user.get(user_id, ()))
+
+    @property
+    def users(self) -> int:
+        """Número de usuários com ao menos uma conexão."""
+        return len(self._by_user)
+
+    def __iter__(self) -> Iterator[SSEConnection]:
+        for connections in list(self._by_user.values()):
+            yield from connections
@@ -0,0 +1,98 @@
+"""Buffer circular por usuário para replay de eventos SSE via Last-Event-ID."""
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, List, Optional, Tuple
+from uuid import UUID
+
+
+class EventIdClock:
+    """
+    Gera IDs de evento monotônicos em microssegundos desde a época.
+
+    O ID também serve como marca de tempo para o fallback no banco; entre
+    workers a ordem é a dos relógios, sincronizados por NTP.
+    """
+
+    def __init__(self):
+        self._last = 0
+
+    def next(self) -> int:
+        self._last = max(self._last + 1, time.time_ns() // 1000)
+        return self._last
+
+    def now(self) -> int:
+        return max(self._last, time.time_ns() // 1000)
+
+    @staticmethod
+    def to_datetime(event_id: int) -> datetime:
+        return datetime.fromtimestamp(event_id / 1_000_000, tz=timezone.utc)
+
+    @staticmethod
+    def from_datetime(value: datetime) -> int:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1_000_000)
+
+
+@dataclass
+class _UserEvents:
+    # Todos os eventos com ID maior que `horizon` estão no buffer
+    horizon: int
+    events: Deque[Tuple[int, str, bytes]] = field(default_factory=deque)
+
+
+class EventReplayBuffer:
+    """
+    Guarda os últimos eventos de cada usuário recebidos por este worker.
+
+    Como o backplane entrega todos os eventos a todos os workers, o replay
+    funciona mesmo quando o cliente reconecta em outro worker. O número de
+    usuários retidos é limitado por LRU.
+    """
+
+    def __init__(self, clock: EventIdClock, size_per_user: int = 100, max_users: int = 10_000):
+        self.clock = clock
+        self.size_per_user = size_per_user
+        self.max_users = max_users
+        self._users: "OrderedDict[UUID, _UserEvents]" = OrderedDict()
+        # Eventos anteriores a este ID podem não ter sido vistos (início do worker
+        # ou usuários descartados pelo LRU)
+        self._global_horizon = clock.now()
+
+    def append(self, user_id: UUID, event_id: int, event_type: str, frame: bytes) -> None:
+        """Registra um evento já serializado para o usuário."""
+        if self.size_per_user <= 0:
+            return
+
+        entry = self._users.get(user_id)
+        if entry is None:
+            entry = _UserEvents(horizon=self._global_horizon)
+            self._users[user_id] = entry
+            while len(self._users) > self.max_users:
+                _, evicted = self._users.popitem(last=False)
+                if evicted.events:
+                    self._global_horizon = max(self._global_horizon, evicted.events[-1][0])
+        else:
+            self._users.move_to_end(user_id)
+
+        if len(entry.events) >= self.size_per_user:
+            evicted_id, _, _ = entry.events.popleft()
+            entry.horizon = max(entry.horizon, evicted_id)
+        entry.events.append((event_id, event_type, frame))
+
+    def since(self, user_id: UUID, last_event_id: int) -> Optional[List[Tuple[int, str, bytes]]]:
+        """
+        Retorna os eventos posteriores a `last_event_id`.
+
+        Returns:
+            None quando o intervalo é maior que o buffer e é preciso consultar o banco
+        """
+        entry = self._users.get(user_id)
+        if entry is None:
+            return [] if last_event_id >= self._global_horizon else None
+        if last_event_id < entry.horizon:
+            return None
+        return [event for event in entry.events if event[0] > last_event_id]
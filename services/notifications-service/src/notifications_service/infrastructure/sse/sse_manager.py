@@ -3,87 +3,272 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Set
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from database.client import db
+
+from notifications_service.core.config import settings
+from notifications_service.infrastructure.cache import unread_count_cache
+from notifications_service.infrastructure.repositories import NotificationRepository
+from notifications_service.infrastructure.sse.backplane import (
+    InMemoryBackplane,
+    SSEBackplane,
+    create_backplane,
+)
+from notifications_service.infrastructure.sse.connection import OverflowPolicy, SSEConnection
+from notifications_service.infrastructure.sse.registry import ConnectionRegistry
+from notifications_service.infrastructure.sse.replay_buffer import EventIdClock, EventReplayBuffer
+from notifications_service.schemas import NotificationResponse
+
 logger = logging.getLogger(__name__)
 
+HEARTBEAT_FRAME = b": heartbeat\n\n"
+CONNECTED_FRAME = (
+    "data: "
+    + json.dumps({"type": "connected", "data": {"message": "Conectado ao stream de notificações"}})
+    + "\n\n"
+).encode("utf-8")
+
 
 class SSEManager:
-    """Gerenciador de conexões SSE para broadcast de notificações."""
+    """
+    Gerenciador de conexões SSE para broadcast de notificações.
+
+    Os eventos são publicados no backplane e cada worker entrega localmente
+    apenas às conexões que mantém, permitindo escalar o stream horizontalmente.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        backplane: Optional[SSEBackplane] = None,
+        queue_max_size: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+        replay_size_per_user: int = 100,
+        replay_max_users: int = 10_000,
+        replay_db_limit: int = 200,
+        heartbeat_interval: float = 30.0,
+        max_connections_per_user: int = 5,
+        stalled_timeout: float = 120.0,
+    ):
         """Inicializa o gerenciador SSE."""
-        self._connections: Dict[UUID, Set[asyncio.Queue]] = {}
-        self._lock = asyncio.Lock()
+        self._registry = ConnectionRegistry(max_per_user=max_connections_per_user)
+        self.queue_max_size = queue_max_size
+        self.overflow_policy = overflow_policy
+        self.stalled_timeout = stalled_timeout
+        self.disconnected_slow_consumers = 0
+        self.evicted_over_limit = 0
+        self.evicted_stalled = 0
+        self._backplane = backplane or InMemoryBackplane()
+        self._started = False
+        self._clock = EventIdClock()
+        self._replay = EventReplayBuffer(
+            self._clock, size_per_user=replay_size_per_user, max_users=replay_max_users
+        )
+        self.replay_db_limit = replay_db_limit
+        self.heartbeat_interval = heartbeat_interval
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Assina o backplane e inicia o heartbeat (chamado no lifespan)."""
+        await self._backplane.start(self._deliver_local)
+        self._started = True
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self) -> None:
+        """Interrompe o heartbeat e cancela a assinatura do backplane."""
+        self._started = False
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        await self._backplane.stop()
+
+    async def _heartbeat_loop(self) -> None:
+        """
+        Envia heartbeat às conexões ociosas deste worker e encerra as travadas.
+
+        Uma única tarefa para todas as conexões substitui um timer por
+        conexão no gerador do stream. Uma conexão cujo evento mais antigo
+        aguarda há mais de `stalled_timeout` (nem o heartbeat foi lido) é
+        considerada morta.
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for connection in self._registry:
+                if connection.oldest_pending_age >= self.stalled_timeout:
+                    self.evicted_stalled += 1
+                    logger.warning(f"Conexão SSE travada do usuário {connection.user_id} encerrada")
+                    self._remove(connection)
+                elif connection.idle_for >= self.heartbeat_interval:
+                    connection.heartbeat(HEARTBEAT_FRAME)
+
+    @staticmethod
+    def notification_event(user_id: UUID, notification_data: dict) -> Dict[str, Any]:
+        """Monta o evento de nova notificação para publicação."""
+        return {"type": "notification", "user_id": str(user_id), "data": notification_data}
+
+    @staticmethod
+    def unread_count_event(user_id: UUID, count: int) -> Dict[str, Any]:
+        """Monta o evento de contagem de não lidas para publicação."""
+        return {"type": "unread_count", "user_id": str(user_id), "data": {"count": count}}
+
+    async def publish(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Publica eventos para todos os workers.
+
+        Sem backplane iniciado (ex.: testes), os eventos são entregues localmente.
+        """
+        if not events:
+            return
+        for event in events:
+            event.setdefault("id", self._clock.next())
+        if self._started:
+            await self._backplane.publish(events)
+        else:
+            await self._deliver_local(events)
+
+    @staticmethod
+    def _frame(event_id: int, event_type: str, data: Any) -> bytes:
+        """
+        Serializa o evento uma única vez em um frame SSE pronto para escrita.
+
+        O tipo segue dentro do JSON (sem linha `event:`) porque o frontend
+        consome os eventos por `onmessage`.
+        """
+        payload = json.dumps({"type": event_type, "data": data}, separators=(",", ":"))
+        return f"id: {event_id}\ndata: {payload}\n\n".encode("utf-8")
+
+    async def _deliver_local(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Entrega eventos recebidos do backplane às conexões deste worker.
 
-    async def connect(self, user_id: UUID) -> asyncio.Queue:
+        Cada evento vira um único frame em bytes, compartilhado pelo buffer de
+        replay e por todas as conexões do usuário.
+        """
+        for event in events:
+            user_id = UUID(event["user_id"])
+            frame = self._frame(event["id"], event["type"], event["data"])
+            self._replay.append(user_id, event["id"], event["type"], frame)
+            if event["type"] == "unread_count":
+                # Mantém o cache coerente com escritas feitas em outros workers
+                unread_count_cache.set(user_id, event["data"]["count"])
+
+            for connection in self._registry.get(user_id):
+                if not connection.put(event["type"], frame):
+                    self.disconnected_slow_consumers += 1
+                    logger.warning(
+                        f"Conexão SSE lenta do usuário {user_id} encerrada "
+                        f"(fila cheia com {connection.max_size} eventos)"
+                    )
+                    self._remove(connection)
+
+    async def connect(self, user_id: UUID, last_event_id: Optional[int] = None) -> SSEConnection:
         """
         Cria uma nova conexão SSE para um usuário.
         
+        Com `last_event_id`, os eventos perdidos são reenviados a partir do buffer
+        circular; se o intervalo for maior que o buffer, a partir do banco.
+        
         Args:
             user_id: ID do usuário
+            last_event_id: Último ID de evento recebido pelo cliente (Last-Event-ID)
             
         Returns:
-            Queue para enviar eventos
+            Conexão com fila limitada para enviar eventos
         """
-        queue = asyncio.Queue()
+        connection = SSEConnection(
+            user_id, max_size=self.queue_max_size, policy=self.overflow_policy
+        )
+        connection.put("connected", CONNECTED_FRAME)
         
-        async with self._lock:
-            if user_id not in self._connections:
-                self._connections[user_id] = set()
-            self._connections[user_id].add(queue)
+        if last_event_id is not None and not 0 <= last_event_id <= self._clock.now():
+            # ID que nenhum servidor emitiu (negativo ou no futuro): não há como retomar
+            logger.warning(f"Last-Event-ID inválido do usuário {user_id}: {last_event_id}")
+            last_event_id = None
+            connection.put("resync", self._frame(self._clock.now(), "resync", {}))
         
-        logger.info(f"Nova conexão SSE para usuário {user_id}. Total: {len(self._connections.get(user_id, []))}")
-        return queue
+        if last_event_id is not None and self._replay.since(user_id, last_event_id) is None:
+            last_event_id = await self._replay_from_database(connection, user_id, last_event_id)
+        
+        # Sem await entre o snapshot do buffer e o registro: nenhum evento se perde
+        if last_event_id is not None:
+            for _, event_type, frame in self._replay.since(user_id, last_event_id) or []:
+                connection.put(event_type, frame)
+        for evicted in self._registry.add(connection):
+            self.evicted_over_limit += 1
+            evicted.close()
+            logger.info(f"Conexão SSE mais antiga do usuário {user_id} encerrada (limite por usuário)")
+        
+        logger.info(f"Nova conexão SSE para usuário {user_id}. Total: {self._registry.count(user_id)}")
+        return connection
+
+    async def _replay_from_database(
+        self, connection: SSEConnection, user_id: UUID, last_event_id: int
+    ) -> int:
+        """
+        Reenvia as notificações criadas a partir de `last_event_id` consultando o banco.
+        
+        O ID do evento só carrega o instante, então as notificações criadas
+        nesse mesmo instante são reenviadas em vez de perdidas (entrega pelo
+        menos uma vez; cada notificação leva o seu `id`).
+        
+        Returns:
+            ID a partir do qual o buffer circular completa o replay
+        """
+        replayed_up_to = self._clock.now()
+        try:
+            since = EventIdClock.to_datetime(last_event_id)
+            async with db.session() as session:
+                repo = NotificationRepository(session)
+                notifications = await repo.get_created_after(
+                    user_id, since, limit=self.replay_db_limit + 1
+                )
+                unread_count = await repo.count_unread(user_id)
+        except Exception as e:
+            logger.error(f"Erro no replay SSE pelo banco para usuário {user_id}: {e}")
+            connection.put("resync", self._frame(replayed_up_to, "resync", {}))
+            return replayed_up_to
+
+        if len(notifications) > self.replay_db_limit:
+            connection.put("resync", self._frame(replayed_up_to, "resync", {}))
+        else:
+            for notification in notifications:
+                data = NotificationResponse.model_validate(notification).model_dump(mode="json")
+                event_id = max(EventIdClock.from_datetime(notification.created_at), last_event_id + 1)
+                connection.put("notification", self._frame(event_id, "notification", data))
+        
+        connection.put("unread_count", self._frame(replayed_up_to, "unread_count", {"count": unread_count}))
+        logger.info(f"Replay SSE pelo banco para usuário {user_id}: {len(notifications)} notificação(ões)")
+        return replayed_up_to
 
-    async def disconnect(self, user_id: UUID, queue: asyncio.Queue):
+    async def disconnect(self, user_id: UUID, connection: SSEConnection):
         """
         Remove uma conexão SSE.
         
         Args:
             user_id: ID do usuário
-            queue: Queue da conexão a ser removida
+            connection: Conexão a ser removida
         """
-        async with self._lock:
-            if user_id in self._connections:
-                self._connections[user_id].discard(queue)
-                if not self._connections[user_id]:
-                    del self._connections[user_id]
-        
-        logger.info(f"Conexão SSE removida para usuário {user_id}")
+        if self._remove(connection):
+            logger.info(f"Conexão SSE removida para usuário {user_id}")
+
+    def _remove(self, connection: SSEConnection) -> bool:
+        connection.close()
+        return self._registry.remove(connection)
 
     async def send_notification(self, user_id: UUID, notification_data: dict):
         """
-        Envia uma notificação para todas as conexões de um usuário.
+        Envia uma notificação para todas as conexões de um usuário, em qualquer worker.
         
         Args:
             user_id: ID do usuário destinatário
             notification_data: Dados da notificação
         """
-        async with self._lock:
-            queues = self._connections.get(user_id, set()).copy()
-        
-        if not queues:
-            logger.warning(f"Nenhuma conexão SSE ativa para usuário {user_id}. Conexões ativas: {len(self._connections)}")
-            return
-        
-        logger.info(f"Enviando notificação via SSE para {len(queues)} conexão(ões) do usuário {user_id}")
-        
-        event_data = json.dumps({
-            "type": "notification",
-            "data": notification_data
-        })
-        
-        for queue in queues:
-            try:
-                await queue.put(event_data)
-                logger.info(f"Notificação enviada via SSE para usuário {user_id} (queue: {id(queue)})")
-            except Exception as e:
-                logger.error(f"Erro ao enviar notificação via SSE: {e}", exc_info=True)
-                async with self._lock:
-                    if user_id in self._connections:
-                        self._connections[user_id].discard(queue)
+        await self.publish([self.notification_event(user_id, notification_data)])
 
     async def send_unread_count_update(self, user_id: UUID, count: int):
         """
@@ -93,29 +278,11 @@ class SSEManager:
             user_id: ID do usuário
             count: Nova contagem de não lidas
         """
-        async with self._lock:
-            queues = self._connections.get(user_id, set()).copy()
-        
-        if not queues:
-            return
-        
-        event_data = json.dumps({
-            "type": "unread_count",
-            "data": {"count": count}
-        })
-        
-        for queue in queues:
-            try:
-                await queue.put(event_data)
-            except Exception as e:
-                logger.error(f"Erro ao enviar atualização de contagem: {e}")
-                async with self._lock:
-                    if user_id in self._connections:
-                        self._connections[user_id].discard(queue)
+        await self.publish([self.unread_count_event(user_id, count)])
 
     def get_active_connections_count(self, user_id: UUID) -> int:
         """
-        Retorna o número de conexões ativas para um usuário.
+        Retorna o número de conexões ativas para um usuário neste worker.
         
         Args:
             user_id: ID do usuário
@@ -123,7 +290,46 @@ class SSEManager:
         Returns:
             Número de conexões ativas
         """
-        return len(self._connections.get(user_id, set()))
+        return self._registry.count(user_id)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Retorna métricas de atraso das conexões deste worker.
+        
+        Returns:
+            Apenas totais e máximos agregados, sem dados por usuário
+        """
+        connections = list(self._registry)
+        return {
+            "users": self._registry.users,
+            "connections": len(connections),
+            "max_connections_per_user": self._registry.max_per_user,
+            "queue_max_size": self.queue_max_size,
+            "overflow_policy": self.overflow_policy.value,
+            "pending_events": sum(c.lag for c in connections),
+            "max_pending_events": max((c.max_lag for c in connections), default=0),
+            "oldest_pending_age": round(max((c.oldest_pending_age for c in connections), default=0.0), 3),
+            "dropped_events": sum(c.dropped for c in connections),
+            "coalesced_events": sum(c.coalesced for c in connections),
+            "disconnected_slow_consumers": self.disconnected_slow_consumers,
+            "evicted_over_limit": self.evicted_over_limit,
+            "evicted_stalled": self.evicted_stalled,
+        }
 
 
-sse_manager = SSEManager()
+sse_manager = SSEManager(
+    create_backplane(
+        settings.sse_backplane,
+        database_url=settings.database_url,
+        channel=settings.sse_backplane_channel,
+        redis_url=settings.redis_url,
+    ),
+    queue_max_size=settings.sse_queue_max_size,
+    overflow_policy=OverflowPolicy(settings.sse_overflow_policy),
+    replay_size_per_user=settings.sse_replay_buffer_size,
+    replay_max_users=settings.sse_replay_max_users,
+    replay_db_limit=settings.sse_replay_db_limit,
+    heartbeat_interval=settings.sse_heartbeat_interval_seconds,
+    max_connections_per_user=settings.sse_max_connections_per_user,
+    stalled_timeout=settings.sse_stalled_timeout_seconds,
+)
@@ -10,6 +10,12 @@ from common.logging import setup_logging
 from database.client import db
 from notifications_service.api import notification_router, health_router
 from notifications_service.core.config import settings
+from notifications_service.infrastructure.external import (
+    notifications_client,
+    novu_delivery_queue,
+)
+from notifications_service.infrastructure.retention import notification_retention_job
+from notifications_service.infrastructure.sse import sse_manager
 
 
 @asynccontextmanager
@@ -35,6 +41,11 @@ async def lifespan(app: FastAPI):
         
         await db.check_health()
         startup_logger.info("Banco de dados conectado com sucesso.")
+
+        await notifications_client.start()
+        await novu_delivery_queue.start()
+        await sse_manager.start()
+        await notification_retention_job.start()
         
     except Exception as e:
         startup_logger.critical(f"Falha crítica no startup: {e}")
@@ -44,6 +55,10 @@ async def lifespan(app: FastAPI):
     
     startup_logger.info("Encerrando serviço de notificações...")
     try:
+        await notification_retention_job.stop()
+        await sse_manager.stop()
+        await novu_delivery_queue.stop()
+        await notifications_client.close()
         await db.close()
         startup_logger.info("Banco de dados fechado com sucesso.")
     except Exception as e:
@@ -5,10 +5,15 @@ from notifications_service.schemas.notification import (
     NotificationCreate,
     NotificationResponse,
     NotificationListResponse,
+    NotificationCursorPage,
     UnreadCountResponse,
     MarkReadRequest,
     MarkAllReadRequest,
+    MarkManyReadRequest,
+    MarkManyReadResponse,
     SendNotificationRequest,
+    SendBatchNotificationRequest,
+    SendBatchNotificationResponse,
 )
 
 __all__ = [
@@ -16,8 +21,13 @@ __all__ = [
     "NotificationCreate",
     "NotificationResponse",
     "NotificationListResponse",
+    "NotificationCursorPage",
     "UnreadCountResponse",
     "MarkReadRequest",
     "MarkAllReadRequest",
+    "MarkManyReadRequest",
+    "MarkManyReadResponse",
     "SendNotificationRequest",
+    "SendBatchNotificationRequest",
+    "SendBatchNotificationResponse",
 ]
@@ -47,6 +47,15 @@ class NotificationListResponse(BaseModel):
     total_pages: int
 
 
+class NotificationCursorPage(BaseModel):
+    """Schema de resposta da listagem paginada por cursor."""
+
+    items: list[NotificationResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    limit: int
+
+
 class UnreadCountResponse(BaseModel):
     """Schema de resposta de contagem de não lidas."""
 
@@ -65,6 +74,19 @@ class MarkAllReadRequest(BaseModel):
     pass
 
 
+class MarkManyReadRequest(BaseModel):
+    """Schema para marcar várias notificações como lidas."""
+
+    notification_ids: list[UUID] = Field(..., min_length=1, max_length=500)
+
+
+class MarkManyReadResponse(BaseModel):
+    """Schema de resposta da marcação em lote."""
+
+    count: int
+    unread_count: int
+
+
 class SendNotificationRequest(BaseModel):
     """Schema para enviar notificação."""
 
@@ -74,3 +96,20 @@ class SendNotificationRequest(BaseModel):
     message: str
     extra_data: Optional[Dict[str, Any]] = None
     action_url: Optional[str] = None
+
+
+class SendBatchNotificationRequest(BaseModel):
+    """Schema para enviar a mesma notificação a vários usuários."""
+
+    user_ids: list[UUID] = Field(..., min_length=1, max_length=5000)
+    type: str
+    title: str
+    message: str
+    extra_data: Optional[Dict[str, Any]] = None
+    action_url: Optional[str] = None
+
+
+class SendBatchNotificationResponse(BaseModel):
+    """Schema de resposta do envio em lote."""
+
+    count: int
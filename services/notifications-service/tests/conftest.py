@@ -0,0 +1,29 @@
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from database.base import Base
+from notifications_service.core.config import settings
+import notifications_service.infrastructure.database.models  # noqa: F401 (registra as tabelas)
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+@pytest_asyncio.fixture(name="session")
+async def session_fixture() -> AsyncSession:
+    """
+    Sessão isolada em SQLite em memória; o schema do Postgres é removido
+    pelo schema_translate_map.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    ).execution_options(schema_translate_map={settings.notifications_database_schema: None})
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
@@ -0,0 +1,74 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import event, func, select
+
+from notifications_service.infrastructure.database.models import Notification
+from notifications_service.infrastructure.repositories import NotificationRepository
+
+# Limite de parâmetros por instrução do protocolo do Postgres (asyncpg)
+ASYNCPG_MAX_PARAMS = 32767
+
+
+def _rows(count: int) -> list[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": uuid4(),
+            "user_id": uuid4(),
+            "type": "general",
+            "title": "Aviso",
+            "message": "Mensagem",
+            "extra_data": {"k": "v"},
+            "action_url": None,
+            "is_read": False,
+            "read_at": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for _ in range(count)
+    ]
+
+
+async def test_create_many_handles_max_batch_size(session):
+    # 5000 destinatários (máximo do SendBatchNotificationRequest) x 11 colunas
+    # passaria do limite de parâmetros em um único VALUES multi-linha
+    repo = NotificationRepository(session)
+    params_per_statement = []
+
+    def track(conn, cursor, statement, parameters, context, executemany):
+        batch = parameters[0] if executemany else parameters
+        params_per_statement.append(len(batch))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", track)
+    try:
+        created = await repo.create_many(_rows(5000))
+    finally:
+        event.remove(engine, "before_cursor_execute", track)
+    await session.commit()
+
+    total = await session.execute(select(func.count()).select_from(Notification))
+    assert created == 5000
+    assert max(params_per_statement) < ASYNCPG_MAX_PARAMS
+    assert total.scalar_one() == 5000
+
+
+async def test_create_many_ignores_empty_batch(session):
+    assert await NotificationRepository(session).create_many([]) == 0
+
+
+async def test_get_created_after_keeps_notifications_of_the_same_instant(session):
+    rows = _rows(3)
+    user_id = rows[0]["user_id"]
+    for row in rows:
+        row["user_id"] = user_id
+    repo = NotificationRepository(session)
+    await repo.create_many(rows)
+    await session.commit()
+
+    since = rows[0]["created_at"]
+    ordered = sorted(row["id"] for row in rows)
+
+    replayed = await repo.get_created_after(user_id, since, limit=10)
+    assert [n.id for n in replayed] == ordered
@@ -0,0 +1,56 @@
+import uuid
+
+from notifications_service.infrastructure.external.novu_delivery_queue import (
+    NovuDelivery,
+    NovuDeliveryQueue,
+)
+
+
+class FakeNovuClient:
+    """Registra as chamadas ao endpoint bulk e devolve um ID por evento."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def trigger_bulk(self, events):
+        self.calls.append(events)
+        return [f"tx-{event['transaction_id']}" for event in events]
+
+
+def _delivery(count: int) -> NovuDelivery:
+    return NovuDelivery(
+        notification_ids=[uuid.uuid4() for _ in range(count)],
+        user_ids=[uuid.uuid4() for _ in range(count)],
+        template_id="org_update",
+        payload={"title": "Título"},
+    )
+
+
+async def test_deliver_splits_recipients_into_events_with_distinct_transactions():
+    client = FakeNovuClient()
+    queue = NovuDeliveryQueue(client=client, batch_size=100, max_recipients=100)
+    delivery = _delivery(250)
+
+    await queue._deliver([delivery])
+
+    events = [event for call in client.calls for event in call]
+    assert [len(event["recipients"]) for event in events] == [100, 100, 50]
+    assert [event["recipients"] for event in events] == [
+        [str(user_id) for user_id in delivery.user_ids[start:start + 100]]
+        for start in (0, 100, 200)
+    ]
+    assert len({event["transaction_id"] for event in events}) == 3
+
+    # Cada notificação recebe o ID de transação do evento do seu destinatário
+    assert queue._pending_ids[delivery.notification_ids[0]] == f"tx-{delivery.notification_ids[0]}"
+    assert queue._pending_ids[delivery.notification_ids[249]] == f"tx-{delivery.notification_ids[200]}"
+    assert len(queue._pending_ids) == 250
+
+
+async def test_deliver_limits_events_per_bulk_call():
+    client = FakeNovuClient()
+    queue = NovuDeliveryQueue(client=client, batch_size=2, max_recipients=10)
+
+    await queue._deliver([_delivery(25), _delivery(1)])
+
+    assert [len(call) for call in client.calls] == [2, 2]
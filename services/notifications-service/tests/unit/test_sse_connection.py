@@ -0,0 +1,26 @@
+from uuid import uuid4
+
+from notifications_service.infrastructure.sse.connection import OverflowPolicy, SSEConnection
+from notifications_service.infrastructure.sse.sse_manager import SSEManager
+
+
+def _event_id(frame: bytes) -> int:
+    return int(frame.decode().split("\n", 1)[0].removeprefix("id: "))
+
+
+async def test_coalesced_unread_count_keeps_event_ids_increasing():
+    manager = SSEManager()
+    user_id = uuid4()
+    connection = SSEConnection(user_id, policy=OverflowPolicy.COALESCE)
+    manager._registry.add(connection)
+
+    await manager.publish([manager.unread_count_event(user_id, 1)])
+    await manager.publish([manager.notification_event(user_id, {"title": "A"})])
+    await manager.publish([manager.unread_count_event(user_id, 2)])
+
+    frames = [await connection.get() for _ in range(connection.lag)]
+    event_ids = [_event_id(frame) for frame in frames]
+    assert len(event_ids) == 2
+    assert event_ids == sorted(event_ids)
+    assert b'"count":2' in frames[-1]
+    assert connection.coalesced == 1
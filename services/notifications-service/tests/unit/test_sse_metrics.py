@@ -0,0 +1,23 @@
+import json
+from uuid import uuid4
+
+from notifications_service.infrastructure.sse.connection import SSEConnection
+from notifications_service.infrastructure.sse.sse_manager import SSEManager
+
+
+def test_stream_metrics_are_aggregate_only():
+    manager = SSEManager()
+    user_ids = [uuid4(), uuid4()]
+    for lag, user_id in enumerate(user_ids, start=1):
+        connection = SSEConnection(user_id)
+        for _ in range(lag):
+            connection.put("notification", b"data: {}\n\n")
+        manager._registry.add(connection)
+
+    metrics = manager.get_metrics()
+
+    assert metrics["connections"] == 2
+    assert metrics["pending_events"] == 3
+    assert metrics["max_pending_events"] == 2
+    serialized = json.dumps(metrics)
+    assert not any(str(user_id) in serialized for user_id in user_ids)
@@ -0,0 +1,22 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from notifications_service.infrastructure.sse.sse_manager import SSEManager
+
+
+def _event_type(frame: bytes) -> str:
+    data = frame.decode().split("data: ", 1)[1]
+    return json.loads(data)["type"]
+
+
+@pytest.mark.parametrize("last_event_id", [100000000000000000000, -1])
+async def test_connect_with_invalid_last_event_id_forces_resync(last_event_id):
+    manager = SSEManager()
+
+    connection = await manager.connect(uuid4(), last_event_id=last_event_id)
+
+    frames = [await connection.get(), await connection.get()]
+    assert [_event_type(frame) for frame in frames] == ["connected", "resync"]
+    assert manager._registry.count(connection.user_id) == 1